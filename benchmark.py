@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+ポケモン風ゲーム - ベンチマークのエントリーポイント
+"""
+
+import sys
+import os
+
+# srcディレクトリをパスに追加
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.core.benchmark import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""
+ベンチマークモジュール
+単一責任の原則：画面を開かずにゲームエンジンを台本入力で動かし、シーンごとのフレーム時間を計測することのみを担当
+"""
+
+import argparse
+import json
+import os
+import time
+
+import pygame
+
+from src.entities.entities import GameConfig
+from src.managers.battle_manager import GameState
+from src.systems.input_recording import InputRecording
+
+
+class Benchmark:
+    """ダミーの映像ドライバとフレームレート上限なしでGameEngineを動かし、フレーム時間の分位数をシーンごとに集計するクラス"""
+    
+    # 集計する分位数（%）
+    PERCENTILES = (50, 90, 99)
+    # 待機する手順の最大フレーム数
+    MAX_WAIT_FRAMES = 3000
+    # 1フレームの経過時間（ms）。実時間ではなく更新1回分の固定値で進め、毎回同じフレーム数の負荷にする
+    FRAME_DT = 1000 / GameConfig.SIMULATION_RATE
+    # TTFとビットマップフォントの描画時間の比較に使う文字列（会話・バトルのメッセージと同じ種類の文字）
+    TEXT_SAMPLES = (
+        "オーキド: よく きたな! ポケモンの せかいへ ようこそ!",
+        "やせいの ポッポが とびだしてきた!",
+        "ヒトカゲの ひのこ! こうかは ばつぐんだ!",
+        "たたかう  ポケモン  どうぐ  にげる",
+        "HP 20/20  Lv5  PP 25/25",
+    )
+    
+    def __init__(self, seed=0, replay=None):
+        """
+        Args:
+            seed: 乱数のシード（遭遇判定・出現ポケモン・敵の技選択を毎回同じにする）
+            replay: 台本の代わりに再生するInputRecording（Noneの場合は台本入力）
+        """
+        # ウィンドウを開かずに描画する
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+        
+        # 環境変数を設定してから読み込む
+        from src.core.game_engine import GameEngine
+        self.engine = GameEngine()
+        
+        self.replay = replay
+        if replay is not None:
+            self.engine.start_replay(replay)
+        else:
+            self.engine.rng.seed(seed)
+        
+        # シーン名 → フレーム時間（ms）のリスト
+        self.frame_times = {}
+    
+    def get_script(self):
+        """
+        台本入力を取得（道を歩く → 研究所に入って話しかける → 草むらで野生ポケモンと戦う）
+        
+        Returns:
+            list: (押し続けるキー, 押した瞬間のキー, 最大フレーム数, 終了条件)のリスト。
+                  終了条件はTrueを返したら次の手順に進む引数なしの関数（Noneの場合は最大フレーム数まで）
+        """
+        engine = self.engine
+        
+        def in_scene(scene):
+            return lambda: self.get_scene() == scene
+        
+        def battle_state_is(battle_state):
+            return lambda: engine.battle_manager.battle_state == battle_state
+        
+        def dialogue_done():
+            return not engine.dialogue_manager.is_active
+        
+        script = [
+            # 道を南に歩いて町へ
+            ((pygame.K_RIGHT,), (), 8, None),
+            ((pygame.K_DOWN,), (), 220, None),
+            ((pygame.K_LEFT,), (), 20, None),
+            ((pygame.K_DOWN,), (), 80, None),
+            ((pygame.K_RIGHT,), (), 52, None),
+            # 研究所に入る
+            ((pygame.K_UP,), (), 60, in_scene('lab')),
+            # 博士に話しかけて会話を最後まで送る
+            ((pygame.K_UP,), (), 5, None),
+            ((), (pygame.K_z,), 1, None),
+        ]
+        for _ in range(6):
+            script.append(((), (), 90, dialogue_done))
+            script.append(((), (pygame.K_z,), 1, dialogue_done))
+        script += [
+            # 研究所を出て草むらへ戻る
+            ((pygame.K_DOWN,), (), 60, in_scene('town')),
+            ((pygame.K_DOWN,), (), 6, None),
+            ((pygame.K_LEFT,), (), 52, None),
+            ((pygame.K_UP,), (), 80, None),
+            ((pygame.K_RIGHT,), (), 20, None),
+            ((pygame.K_UP,), (), 140, None),
+        ]
+        # 野生ポケモンが出るまで草むらを往復
+        for _ in range(100):
+            script.append(((pygame.K_UP,), (), 48, in_scene('battle')))
+            script.append(((pygame.K_DOWN,), (), 48, in_scene('battle')))
+        script += [
+            # 「たたかう」→「ひのこ」
+            ((), (), self.MAX_WAIT_FRAMES, battle_state_is(GameState.BATTLE_COMMAND)),
+            ((), (pygame.K_RETURN,), 1, None),
+            ((), (pygame.K_RETURN,), 1, None),
+            # 相手の番が終わったら「にげる」
+            ((), (), self.MAX_WAIT_FRAMES, battle_state_is(GameState.BATTLE_COMMAND)),
+            ((), (pygame.K_DOWN,), 1, None),
+            ((), (pygame.K_RIGHT,), 1, None),
+            ((), (pygame.K_RETURN,), 1, None),
+            ((), (), self.MAX_WAIT_FRAMES, lambda: self.get_scene() != 'battle'),
+            ((), (), 60, None),
+        ]
+        return script
+    
+    def get_scene(self):
+        """現在のシーン名を取得（バトル中は'battle'、フィールドではマップ名かリージョン名）"""
+        engine = self.engine
+        if engine.battle_manager.state == GameState.BATTLE:
+            return 'battle'
+        if engine.map_transition_manager.is_single_map() and engine.map_transition_manager.single_map:
+            return engine.map_transition_manager.single_map.map_name
+        return engine.tmx_map.current_region
+    
+    def run(self):
+        """台本（または入力記録）を最後まで再生してフレーム時間を記録"""
+        if self.replay is not None:
+            while self.engine.running:
+                self._run_frame()
+            return
+        
+        for held_keys, pressed_keys, max_frames, until in self.get_script():
+            for _ in range(max_frames):
+                if until is not None and until():
+                    break
+                if not self.engine.running:
+                    return
+                self._run_frame(held_keys, pressed_keys)
+                # 押した瞬間のキーは最初のフレームだけ
+                pressed_keys = ()
+    
+    def _run_frame(self, held_keys=None, pressed_keys=()):
+        """入力を与えて1フレーム進め、かかった時間をシーンごとに記録（held_keysがNoneの場合は入力記録を再生）"""
+        if held_keys is not None:
+            events = [pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode='') for key in pressed_keys]
+            self.engine.input_manager.set_frame_input(events, held_keys)
+        
+        scene = self.get_scene()
+        start = time.perf_counter()
+        self.engine.run_frame(self.FRAME_DT)
+        elapsed = (time.perf_counter() - start) * 1000
+        
+        self.frame_times.setdefault(scene, []).append(elapsed)
+    
+    def compare_text_rendering(self, iterations=200):
+        """
+        UIのフォントごとに、文字列を画面へ描画する時間をTTFとビットマップフォントで比較（テキストのキャッシュは使わない）
+        
+        Args:
+            iterations: 各文字列を描画する回数
+        
+        Returns:
+            dict: '(サイズ)_(太さ)' → {'ttf': TTFで描画して転送, 'bitmap': ビットマップフォントで描画して転送,
+                  'draw': ビットマップフォントで画面に直接描画} の1回の平均（ms）
+        """
+        font_manager = self.engine.font_manager
+        screen = self.engine.screen
+        color = (0, 0, 0)
+        report = {}
+        for size, font_weight in GameConfig.UI_FONTS:
+            ttf_font = font_manager.get_ttf_font(size, font_weight)
+            bitmap_font = font_manager.get_bitmap_font(size, font_weight)
+            methods = {
+                'ttf': lambda text: screen.blit(ttf_font.render(text, True, color), (0, 0)),
+                'bitmap': lambda text: screen.blit(bitmap_font.render(text, True, color), (0, 0)),
+                'draw': lambda text: bitmap_font.draw(screen, text, (0, 0), color)
+            }
+            stats = {}
+            for name, method in methods.items():
+                # アトラスへの文字の追加は計測に含めない
+                for text in self.TEXT_SAMPLES:
+                    method(text)
+                start = time.perf_counter()
+                for _ in range(iterations):
+                    for text in self.TEXT_SAMPLES:
+                        method(text)
+                elapsed = (time.perf_counter() - start) * 1000
+                stats[name] = elapsed / (iterations * len(self.TEXT_SAMPLES))
+            report[f'{size}_{font_weight}'] = stats
+        return report
+    
+    def format_text_report(self, report):
+        """文字列の描画時間の比較（ms）を表形式の文字列に変換"""
+        columns = ('ttf', 'bitmap', 'draw')
+        lines = ['font      ' + ''.join(f'{column:>9}' for column in columns)]
+        for name, stats in report.items():
+            lines.append(f'{name:<10}' + ''.join(f'{stats[column]:>9.4f}' for column in columns))
+        return '\n'.join(lines)
+    
+    def get_report(self):
+        """シーンごとのフレーム数・平均・分位数・最大値（ms）を取得"""
+        report = {}
+        for scene, times in self.frame_times.items():
+            ordered = sorted(times)
+            stats = {
+                'frames': len(ordered),
+                'mean': sum(ordered) / len(ordered),
+                'max': ordered[-1]
+            }
+            for percentile in self.PERCENTILES:
+                stats[f'p{percentile}'] = self._get_percentile(ordered, percentile)
+            report[scene] = stats
+        return report
+    
+    def _get_percentile(self, ordered, percentile):
+        """昇順に並んだ値の分位数を取得（最近傍順位法）"""
+        rank = max(1, -(-len(ordered) * percentile // 100))
+        return ordered[rank - 1]
+    
+    def format_report(self, report):
+        """レポートを表形式の文字列に変換"""
+        columns = ['frames', 'mean'] + [f'p{percentile}' for percentile in self.PERCENTILES] + ['max']
+        lines = ['scene     ' + ''.join(f'{column:>9}' for column in columns)]
+        for scene, stats in report.items():
+            values = ''.join(
+                f'{stats[column]:>9}' if column == 'frames' else f'{stats[column]:>9.3f}'
+                for column in columns
+            )
+            lines.append(f'{scene:<10}{values}')
+        return '\n'.join(lines)
+    
+    def shutdown(self):
+        """エンジンを終了（ワーカーの停止と共有アトラスの参照の返却）"""
+        self.engine.shutdown()
+
+
+def main():
+    """ベンチマークのエントリーポイント"""
+    parser = argparse.ArgumentParser(description="ヘッドレスでゲームを台本入力で動かし、シーンごとのフレーム時間を計測する")
+    parser.add_argument('--seed', type=int, default=0, help="乱数のシード")
+    parser.add_argument('--json', help="レポートをJSONで保存するパス")
+    parser.add_argument('--replay', help="台本の代わりに再生する入力記録のパス（main.py --recordで作成）")
+    parser.add_argument('--bitmap-font', action='store_true', help="TTFの代わりにビットマップフォントで描画する")
+    parser.add_argument('--text', action='store_true', help="台本を動かさず、TTFとビットマップフォントの文字列の描画時間を比較する")
+    args = parser.parse_args()
+    
+    if args.bitmap_font:
+        GameConfig.BITMAP_FONT_ENABLED = True
+    
+    if args.text:
+        benchmark = Benchmark(seed=args.seed)
+        try:
+            report = benchmark.compare_text_rendering()
+        finally:
+            benchmark.shutdown()
+        print(benchmark.format_text_report(report))
+        if args.json:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+        pygame.quit()
+        return
+    
+    replay = InputRecording.load(args.replay) if args.replay else None
+    benchmark = Benchmark(seed=args.seed, replay=replay)
+    try:
+        benchmark.run()
+    finally:
+        benchmark.shutdown()
+    
+    report = benchmark.get_report()
+    print(benchmark.format_report(report))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+    
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,27 @@
 import pygame
 import sys
 import random
+import argparse
 
 # モジュールのインポート
 from src.entities.entities import GameConfig, Player, WildPokemon, NPC
 from src.managers.font_manager import FontManager
 from src.managers.resource_manager import ResourceManager
 from src.managers.battle_manager import BattleManager, GameState
-from src.systems.ui_renderer import FieldRenderer, BattleRenderer
+from src.systems.ui_renderer import FieldRenderer, BattleRenderer, ProfilerRenderer
 from src.managers.input_manager import InputManager
 from src.systems.animation_system import AnimationSystem
-from src.systems.map_system import TiledMap, SingleMap
+from src.systems.map_system import SingleMap
+from src.systems.world_map import WorldMap
 from src.managers.map_transition_manager import MapTransitionManager
 from src.systems.player_movement import PlayerMovement
 from src.managers.game_state_manager import GameStateManager
 from src.systems.dialogue_system import DialogueManager
+from src.systems.dirty_rect_tracker import DirtyRectTracker
+from src.systems.npc_spatial_hash import NpcSpatialHash
+from src.systems.frame_profiler import FrameProfiler
+from src.systems.game_clock import GameClock
+from src.systems.input_recording import InputRecording
 
 class GameEngine:
     """ゲームエンジンクラス - ゲーム全体の制御を担当"""
@@ -26,10 +33,20 @@ class GameEngine:
         pygame.display.set_caption("ポケモン風ゲーム")
         self.clock = pygame.time.Clock()
         
+        # ゲームロジックは固定の時間刻み（ms）で進め、描画のフレームレートに依存させない
+        self.simulation_step = 1000 / GameConfig.SIMULATION_RATE
+        # まだ更新に使っていない経過時間（ms）
+        self.accumulator = 0
+        GameClock.use_simulated_time()
+        
+        # 遭遇判定・出現ポケモン・敵の技選択に使う乱数（記録・リプレイ時はシードを固定）
+        self.rng = random.Random()
+        
         # 管理クラスの初期化
         self.font_manager = FontManager()
-        self.resource_manager = ResourceManager()
-        self.battle_manager = BattleManager()
+        self.font_manager.preload(GameConfig.UI_FONTS)
+        self.resource_manager = ResourceManager(rle_accel=GameConfig.IMAGE_RLE_ACCEL)
+        self.battle_manager = BattleManager(self.rng)
         self.input_manager = InputManager()
         self.animation_system = AnimationSystem()
         self.dialogue_manager = DialogueManager(self.resource_manager, self.font_manager)
@@ -37,15 +54,21 @@ class GameEngine:
         # レンダラーの初期化
         self.field_renderer = FieldRenderer(self.screen, self.font_manager, self.resource_manager)
         self.battle_renderer = BattleRenderer(self.screen, self.font_manager, self.resource_manager)
+        self.dirty_rect_tracker = DirtyRectTracker(self.screen.get_rect())
+        self.profiler_renderer = ProfilerRenderer(self.screen, self.font_manager, self.resource_manager)
+        
+        # 処理区間ごとの所要時間（Pキーでオーバーレイ表示）
+        self.profiler = FrameProfiler()
+        self.show_profiler = False
         
         # ゲームオブジェクトの初期化
         self.player = Player(self.resource_manager)
-        self.tmx_map = TiledMap()  # 結合マップを初期化
+        self.tmx_map = WorldMap()  # ワールドマップを初期化（リージョン単位で読み込み）
         
         # 責任分離されたマネージャークラス
         self.map_transition_manager = MapTransitionManager()
         self.player_movement = PlayerMovement(self.player)
-        self.game_state_manager = GameStateManager()
+        self.game_state_manager = GameStateManager(self.rng)
         
         # ゲーム状態
         self.running = True
@@ -67,27 +90,27 @@ class GameEngine:
 
     def _initialize_npcs(self):
         """各マップのNPCを初期化"""
-        # labマップのNPC
-        self.npcs["lab"] = []
+        # labマップのNPC（マップごとの空間ハッシュで管理）
+        self.npcs["lab"] = NpcSpatialHash()
         
         # okdを配置（位置は16x16のタイル座標 * スケール）
         okd_x = 5 * GameConfig.TILE_SIZE * GameConfig.SCALE
         okd_y = 8 * GameConfig.TILE_SIZE * GameConfig.SCALE
         okd = NPC(self.resource_manager, "okd", okd_x, okd_y, GameConfig.OKD_IMG)
-        self.npcs["lab"].append(okd)
+        self.npcs["lab"].add(okd)
         
         # rivalを配置
         rival_x = 4 * GameConfig.TILE_SIZE * GameConfig.SCALE
         rival_y = 3 * GameConfig.TILE_SIZE * GameConfig.SCALE
         rival = NPC(self.resource_manager, "rival", rival_x, rival_y, GameConfig.RIVAL_IMG)
-        self.npcs["lab"].append(rival)
+        self.npcs["lab"].add(rival)
         
         # roadエリアのNPC
-        self.npcs["road"] = []
+        self.npcs["road"] = NpcSpatialHash()
 
     def handle_events(self):
         """イベント処理"""
-        for event in pygame.event.get():
+        for event in self.input_manager.get_events():
             if event.type == pygame.QUIT:
                 self.running = False
                 return
@@ -97,6 +120,10 @@ class GameEngine:
                 current_map = self.map_transition_manager.get_current_map(self.tmx_map)
                 current_map.toggle_debug_mode()
             
+            # プロファイラのオーバーレイ切り替え（Pキー）
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_p:
+                self.show_profiler = not self.show_profiler
+            
             # 会話システムの入力処理
             if self.dialogue_manager.handle_input(event):
                 return
@@ -113,19 +140,21 @@ class GameEngine:
     def update_field(self):
         """フィールド状態の更新"""
         if self.battle_manager.state == GameState.FIELD:
+            # 遷移先の読み込みを待っている間はその場で待ち、読み込みが終わったら遷移
+            if self.map_transition_manager.is_transition_pending():
+                entered_map = self.map_transition_manager.update_pending_transition(self.player)
+                if entered_map:
+                    self._on_map_entered(entered_map)
+                return
+            
             # 現在のマップを取得
             current_map = self.map_transition_manager.get_current_map(self.tmx_map)
             
             # プレイヤー移動処理
-            keys = pygame.key.get_pressed()
+            keys = self.input_manager.get_pressed()
             
-            # 現在のマップに応じてNPCリストを取得
-            current_npcs = []
-            if self.map_transition_manager.is_single_map() and self.map_transition_manager.single_map:
-                current_npcs = self.npcs.get("lab", [])
-            else:
-                # 結合マップの場合はroadエリアのNPCを取得
-                current_npcs = self.npcs.get("road", [])
+            # 現在のマップに応じてNPCを取得
+            current_npcs = self._get_current_npcs()
             
             player_moved = self.player_movement.handle_input(keys, current_map, current_npcs)
             
@@ -133,17 +162,16 @@ class GameEngine:
                 # マップ遷移チェック
                 player_center_x, player_center_y = self.player.get_center_position()
                 
+                # 遷移トリガーが近ければ遷移先マップを先読み
+                self.map_transition_manager.update_prefetch(self.tmx_map, player_center_x, player_center_y)
+                
                 transition_target = self.map_transition_manager.check_transition_trigger(
                     self.tmx_map, player_center_x, player_center_y
                 )
                 
                 if transition_target:
-                    self.map_transition_manager.transition_to_map(transition_target, self.player)
-                    
-                    # ラボに遷移した場合、has_visited_labフラグを設定
-                    if transition_target == "lab":
-                        self.player.has_visited_lab = True
-                    
+                    if self.map_transition_manager.transition_to_map(transition_target, self.player):
+                        self._on_map_entered(transition_target)
                     return
                 
                 # ゲーム状態更新（エンカウントチェック含む）
@@ -158,14 +186,10 @@ class GameEngine:
         """NPCとの相互作用をチェック"""
         player_center_x, player_center_y = self.player.get_center_position()
         
-        # 現在のマップでNPCをチェック
-        if self.map_transition_manager.is_single_map() and self.map_transition_manager.single_map:
-            current_npcs = self.npcs.get("lab", [])
-        else:
-            # 結合マップの場合はroadエリアのNPCをチェック
-            current_npcs = self.npcs.get("road", [])
+        # 現在のマップでプレイヤーの周りのバケットにいるNPCだけをチェック
+        current_npcs = self._get_current_npcs()
         
-        for npc in current_npcs:
+        for npc in current_npcs.query_near(player_center_x, player_center_y, NPC.INTERACTION_RANGE):
             if npc.is_near_player(player_center_x, player_center_y):
                 # NPCをプレイヤーの方向に向ける
                 npc.face_player(player_center_x, player_center_y)
@@ -178,21 +202,24 @@ class GameEngine:
     
     def _update_npc_animations(self, dt):
         """NPCのアニメーションを更新"""
-        # 現在のマップのNPCを更新
-        if self.map_transition_manager.is_single_map() and self.map_transition_manager.single_map:
-            current_npcs = self.npcs.get("lab", [])
-        else:
-            # 結合マップの場合はroadエリアのNPCを更新
-            current_npcs = self.npcs.get("road", [])
+        # 画面付近のNPCと移動中のNPCだけを更新
+        current_map = self.map_transition_manager.get_current_map(self.tmx_map)
+        offset_x, offset_y = self.field_renderer.get_camera_offset(self.player, current_map)
         
-        for npc in current_npcs:
+        for npc in self._get_current_npcs().get_active(*self._get_npc_view_rect(offset_x, offset_y)):
             npc.update_move_animation(dt)
             npc.update_animation(dt)
     
     
+    def _on_map_entered(self, map_name):
+        """マップに遷移した後の処理"""
+        # ラボに遷移した場合、has_visited_labフラグを設定
+        if map_name == "lab":
+            self.player.has_visited_lab = True
+    
     def _start_battle(self):
         """バトル開始処理"""
-        wild_pokemon = WildPokemon(self.resource_manager)
+        wild_pokemon = WildPokemon(self.resource_manager, self.rng)
         self.battle_manager.start_battle(wild_pokemon)
         
         # 野生ポケモンをスプライトグループに追加
@@ -221,52 +248,124 @@ class GameEngine:
 
     def render(self):
         """画面描画処理"""
+        profiler = self.profiler
+        if GameConfig.DIRTY_RECT_RENDERING:
+            profiler.measure('render.dirty_rects', self._collect_dirty_rects)
+            # 何も変化していなければ描画も画面転送も省略
+            if not self.dirty_rect_tracker.has_changes():
+                return
+            self.screen.set_clip(self.dirty_rect_tracker.get_bounds())
+        
         self.screen.fill(GameConfig.SKY_BLUE)  # 空色の背景
         
         if self.battle_manager.state == GameState.FIELD:
-            self._render_field()
+            profiler.measure('render.field', self._render_field)
         elif self.battle_manager.state == GameState.BATTLE:
-            self._render_battle()
+            profiler.measure('render.battle', self._render_battle)
         
         # デバッグ情報の描画（特定のキーが押されたときのみ）
         if self.input_manager.check_debug_keys():
-            self._draw_debug_info()
+            profiler.measure('render.debug', self._draw_debug_info)
         
-        pygame.display.flip()
+        # プロファイラのオーバーレイ（前フレームまでの統計）
+        if self.show_profiler:
+            profiler.measure('render.profiler', self.profiler_renderer.draw_profiler, profiler)
+        
+        profiler.measure('render.present', self._present)
+    
+    def _present(self):
+        """描画結果を画面に転送"""
+        if GameConfig.DIRTY_RECT_RENDERING:
+            self.screen.set_clip(None)
+            pygame.display.update(self.dirty_rect_tracker.get_rects())
+            self.dirty_rect_tracker.reset()
+        else:
+            pygame.display.flip()
+    
+    def _collect_dirty_rects(self):
+        """前フレームから変化した画面領域を記録"""
+        tracker = self.dirty_rect_tracker
+        current_map = self.map_transition_manager.get_current_map(self.tmx_map)
+        
+        # 画面の切り替えやデバッグ表示中は全画面を更新
+        tracker.track_value('scene', (self.battle_manager.state, id(current_map)))
+        if self.input_manager.check_debug_keys() or current_map.debug_mode or self.show_profiler:
+            tracker.mark_full()
+        tracker.track_value('debug', (self.input_manager.check_debug_keys(), current_map.debug_mode, self.show_profiler))
+        
+        if self.battle_manager.state == GameState.BATTLE:
+            self.battle_renderer.collect_dirty_rects(
+                tracker, self.player, self.battle_manager.wild_pokemon, self.battle_manager
+            )
+            return
+        
+        # カメラが動いた場合や、先読みしたリージョンが映るようになった場合は全画面を更新
+        offset_x, offset_y = self.field_renderer.get_camera_offset(self.player, current_map)
+        tracker.track_value('camera', (offset_x, offset_y, current_map.get_render_state(offset_x, offset_y)))
+        
+        # 表示フレームが変わるアニメーションタイル
+        for rect in current_map.get_animated_tile_rects(offset_x, offset_y):
+            tracker.add(rect)
+        
+        # プレイヤーとNPC（位置と表示フレームが変わった場合のみ）
+        player_center_x, player_center_y = self.player.get_center_position()
+        player_rect = (self.player.x + offset_x, self.player.y + offset_y, self.player.width, self.player.height)
+        tracker.track('player', player_rect, (
+            self.player.direction, self.player.animation_frame,
+            current_map.is_on_grassy(player_center_x, player_center_y)
+        ))
+        
+        for npc in self._get_visible_npcs(offset_x, offset_y):
+            npc_rect = (npc.x + offset_x, npc.y + offset_y, npc.width, npc.height)
+            tracker.track(('npc', id(npc)), npc_rect, (npc.direction, npc.animation_frame, npc.visible))
+        
+        # 会話ウィンドウ（文字送り中はテキスト領域が変化）
+        dialogue_rect = self.dialogue_manager.get_message_rect() if self.dialogue_manager.is_active else None
+        tracker.track('dialogue', dialogue_rect, self.dialogue_manager.get_display_state())
+    
+    def _get_current_npcs(self):
+        """現在のマップのNPCの空間ハッシュを取得（NPCのいないマップは空のハッシュを作成）"""
+        if self.map_transition_manager.is_single_map() and self.map_transition_manager.single_map:
+            map_name = self.map_transition_manager.single_map.map_name
+        else:
+            # 結合マップの場合はroadエリアのNPC
+            map_name = "road"
+        
+        if map_name not in self.npcs:
+            self.npcs[map_name] = NpcSpatialHash()
+        return self.npcs[map_name]
+    
+    def _get_npc_view_rect(self, offset_x, offset_y):
+        """画面に映るマップ上の範囲を1タイル広げた矩形（画面端をまたぐNPCも含めるため）"""
+        margin = GameConfig.TILE_SIZE * GameConfig.SCALE
+        return (-offset_x - margin, -offset_y - margin,
+                GameConfig.WIDTH + margin * 2, GameConfig.HEIGHT + margin * 2)
+    
+    def _get_visible_npcs(self, offset_x, offset_y):
+        """画面付近のバケットにいるNPCを取得"""
+        return self._get_current_npcs().query_rect(*self._get_npc_view_rect(offset_x, offset_y))
     
     def _render_field(self):
         """フィールド画面の描画"""
         # 現在のマップを取得
         current_map = self.map_transition_manager.get_current_map(self.tmx_map)
         
-        # 背景マップを描画し、オフセットを取得
-        map_offset_x, map_offset_y = self.field_renderer.draw_field(self.player, current_map)
-        
         # プレイヤーの位置を確認
         player_center_x, player_center_y = self.player.get_center_position()
         is_on_grass = current_map.is_on_grassy(player_center_x, player_center_y)
         
         if is_on_grass:
-            # 草むらにいる場合：プレイヤーの下半身のみ描画
+            # 草むらにいる場合：地面 → プレイヤーの下半身 → 草むら・障害物の順に描画
+            map_offset_x, map_offset_y = self.field_renderer.draw_field(self.player, current_map)
             self.player.draw_lower_only(self.screen, map_offset_x, map_offset_y)
-        
-        # 草むら上部レイヤーを描画（top）
-        current_map.draw_grassy_top(self.screen, map_offset_x, map_offset_y)
-        
-        # 草むら下部レイヤーを描画（bottom）
-        current_map.draw_grassy_bottom(self.screen, map_offset_x, map_offset_y)
-        # 前景レイヤー（rock等）を描画
-        current_map.draw_foreground(self.screen, map_offset_x, map_offset_y)
-        
-        # NPCを描画
-        if self.map_transition_manager.is_single_map() and self.map_transition_manager.single_map:
-            # 単体マップの場合、マップ名から決定
-            if hasattr(self.map_transition_manager.single_map, 'tmx_data'):
-                # labマップの場合はNPCを描画
-                current_map.draw_npcs(self.screen, self.npcs["lab"], map_offset_x, map_offset_y)
+            current_map.draw_overlay(self.screen, map_offset_x, map_offset_y)
         else:
-            # 結合マップの場合はroadエリアのNPCを描画
-            current_map.draw_npcs(self.screen, self.npcs["road"], map_offset_x, map_offset_y)
+            # 草むらにいない場合：地面と草むら・障害物を合成済みの1枚で描画
+            map_offset_x, map_offset_y = self.field_renderer.draw_field_composited(self.player, current_map)
+        
+        # 画面付近のNPCだけを描画
+        visible_npcs = self._get_visible_npcs(map_offset_x, map_offset_y)
+        current_map.draw_npcs(self.screen, visible_npcs, map_offset_x, map_offset_y)
         
         if is_on_grass:
             # 草むらにいる場合：プレイヤーの上部スプライトを最上位に描画
@@ -298,40 +397,150 @@ class GameEngine:
         
         # 座標情報
         pos_text = f"座標: ({int(player_pos_x)}, {int(player_pos_y)})"
-        text_surface = font.render(pos_text, True, GameConfig.WHITE)
+        text_surface = self.font_manager.render_text(font, pos_text, True, GameConfig.WHITE)
         self.screen.blit(text_surface, (10, y_offset))
 
+    def start_recording(self, seed=None):
+        """
+        入力の記録を始める（起動直後に呼ぶ）
+        
+        Args:
+            seed: 乱数のシード（Noneの場合はランダムに決める）
+        
+        Returns:
+            InputRecording: 記録先（終了後にsaveで保存する）
+        """
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        recording = InputRecording(seed)
+        self.rng.seed(seed)
+        self._use_synchronous_loading()
+        self.input_manager.start_recording(recording)
+        return recording
+    
+    def start_replay(self, recording):
+        """記録した入力の再生を始める（起動直後に呼ぶ。最後まで再生すると終了する）"""
+        self.rng.seed(recording.seed)
+        self._use_synchronous_loading()
+        self.input_manager.start_replay(recording)
+    
+    def _use_synchronous_loading(self):
+        """マップとリージョンをその場で読み込む（ワーカーの読み込み時間で遷移のフレームや当たり判定が変わらないよう、記録と再生の両方で使う）"""
+        self.map_transition_manager.synchronous_loading = True
+        self.tmx_map.synchronous_loading = True
+    
+    def shutdown(self):
+        """先読み用のワーカーを停止し、NPCとプレイヤーが持つ共有アトラスの参照を返す"""
+        self.map_transition_manager.shutdown()
+        self.tmx_map.shutdown()
+        
+        for npc_hash in self.npcs.values():
+            for npc in list(npc_hash):
+                npc_hash.remove(npc)
+                npc.release_sprite_atlas()
+        self.npcs.clear()
+        self.player.release_sprite_atlas()
+    
     def run(self):
         """メインゲームループ"""
         while self.running:
-            # イベント処理
-            self.handle_events()
-            
-            # ゲーム状態更新
-            self.update_field()
-            self.update_battle()
-            
-            # アニメーション更新
-            dt = self.clock.get_time()
-            self.animation_system.update(dt)
-            self.dialogue_manager.update(dt)
-            
-            # NPCアニメーション更新
-            self._update_npc_animations(dt)
-            
-            # プレイヤーアニメーション更新
-            self.player.update_animation(dt)
-            
-            # 描画
-            self.render()
+            self.run_frame()
             
             # フレームレート制御
             self.clock.tick(GameConfig.FPS)
+    
+    def run_frame(self, dt=None):
+        """
+        1フレーム分のイベント処理・更新・描画を行う（フレームレート制御は呼び出し側）
+        
+        経過時間を溜めて固定の時間刻みでupdateを必要な回数だけ呼ぶ。描画が遅れたフレームでは
+        複数回更新して追いつき、更新しなかったフレームでは描画を省略する
+        
+        Args:
+            dt: このフレームの経過時間（ms）。Noneの場合は時計から取得
+        """
+        profiler = self.profiler
+        profiler.begin_frame()
+        
+        # このフレームの入力と経過時間を確定（リプレイ中は記録した値を使う）
+        if dt is None:
+            dt = self.clock.get_time()
+        dt = self.input_manager.begin_frame(dt)
+        
+        # イベント処理
+        profiler.measure('events', self.handle_events)
+        
+        # 溜まった経過時間の分だけ固定の時間刻みでゲームを進める
+        self.accumulator += dt
+        steps = 0
+        while self.accumulator >= self.simulation_step and steps < GameConfig.MAX_SIMULATION_STEPS:
+            self.update(self.simulation_step)
+            self.accumulator -= self.simulation_step
+            steps += 1
+        
+        # 上限まで更新しても追いつけない遅れは切り捨てる（処理落ちで更新が積み重ならないように）
+        if steps == GameConfig.MAX_SIMULATION_STEPS:
+            self.accumulator = min(self.accumulator, self.simulation_step)
+        
+        # 描画（各描画パスは個別に計測。状態が変わっていなければ省略）
+        if steps:
+            self.render()
+        
+        # テキストキャッシュの統計
+        text_stats = self.font_manager.text_cache.get_stats()
+        profiler.set_counter('text_cache.hits', text_stats['hits'])
+        profiler.set_counter('text_cache.misses', text_stats['misses'])
+        profiler.set_counter('text_cache.kb', text_stats['memory_usage'] // 1024)
+        
+        profiler.end_frame()
+    
+    def update(self, dt):
+        """
+        ゲームを固定の時間刻み1回分進める
+        
+        Args:
+            dt: 時間刻み（ms）
+        """
+        profiler = self.profiler
+        GameClock.advance(dt)
+        
+        # ゲーム状態更新
+        profiler.measure('update_field', self.update_field)
+        profiler.measure('update_battle', self.update_battle)
+        
+        # アニメーション更新
+        profiler.measure('animation', self.animation_system.update, dt)
+        profiler.measure('dialogue', self.dialogue_manager.update, dt)
+        
+        # NPCアニメーション更新
+        profiler.measure('npc_animation', self._update_npc_animations, dt)
+        
+        # マップのタイルアニメーション更新
+        current_map = self.map_transition_manager.get_current_map(self.tmx_map)
+        profiler.measure('tile_animation', current_map.update_tile_animations, dt)
+        
+        # プレイヤーアニメーション更新
+        self.player.update_animation(dt)
 
 def main():
     """メイン関数"""
+    parser = argparse.ArgumentParser(description="ポケモン風ゲーム")
+    parser.add_argument('--record', metavar='PATH', help="入力を記録して終了時に保存するパス")
+    parser.add_argument('--replay', metavar='PATH', help="記録した入力を再生するパス")
+    args = parser.parse_args()
+    
     game_engine = GameEngine()
+    recording = None
+    if args.replay:
+        game_engine.start_replay(InputRecording.load(args.replay))
+    elif args.record:
+        recording = game_engine.start_recording()
+    
     game_engine.run()
+    game_engine.shutdown()
+    
+    if recording is not None:
+        recording.save(args.record)
     
     pygame.quit()
     sys.exit()
@@ -1,6 +1,8 @@
 import pygame
 import random
 from src.managers.resource_manager import ResourceManager
+from src.systems.game_clock import GameClock
+from src.managers.sprite_atlas_registry import SpriteAtlasRegistry
 
 class GameConfig:
     """ゲーム全体の設定を管理するクラス"""
@@ -10,7 +12,11 @@ class GameConfig:
     BASE_HEIGHT = 144
     WIDTH = BASE_WIDTH * SCALE       # 画面幅
     HEIGHT = BASE_HEIGHT * SCALE     # 画面高さ
-    FPS = 60                         # フレームレート
+    FPS = 60                         # 描画のフレームレート（上限）
+    SIMULATION_RATE = 60             # ゲームロジックの更新回数（回/秒）。描画のフレームレートとは独立
+    MAX_SIMULATION_STEPS = 5         # 1フレームで追いつく更新回数の上限（超えた分の遅れは切り捨てる）
+    DIRTY_RECT_RENDERING = False     # 変化した領域のみ画面転送する（変化がなければ描画を省略）
+    PROFILER_HISTORY = 120           # フレームプロファイラが統計に使う直近のフレーム数
     
     # 色定義
     BLACK = (0, 0, 0)
@@ -45,6 +51,17 @@ class GameConfig:
     MESSAGE_HALF_MIDDLE_IMG = IMG_DIR + "message_half_middle.png"
     MESSAGE_HALF_SEPARATE_IMG = IMG_DIR + "message_half_separate.png"
     
+    # UI枠の9分割の境界（元画像の左・上・右・下の枠の幅px）。角と辺はSCALE倍に固定し、残りを伸ばす
+    UI_FRAME_INSETS = {
+        HP_BAR_IMG: (1, 1, 1, 1),
+        ENEMY_FRAME_IMG: (2, 0, 8, 4),
+        MY_FRAME_IMG: (8, 0, 2, 4),
+        MESSAGE_ALL_IMG: (8, 8, 8, 8),
+        MESSAGE_HALF_IMG: (8, 8, 8, 8),
+        MESSAGE_HALF_MIDDLE_IMG: (8, 8, 8, 8),
+        MESSAGE_HALF_SEPARATE_IMG: (8, 8, 8, 8)
+    }
+    
     # キャラクター画像
     PLAYER_SPRITE_IMG = IMG_DIR + "pokemon_player_red_sprite.png"
     HITOKAGE_IMG = IMG_DIR + "hitokage.png"
@@ -63,6 +80,8 @@ class GameConfig:
         "イーブイ": IMG_DIR + "eevee.png",
         "ヒトカゲ": IMG_DIR + "hitokage.png"
     }
+    # カラーキー画像にRLEACCELを使うか（描画は速くなるが、毎フレームの拡大縮小は遅くなる）
+    IMAGE_RLE_ACCEL = False
     
     # マップファイル
     MAP_FILES = {
@@ -80,11 +99,52 @@ class GameConfig:
         "town": (20, 18),
         "lab": (10, 12)
     }
+    # 各マップの遷移トリガー（タイル座標: 遷移先）
+    MAP_TRIGGERS = {
+        "town": {(12, 11): "lab"},
+        "lab": {(4, 11): "return_to_previous", (5, 11): "return_to_previous"}
+    }
+    # ワールド定義：地続きで表示するマップの配置（ワールド上の左上タイル座標）
+    # 配置が接しているマップ同士が隣接リージョンになる。ここにないマップは遷移トリガーで入る単体マップ
+    WORLD_LAYOUT = {
+        "road": (0, 0),
+        "town": (0, 36)
+    }
     MAP_WIDTH = 20                  # デフォルトマップの横タイル数
     MAP_HEIGHT = 54                 # 結合後の総縦タイル数（36 + 18）
     
     # タイル当たり判定設定
     WALKABLE_TILE_IDS = [3, 6]         # 歩行可能なタイルIDのリスト
+    
+    # マップ描画設定
+    CHUNKED_RENDERING = True        # 画面内のチャンクのみ描画するか
+    MAP_CHUNK_TILES = 8             # 1チャンクの辺のタイル数
+    MAP_CACHE_ENABLED = True        # ベイク済みマップのディスクキャッシュを使うか
+    MAP_CACHE_DIR = ".cache/maps"   # ベイク済みマップの保存先
+    MAP_POOL_MAX_MAPS = 4           # 再利用のため保持する単体マップの最大数
+    MAP_POOL_MEMORY_BUDGET = 64 * 1024 * 1024  # 保持する単体マップの合計メモリ上限（バイト）
+    MAP_PREFETCH_ENABLED = True     # 遷移先マップをバックグラウンドで先読みするか
+    MAP_PREFETCH_DISTANCE = 3       # 先読みを開始する遷移トリガーまでのタイル数
+    WORLD_MAX_RESIDENT_REGIONS = 4  # ワールドで同時に保持するリージョン（マップ）の最大数（現在とつながったリージョンは超えても保持）
+    WORLD_REGION_MEMORY_BUDGET = 64 * 1024 * 1024  # 保持するリージョンの合計メモリ上限（バイト）
+    
+    # テキスト描画設定
+    TEXT_CACHE_MEMORY_BUDGET = 4 * 1024 * 1024  # 描画済みテキストのキャッシュの合計メモリ上限（バイト）
+    LINE_LAYOUT_CACHE_SIZE = 128    # 保持するテキストの折り返し結果の最大数
+    FONT_CACHE_ENABLED = True       # 見つけたフォントのパスをディスクにキャッシュするか
+    FONT_CACHE_PATH = ".cache/fonts.json"  # フォントのパスの保存先
+    # 起動時に読み込むUIのフォント: (サイズ, 太さ)
+    UI_FONTS = ((10, 'W5'), (12, 'W8'), (14, 'W5'), (15, 'W5'), (16, 'W5'))
+    BITMAP_FONT_ENABLED = False     # get_fontでTTFの代わりにビットマップフォント（文字のアトラス）を使うか
+    BITMAP_FONT_SCALE = 1           # ビットマップフォントの拡大率（2以上で小さく描画した文字をドット絵のように拡大）
+    BITMAP_FONT_ANTIALIAS = True    # ビットマップフォントの文字をアンチエイリアスで描画するか
+    # ビットマップフォントで起動時にアトラスへ描画する文字（英数字・記号・ひらがな・カタカナ。漢字は使うときに追加）
+    BITMAP_FONT_GLYPHS = (
+        ''.join(chr(code) for code in range(0x20, 0x7F))
+        + ''.join(chr(code) for code in range(0x3041, 0x3097))
+        + ''.join(chr(code) for code in range(0x30A1, 0x30FB))
+        + "ー、。！？「」『』（）・…～　"
+    )
 
 class Pokemon:
     """ポケモンクラス - ポケモンの基本情報を管理"""
@@ -105,6 +165,19 @@ class Pokemon:
 class Player(pygame.sprite.Sprite):
     """プレイヤークラス - プレイヤーキャラクターの制御を担当"""
     
+    # スプライトシートでの1フレームのサイズ
+    SPRITE_FRAME_SIZE = (16, 16)
+    # スプライトシートのフレーム配置: (向き, フレーム, 行, 列, 左右反転)
+    SPRITE_LAYOUT = (
+        ("down", 0, 0, 0, False), ("down", 1, 0, 1, False), ("down", 2, 0, 2, False),
+        # 左向きは[1][0]と[1][1]を使用（frame 2は0に戻す）
+        ("left", 0, 1, 0, False), ("left", 1, 1, 1, False), ("left", 2, 1, 0, False),
+        # 右向きは左向きを反転
+        ("right", 0, 1, 0, True), ("right", 1, 1, 1, True), ("right", 2, 1, 0, True),
+        # 上向きは[1][2]と[2][0]を使用
+        ("up", 0, 1, 2, False), ("up", 1, 2, 0, False), ("up", 2, 1, 2, False),
+    )
+    
     def __init__(self, resource_manager: ResourceManager):
         super().__init__()
         self.resource_manager = resource_manager
@@ -151,12 +224,11 @@ class Player(pygame.sprite.Sprite):
         # ラボ訪問フラグ
         self.has_visited_lab = False
         
-        # スプライトシートを読み込む
-        self.sprite_sheet = self.resource_manager.load_image(GameConfig.PLAYER_SPRITE_IMG)
-        
-        # スプライトのサイズ（スプライトシートでの1フレームのサイズ）
-        self.sprite_width = 16  # スプライトシートでの1フレームの幅
-        self.sprite_height = 16  # スプライトシートでの1フレームの高さ
+        # 全フレームを表示サイズに加工したアトラス（同じ見た目のキャラクターと共有）
+        self.sprite_atlas = SpriteAtlasRegistry.acquire(
+            self.resource_manager, GameConfig.PLAYER_SPRITE_IMG,
+            self.SPRITE_FRAME_SIZE, (self.width, self.height), self.SPRITE_LAYOUT
+        )
         
         # 初期画像を設定
         self.image = self.get_sprite_frame(self.direction, 0)
@@ -165,54 +237,14 @@ class Player(pygame.sprite.Sprite):
         self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
     
     def get_sprite_frame(self, direction, frame):
-        """指定された方向とフレームのスプライトを切り出す"""
-        # 実際のスプライト位置とフレームのマッピング
-        if direction == "down":
-            row = 0
-            col = frame  # 0, 1, 2
-        elif direction == "left":
-            # 左向きは[1][0]と[1][1]を使用
-            row = 1
-            col = 0 if frame == 0 else 1 if frame == 1 else 0  # frame 2も0に戻す
-        elif direction == "right":
-            # 右向きは左向きを反転
-            row = 1
-            col = 0 if frame == 0 else 1 if frame == 1 else 0  # frame 2も0に戻す
-        elif direction == "up":
-            # 上向きは[1][2]と[2][0]を使用
-            if frame == 0:
-                row = 1
-                col = 2
-            elif frame == 1:
-                row = 2
-                col = 0
-            else:  # frame == 2
-                row = 1
-                col = 2
-        else:
-            row = 0
-            col = frame
-        
-        # スプライトシートから切り出す
-        sprite_rect = pygame.Rect(
-            col * self.sprite_width,
-            row * self.sprite_height,
-            self.sprite_width,
-            self.sprite_height
-        )
-        
-        # 切り出したスプライトを作成
-        sprite = pygame.Surface((self.sprite_width, self.sprite_height), pygame.SRCALPHA)
-        sprite.blit(self.sprite_sheet, (0, 0), sprite_rect)
-        
-        # 右向きの場合は左右反転
-        if direction == "right":
-            sprite = pygame.transform.flip(sprite, True, False)
-        
-        # ゲームのスケールに合わせてリサイズ
-        scaled_sprite = pygame.transform.scale(sprite, (self.width, self.height))
-        
-        return scaled_sprite
+        """指定された方向とフレームのスプライトをアトラスから取得"""
+        return self.sprite_atlas.get_frame(direction, frame)
+    
+    def release_sprite_atlas(self):
+        """共有アトラスの参照を返す（ゲーム終了時に呼ぶ）"""
+        if self.sprite_atlas is not None:
+            SpriteAtlasRegistry.release(self.sprite_atlas)
+            self.sprite_atlas = None
 
     def set_position(self, x, y):
         """プレイヤーの位置を設定"""
@@ -266,7 +298,7 @@ class Player(pygame.sprite.Sprite):
         if dt is not None:
             self.update_move_animation(dt)
         
-        current_time = pygame.time.get_ticks()
+        current_time = GameClock.get_ticks()
         
         # 移動アニメーション中または通常の移動中は歩行アニメーション
         if self.is_moving or self.move_animation['active']:
@@ -323,7 +355,12 @@ class Player(pygame.sprite.Sprite):
 class WildPokemon(pygame.sprite.Sprite):
     """野生ポケモンクラス - 野生ポケモンの生成と管理"""
     
-    def __init__(self, resource_manager: ResourceManager):
+    def __init__(self, resource_manager: ResourceManager, rng=random):
+        """
+        Args:
+            resource_manager: リソース管理
+            rng: 出現するポケモンを選ぶ乱数生成器（リプレイで同じポケモンを出すため差し替え可能）
+        """
         super().__init__()
         self.resource_manager = resource_manager
         
@@ -333,7 +370,7 @@ class WildPokemon(pygame.sprite.Sprite):
             ("ピカチュウ", "でんき", 15, ["でんきショック", "たいあたり"], [12, 5]),
             ("イーブイ", "ノーマル", 17, ["たいあたり", "すなかけ"], [7, 3])
         ]
-        choice = random.choice(pokemon_options)
+        choice = rng.choice(pokemon_options)
         self.pokemon = Pokemon(choice[0], choice[1], choice[2], choice[3], choice[4])
         
         # ポケモンの画像を読み込む
@@ -345,6 +382,18 @@ class WildPokemon(pygame.sprite.Sprite):
 class NPC(pygame.sprite.Sprite):
     """NPCクラス - ノンプレイヤーキャラクターの制御を担当"""
     
+    # 会話できる距離（中心からの縦横のピクセル数）
+    INTERACTION_RANGE = GameConfig.TILE_SIZE * GameConfig.SCALE * 1.5
+    
+    # スプライトシートでの1フレームのサイズ
+    SPRITE_FRAME_SIZE = (16, 16)
+    # スプライトシートのフレーム配置: (向き, フレーム, 行, 列, 左右反転)。行は下・上・左・右の順
+    SPRITE_LAYOUT = tuple(
+        (direction, frame, row, frame, False)
+        for row, direction in enumerate(("down", "up", "left", "right"))
+        for frame in range(3)
+    )
+    
     def __init__(self, resource_manager: ResourceManager, npc_id, x, y, sprite_img):
         super().__init__()
         self.resource_manager = resource_manager
@@ -376,12 +425,14 @@ class NPC(pygame.sprite.Sprite):
         # 表示フラグ
         self.visible = True
         
-        # スプライトシートを読み込む
-        self.sprite_sheet = self.resource_manager.load_image(sprite_img)
+        # 登録先の空間ハッシュ（移動したらバケットを更新する）
+        self.spatial_hash = None
         
-        # スプライトのサイズ（スプライトシートでの1フレームのサイズ）
-        self.sprite_width = 16
-        self.sprite_height = 16
+        # 全フレームを表示サイズに加工したアトラス（同じスプライトシートのNPCと共有）
+        self.sprite_atlas = SpriteAtlasRegistry.acquire(
+            self.resource_manager, sprite_img,
+            self.SPRITE_FRAME_SIZE, (self.width, self.height), self.SPRITE_LAYOUT
+        )
         
         # 初期画像を設定
         self.image = self.get_sprite_frame(self.direction, 0)
@@ -393,39 +444,14 @@ class NPC(pygame.sprite.Sprite):
         self.dialogue = self._get_dialogue()
     
     def get_sprite_frame(self, direction, frame):
-        """指定された方向とフレームのスプライトを切り出す"""
-        if direction == "down":
-            row = 0
-            col = frame
-        elif direction == "left":
-            row = 2
-            col = frame
-        elif direction == "right":
-            row = 3
-            col = frame
-        elif direction == "up":
-            row = 1
-            col = frame
-        else:
-            row = 0
-            col = frame
-        
-        # スプライトシートから切り出す
-        sprite_rect = pygame.Rect(
-            col * self.sprite_width,
-            row * self.sprite_height,
-            self.sprite_width,
-            self.sprite_height
-        )
-        
-        # 切り出したスプライトを作成
-        sprite = pygame.Surface((self.sprite_width, self.sprite_height), pygame.SRCALPHA)
-        sprite.blit(self.sprite_sheet, (0, 0), sprite_rect)
-        
-        # ゲームのスケールに合わせてリサイズ
-        scaled_sprite = pygame.transform.scale(sprite, (self.width, self.height))
-        
-        return scaled_sprite
+        """指定された方向とフレームのスプライトをアトラスから取得"""
+        return self.sprite_atlas.get_frame(direction, frame)
+    
+    def release_sprite_atlas(self):
+        """共有アトラスの参照を返す（NPCを破棄するときに呼ぶ）"""
+        if self.sprite_atlas is not None:
+            SpriteAtlasRegistry.release(self.sprite_atlas)
+            self.sprite_atlas = None
     
     def draw(self, screen, map_offset_x=0, map_offset_y=0):
         """NPCを描画"""
@@ -470,8 +496,7 @@ class NPC(pygame.sprite.Sprite):
         distance_y = abs(self.y + self.height/2 - player_y)
         
         # 隣接するタイルの範囲内かチェック
-        threshold = GameConfig.TILE_SIZE * GameConfig.SCALE * 1.5
-        return distance_x <= threshold and distance_y <= threshold
+        return distance_x <= self.INTERACTION_RANGE and distance_y <= self.INTERACTION_RANGE
     
     def face_player(self, player_x, player_y):
         """プレイヤーの方向を向く"""
@@ -521,6 +546,8 @@ class NPC(pygame.sprite.Sprite):
                 self.direction = "down"
             else:
                 self.direction = "up"
+        
+        self._update_spatial_hash()
     
     def update_move_animation(self, dt):
         """移動アニメーションを更新"""
@@ -545,6 +572,13 @@ class NPC(pygame.sprite.Sprite):
             self.is_moving = False
             self.x = target_x
             self.y = target_y
+        
+        self._update_spatial_hash()
+    
+    def _update_spatial_hash(self):
+        """位置と移動状態の変化を登録先の空間ハッシュに反映"""
+        if self.spatial_hash is not None:
+            self.spatial_hash.update(self)
     
     def update_animation(self, dt):
         """アニメーションフレームを更新"""
@@ -1,6 +1,7 @@
 import pygame
 import random
 from src.entities.entities import GameConfig
+from src.systems.game_clock import GameClock
 
 class GameState:
     """ゲーム状態の定数定義"""
@@ -14,7 +15,12 @@ class GameState:
 class BattleManager:
     """バトルシステムの管理クラス - 戦闘ロジックを担当"""
     
-    def __init__(self):
+    def __init__(self, rng=random):
+        """
+        Args:
+            rng: 敵の技選択に使う乱数生成器
+        """
+        self.rng = rng
         self.state = GameState.FIELD
         self.battle_timer = 0
         self.wild_pokemon = None
@@ -55,7 +61,7 @@ class BattleManager:
         self.displayed_chars = 0
         self.char_display_timer = 0
         self.full_message_displayed = False
-        self.battle_timer = pygame.time.get_ticks()
+        self.battle_timer = GameClock.get_ticks()
     
     def handle_command_input(self, event):
         """コマンド選択時の入力処理"""
@@ -103,7 +109,7 @@ class BattleManager:
         """逃走処理"""
         self.battle_message = "うまく にげきれた！"
         self.battle_state = GameState.BATTLE_MESSAGE
-        self.battle_timer = pygame.time.get_ticks()
+        self.battle_timer = GameClock.get_ticks()
         self._reset_message_display()
         self.battle_end_flag = True
     
@@ -132,13 +138,13 @@ class BattleManager:
                 self.battle_state = GameState.BATTLE_MESSAGE
             
             self.player_turn = False
-            self.battle_timer = pygame.time.get_ticks()
+            self.battle_timer = GameClock.get_ticks()
             self._reset_message_display()
         else:
             # PPが足りない場合のメッセージ
             self.battle_message = f"{move_name}のPPが足りない！"
             self.battle_state = GameState.BATTLE_MESSAGE
-            self.battle_timer = pygame.time.get_ticks()
+            self.battle_timer = GameClock.get_ticks()
             self._reset_message_display()
             # プレイヤーのターンは続行
             self.pending_damage = 0
@@ -147,8 +153,8 @@ class BattleManager:
         """スキルアニメーション開始"""
         self.battle_state = GameState.BATTLE_ANIMATION
         self.current_move_name = move_name
-        self.animation_start_time = pygame.time.get_ticks()
-        self.animation_timer = pygame.time.get_ticks()
+        self.animation_start_time = GameClock.get_ticks()
+        self.animation_timer = GameClock.get_ticks()
         self.animation_frame = 0
         self.animation_pos = []  # 位置はアニメーション描画時に初期化
         self.use_big_fire = False
@@ -166,14 +172,14 @@ class BattleManager:
                 # バトル終了フラグがセットされていない場合のみ次の処理へ
                 if self.battle_end_flag:
                     pass  # 終了フラグがセットされていれば何もしない
-                elif pygame.time.get_ticks() - self.battle_timer > GameConfig.MESSAGE_WAIT_TIME:
+                elif GameClock.get_ticks() - self.battle_timer > GameConfig.MESSAGE_WAIT_TIME:
                     if self.player_turn:
                         self.battle_state = GameState.BATTLE_COMMAND
                     else:
                         self._handle_enemy_turn(player)
         
         # バトル終了処理
-        if self.battle_end_flag and pygame.time.get_ticks() - self.battle_timer > GameConfig.BATTLE_END_WAIT_TIME:
+        if self.battle_end_flag and GameClock.get_ticks() - self.battle_timer > GameConfig.BATTLE_END_WAIT_TIME:
             self._end_battle(player)
     
     def _apply_pending_damage(self, player):
@@ -189,7 +195,7 @@ class BattleManager:
                 if player.pokemon[0].hp <= 0:
                     player.pokemon[0].hp = 0
                     self.battle_message = f"{player.pokemon[0].name}は倒れた！"
-                    self.battle_timer = pygame.time.get_ticks()
+                    self.battle_timer = GameClock.get_ticks()
                     self._reset_message_display()
                     self.battle_end_flag = True
             
@@ -199,7 +205,7 @@ class BattleManager:
         """敵のターン処理"""
         if self.wild_pokemon.pokemon.hp <= 0:
             self.battle_message = f"野生の{self.wild_pokemon.pokemon.name}を倒した！"
-            self.battle_timer = pygame.time.get_ticks()
+            self.battle_timer = GameClock.get_ticks()
             self._reset_message_display()
             self.battle_end_flag = True
         else:
@@ -211,7 +217,7 @@ class BattleManager:
             
             # 使える技がある場合
             if available_moves:
-                enemy_move_index = random.choice(available_moves)
+                enemy_move_index = self.rng.choice(available_moves)
                 enemy_move = self.wild_pokemon.pokemon.moves[enemy_move_index]
                 enemy_damage = self.wild_pokemon.pokemon.damages[enemy_move_index]
                 
@@ -225,7 +231,7 @@ class BattleManager:
                 self.battle_message = self._format_damage_message(
                     f"野生の{self.wild_pokemon.pokemon.name}", enemy_move, enemy_damage)
             
-            self.battle_timer = pygame.time.get_ticks()
+            self.battle_timer = GameClock.get_ticks()
             self._reset_message_display()
             self.player_turn = True
     
@@ -263,7 +269,7 @@ class BattleManager:
     def update_message_display(self):
         """メッセージ表示の更新"""
         if self.battle_state in [GameState.BATTLE_MESSAGE, GameState.BATTLE_ANIMATION]:
-            current_time = pygame.time.get_ticks()
+            current_time = GameClock.get_ticks()
             
             # 文字表示タイマーが設定されていない場合は初期化
             if self.char_display_timer == 0:
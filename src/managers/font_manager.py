@@ -1,17 +1,44 @@
 import pygame
 import sys
 import os
+from src.entities.entities import GameConfig
+from src.managers.text_cache import TextCache
+from src.systems.bitmap_font import BitmapFont
+from src.systems.font_path_cache import FontPathCache
+from src.systems.line_breaker import LineBreaker
 
 class FontManager:
     """フォント管理クラス - 日本語フォントの読み込みと管理を担当"""
     
+    # 太さ → 見つけたフォントのパス（Noneは既定のフォント）。探すのは全インスタンスで1回だけ
+    _font_paths = {}
+    
     def __init__(self):
         self._font_cache = {}
+        # 描画済みテキストのキャッシュ（同じ文字列を毎フレーム描画し直さない）
+        self.text_cache = TextCache()
+        # 禁則処理付きの折り返し（文字幅の表と折り返し結果をフォント間で共有）
+        self.line_breaker = LineBreaker()
     
     def get_font(self, size, font_weight='W5'):
         """
         指定されたサイズと重みのフォントを取得する
         
+        Args:
+            size: フォントサイズ
+            font_weight: フォントの重み ('W5' または 'W8')
+            
+        Returns:
+            pygame.font.Font: フォントオブジェクト（BITMAP_FONT_ENABLEDの場合はBitmapFont）
+        """
+        if GameConfig.BITMAP_FONT_ENABLED:
+            return self.get_bitmap_font(size, font_weight)
+        return self.get_ttf_font(size, font_weight)
+    
+    def get_ttf_font(self, size, font_weight='W5'):
+        """
+        指定されたサイズと重みのTTFフォントを取得する（BITMAP_FONT_ENABLEDに関係なくTTF）
+        
         Args:
             size: フォントサイズ
             font_weight: フォントの重み ('W5' または 'W8')
@@ -24,67 +51,151 @@ class FontManager:
         if cache_key in self._font_cache:
             return self._font_cache[cache_key]
         
+        self._resolve_font_paths([font_weight])
         font = self._load_japanese_font(size, font_weight)
         self._font_cache[cache_key] = font
         return font
     
-    def _load_japanese_font(self, size, font_weight='W5'):
+    def get_bitmap_font(self, size, font_weight='W5'):
         """
-        日本語フォントを読み込む
+        指定されたサイズと重みのビットマップフォントを取得する（get_fontと同じ使い方ができる）
+        
+        Args:
+            size: フォントサイズ（拡大後の大きさ）
+            font_weight: フォントの重み ('W5' または 'W8')
+            
+        Returns:
+            BitmapFont: 文字のアトラスで描画するフォント
+        """
+        cache_key = f"bitmap_{size}_{font_weight}"
+        
+        if cache_key in self._font_cache:
+            return self._font_cache[cache_key]
+        
+        scale = GameConfig.BITMAP_FONT_SCALE
+        self._resolve_font_paths([font_weight])
+        # 拡大率の分だけ小さいサイズで文字を描画してから拡大する
+        source = self._load_japanese_font(max(1, round(size / scale)), font_weight)
+        font = BitmapFont(source, GameConfig.BITMAP_FONT_GLYPHS, scale, GameConfig.BITMAP_FONT_ANTIALIAS)
+        self._font_cache[cache_key] = font
+        return font
+    
+    def preload(self, fonts):
+        """
+        UIで使うフォントをまとめて読み込む（初めて使うサイズで描画が引っかからないように起動時に呼ぶ）
+        
+        Args:
+            fonts: (サイズ, 太さ) のリスト
+        """
+        self._resolve_font_paths([font_weight for _, font_weight in fonts])
+        for size, font_weight in fonts:
+            self.get_font(size, font_weight)
+    
+    def render_text(self, font, text, antialias, color):
+        """
+        テキストを描画したサーフェスを取得（描画済みの文字列はキャッシュから返す）
+        
+        Args:
+            font: get_fontで取得したフォント
+            text: 描画する文字列
+            antialias: アンチエイリアスを使うか
+            color: 文字色
+            
+        Returns:
+            pygame.Surface: 共有のサーフェス（書き換えないこと）
+        """
+        return self.text_cache.render(font, text, antialias, color)
+    
+    def _resolve_font_paths(self, font_weights):
+        """
+        太さごとのフォントのパスを決める（ディスクのキャッシュになければ探して保存）
+        
+        Args:
+            font_weights: 太さのリスト
+        """
+        font_paths = FontManager._font_paths
+        missing = [font_weight for font_weight in dict.fromkeys(font_weights) if font_weight not in font_paths]
+        if not missing:
+            return
+        
+        path_cache = FontPathCache() if GameConfig.FONT_CACHE_ENABLED else None
+        source_key = None
+        if path_cache is not None:
+            source_key = path_cache.get_source_key()
+            font_paths.update(path_cache.load(source_key))
+            missing = [font_weight for font_weight in missing if font_weight not in font_paths]
+            if not missing:
+                return
+        
+        for font_weight in missing:
+            font_paths[font_weight] = self._find_japanese_font_path(font_weight)
+        
+        if path_cache is not None:
+            # 見つからなかった太さは保存しない（後から入れたフォントを次回の起動で探し直す）
+            path_cache.save(source_key, {
+                font_weight: path for font_weight, path in font_paths.items() if path is not None
+            })
+    
+    def _find_japanese_font_path(self, font_weight='W5'):
+        """
+        日本語フォントのファイルを探す
         
         Args:
-            size: フォントサイズ
             font_weight: フォントの重み
             
         Returns:
-            pygame.font.Font: 読み込まれたフォント
+            str: フォントのパス（見つからない場合はNone）
         """
         # macOSの場合はフォントパスを直接指定する方法を試す
         if sys.platform == 'darwin':  # macOS
-            try:
-                # まず、macOSの標準的な日本語フォントパスを直接試す
-                if font_weight == 'W8':
-                    font_paths = [
-                        '/System/Library/Fonts/ヒラギノ角ゴシック W8.ttc',  # W8フォント
-                    ]
-                else:  # デフォルトはW5
-                    font_paths = [
-                        '/System/Library/Fonts/ヒラギノ角ゴシック W5.ttc',  # Catalina以降
-                    ]
-                
-                for path in font_paths:
-                    if os.path.exists(path):
-                        return pygame.font.Font(path, size)
-                        
-                # 上記のパスでフォントが見つからない場合は、フォント名で試す
-                font_names = ['Hiragino Sans', 'Hiragino Kaku Gothic ProN', 'AppleGothic', 'Osaka']
-                for font_name in font_names:
-                    if font_name.lower() in [f.lower() for f in pygame.font.get_fonts()]:
-                        return pygame.font.SysFont(font_name, size)
-            except:
-                print("Warning: Error loading direct font path, falling back to SysFont")
-        
-        # Windowsの場合や上記の方法で失敗した場合はSysFontを使う
+            # まず、macOSの標準的な日本語フォントパスを直接試す
+            if font_weight == 'W8':
+                font_paths = [
+                    '/System/Library/Fonts/ヒラギノ角ゴシック W8.ttc',  # W8フォント
+                ]
+            else:  # デフォルトはW5
+                font_paths = [
+                    '/System/Library/Fonts/ヒラギノ角ゴシック W5.ttc',  # Catalina以降
+                ]
+            
+            for path in font_paths:
+                if os.path.exists(path):
+                    return path
+        
+        # フォント名から探す（上記の方法で見つからない場合やWindows・Linux）
         font_names = [
             'MS Gothic', 'Yu Gothic', 'Meiryo', 'Noto Sans CJK JP',  # Windows/Linux
             'Hiragino Sans', 'Hiragino Kaku Gothic ProN', 'AppleGothic', 'Osaka'  # macOS
         ]
         
-        # フォント名のリストから使えるフォントを探す
-        available_fonts = pygame.font.get_fonts()
         for font_name in font_names:
-            if font_name.lower() in [f.lower() for f in available_fonts]:
-                return pygame.font.SysFont(font_name, size)
-            
-            # match_fontでも試す
             matched_font = pygame.font.match_font(font_name)
             if matched_font:
-                return pygame.font.Font(matched_font, size)
+                return matched_font
         
-        # すべて失敗した場合は代替手段として既定のフォントを使用
+        # すべて失敗した場合は既定のフォントを使用
         print("Warning: No suitable Japanese font found. Text may not display correctly.")
+        return None
+    
+    def _load_japanese_font(self, size, font_weight='W5'):
+        """
+        決めておいたパスから日本語フォントを読み込む
+        
+        Args:
+            size: フォントサイズ
+            font_weight: フォントの重み
+            
+        Returns:
+            pygame.font.Font: 読み込まれたフォント
+        """
+        path = FontManager._font_paths.get(font_weight)
+        if path:
+            try:
+                return pygame.font.Font(path, size)
+            except (OSError, pygame.error) as e:
+                print(f"フォントの読み込みに失敗しました: {e}")
         
-        # フォールバック: シフトJISエンコードを使ってデフォルトフォントを試す
+        # フォールバック: 既定のフォントを使う
         try:
             default_font = pygame.font.SysFont(None, size)
             # フォントがレンダリングできるか簡単なテスト
@@ -93,4 +204,4 @@ class FontManager:
             return default_font
         except:
             # 最終手段
-            return pygame.font.SysFont(None, size)
\ No newline at end of file
+            return pygame.font.SysFont(None, size)
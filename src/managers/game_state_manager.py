@@ -3,15 +3,20 @@
 単一責任の原則：ゲーム状態の管理のみを担当
 """
 
+import random
 from src.entities.entities import GameConfig
 
 
 class GameStateManager:
     """ゲーム状態を管理するクラス"""
     
-    def __init__(self):
+    def __init__(self, rng=random):
+        """
+        Args:
+            rng: 遭遇判定に使う乱数生成器
+        """
         self.steps_since_last_encounter = 0
-        self.encounter_checker = EncounterChecker()
+        self.encounter_checker = EncounterChecker(rng)
         self.last_tile_x = None
         self.last_tile_y = None
     
@@ -53,11 +58,17 @@ class GameStateManager:
 class EncounterChecker:
     """野生ポケモンとの遭遇判定を管理するクラス"""
     
+    def __init__(self, rng=random):
+        """
+        Args:
+            rng: 遭遇判定に使う乱数生成器（リプレイで同じ結果にするため差し替え可能）
+        """
+        self.rng = rng
+    
     def should_encounter(self, player_x, player_y, current_map):
         """野生ポケモンとの遭遇判定"""
         # 草むらにいるかチェック
         if current_map and current_map.is_on_grassy(player_x, player_y):
-            import random
-            return random.random() < GameConfig.ENCOUNTER_RATE
+            return self.rng.random() < GameConfig.ENCOUNTER_RATE
         
         return False
\ No newline at end of file
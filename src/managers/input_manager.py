@@ -1,15 +1,92 @@
 import pygame
 from src.managers.battle_manager import GameState
+from src.systems.input_recording import InputRecording
 
 class InputManager:
     """入力処理を管理するクラス - キーボード入力の処理を担当"""
     
     def __init__(self):
         self.keys_pressed = set()
+        
+        # 外部から与えたフレームの入力（Noneの場合はキーボードから読む）
+        self._frame_events = None
+        self._frame_keys = None
+        
+        # 記録中・再生中の入力記録
+        self.recording = None
+        self.replay = None
+    
+    def start_recording(self, recording):
+        """キーボードの入力をフレームごとに記録し始める"""
+        self.recording = recording
+        self.replay = None
+    
+    def start_replay(self, recording):
+        """記録した入力の再生を始める（キーボードの入力の代わりに使う）"""
+        recording.rewind()
+        self.replay = recording
+        self.recording = None
+    
+    def begin_frame(self, dt):
+        """
+        フレームの最初に呼び、このフレームの入力を確定する
+        
+        Args:
+            dt: 前フレームからの経過時間（ms）
+        
+        Returns:
+            このフレームの経過時間（リプレイ中は記録した値、最後まで再生したら終了イベントを発生させる）
+        """
+        if self.replay is not None:
+            frame = self.replay.next_frame()
+            if frame is None:
+                self.set_frame_input([pygame.event.Event(pygame.QUIT)], ())
+                return dt
+            events, held_keys, dt = frame
+            self.set_frame_input(events, held_keys)
+        elif self.recording is not None:
+            events = [event for event in pygame.event.get() if event.type in InputRecording.RECORDED_EVENTS]
+            keys = pygame.key.get_pressed()
+            held_keys = [key for key in InputRecording.TRACKED_KEYS if keys[key]]
+            self.recording.add_frame(events, held_keys, dt)
+            self.set_frame_input(events, held_keys)
+        return dt
+    
+    def set_frame_input(self, events, held_keys):
+        """
+        次のフレームの入力を外部から与える（ベンチマークなどの台本入力用）
+        
+        Args:
+            events: このフレームで発生させるイベントのリスト
+            held_keys: 押し続けているキーのコードの集合
+        """
+        self._frame_events = list(events)
+        self._frame_keys = ScriptedKeyState(held_keys)
+    
+    def clear_frame_input(self):
+        """キーボードからの入力に戻す"""
+        self._frame_events = None
+        self._frame_keys = None
+    
+    def get_events(self):
+        """このフレームのイベントを取得（台本入力中もウィンドウを閉じる操作は受け付ける）"""
+        if self._frame_events is None:
+            return pygame.event.get()
+        
+        events = [event for event in pygame.event.get() if event.type == pygame.QUIT]
+        events.extend(self._frame_events)
+        self._frame_events = []
+        return events
+    
+    def get_pressed(self):
+        """押されているキーの状態を取得（pygame.key.get_pressed()と同じ添字で参照できる）"""
+        if self._frame_keys is None:
+            return pygame.key.get_pressed()
+        return self._frame_keys
     
     def handle_field_input(self, player, tmx_map):
         """フィールドでの入力処理"""
-        keys = pygame.key.get_pressed()
+        keys = self.get_pressed()
         player.move(keys, tmx_map)
     
     def handle_battle_input(self, events, battle_manager, player):
@@ -30,5 +107,15 @@ class InputManager:
     
     def check_debug_keys(self):
         """デバッグキーの状態をチェック"""
-        keys = pygame.key.get_pressed()
-        return keys[pygame.K_f]  # Fキーでデバッグ情報を表示
\ No newline at end of file
+        keys = self.get_pressed()
+        return keys[pygame.K_f]  # Fキーでデバッグ情報を表示
+
+
+class ScriptedKeyState:
+    """台本入力で押し続けているキーを、pygame.key.get_pressed()の結果と同じ形で参照するクラス"""
+    
+    def __init__(self, held_keys=()):
+        self.held_keys = frozenset(held_keys)
+    
+    def __getitem__(self, key):
+        return key in self.held_keys
@@ -0,0 +1,111 @@
+"""
+マッププール管理モジュール
+単一責任の原則：生成済みマップの再利用とLRU方式での破棄のみを担当
+"""
+
+from collections import OrderedDict
+
+from src.entities.entities import GameConfig
+from src.systems.map_system import SingleMap
+
+
+class MapPool:
+    """生成済みの単体マップを上限付きで保持するクラス"""
+    
+    def __init__(self, max_maps=GameConfig.MAP_POOL_MAX_MAPS,
+                 memory_budget=GameConfig.MAP_POOL_MEMORY_BUDGET, map_factory=SingleMap):
+        """
+        Args:
+            max_maps: 保持するマップの最大数
+            memory_budget: 保持するマップの合計メモリ上限（バイト）
+            map_factory: マップ名からマップを生成する呼び出し可能オブジェクト
+        """
+        self.max_maps = max_maps
+        self.memory_budget = memory_budget
+        self.map_factory = map_factory
+        
+        # マップ名 → (マップ, メモリ使用量)。末尾ほど最近使用
+        self._maps = OrderedDict()
+        self.memory_usage = 0
+        # 上限を超えても破棄しないマップ名
+        self._pinned = set()
+        
+        # 統計情報
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, map_name):
+        """マップを取得（プールになければ生成して登録）"""
+        if map_name in self._maps:
+            self.hits += 1
+            self._maps.move_to_end(map_name)
+            return self._maps[map_name][0]
+        
+        self.misses += 1
+        map_obj = self.map_factory(map_name)
+        self.put(map_name, map_obj)
+        return map_obj
+    
+    def peek(self, map_name):
+        """プールにあるマップを取得（なければ生成せずNoneを返す）"""
+        entry = self._maps.get(map_name)
+        if entry is None:
+            return None
+        # 毎フレーム呼ばれるため、統計情報（hits）には数えない
+        self._maps.move_to_end(map_name)
+        return entry[0]
+    
+    def put(self, map_name, map_obj):
+        """生成済みのマップを登録"""
+        self.remove(map_name)
+        
+        memory_size = map_obj.get_memory_size()
+        self._maps[map_name] = (map_obj, memory_size)
+        self.memory_usage += memory_size
+        self._evict()
+    
+    def remove(self, map_name):
+        """指定マップをプールから破棄（なければ何もしない）"""
+        if map_name in self._maps:
+            self.memory_usage -= self._maps.pop(map_name)[1]
+    
+    def set_pinned(self, map_names):
+        """上限を超えても破棄しないマップを設定（使用中のマップとその先読み分）"""
+        self._pinned = set(map_names)
+        self._evict()
+    
+    def get_names(self):
+        """保持しているマップ名のリストを取得"""
+        return list(self._maps.keys())
+    
+    def contains(self, map_name):
+        """マップがプールにあるかどうか"""
+        return map_name in self._maps
+    
+    def _evict(self):
+        """上限を超えた分を古い順に破棄（固定したマップと最新の1枚は残す）"""
+        while len(self._maps) > 1 and (
+            len(self._maps) > self.max_maps or self.memory_usage > self.memory_budget
+        ):
+            oldest_names = list(self._maps)[:-1]
+            victim = next((name for name in oldest_names if name not in self._pinned), None)
+            if victim is None:
+                # 残りがすべて固定されている場合は上限を超えて保持する
+                return
+            self.remove(victim)
+    
+    def clear(self):
+        """プールを空にする"""
+        self._maps.clear()
+        self.memory_usage = 0
+    
+    def get_stats(self):
+        """デバッグ用: プールの統計情報を取得"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'maps': self.get_names(),
+            'pinned': sorted(self._pinned),
+            'memory_usage': self.memory_usage,
+            'memory_budget': self.memory_budget
+        }
@@ -0,0 +1,75 @@
+"""
+マップ先読み管理モジュール
+単一責任の原則：遷移先マップのバックグラウンド読み込みのみを担当
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from src.entities.entities import GameConfig
+from src.systems.map_system import SingleMap
+
+
+class MapPrefetcher:
+    """遷移トリガーに近づいたとき、遷移先マップをワーカースレッドで読み込むクラス"""
+    
+    def __init__(self, map_pool, map_factory=SingleMap, distance=GameConfig.MAP_PREFETCH_DISTANCE):
+        """
+        Args:
+            map_pool: 読み込み完了したマップを登録するMapPool
+            map_factory: マップ名からマップを生成する呼び出し可能オブジェクト
+            distance: 先読みを開始する遷移トリガーまでのタイル数
+        """
+        self.map_pool = map_pool
+        self.map_factory = map_factory
+        self.distance = distance
+        
+        # 読み込みは1本のワーカーで順番に行う
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="map_prefetch")
+        # マップ名 → 読み込み中のFuture
+        self._pending = {}
+    
+    def update(self, current_map, player_x, player_y):
+        """完了した読み込みをプールに渡し、近くにある遷移先の先読みを開始（メインスレッドから毎フレーム呼ぶ）"""
+        self.collect_finished()
+        
+        if not GameConfig.MAP_PREFETCH_ENABLED or current_map is None:
+            return
+        
+        for target in current_map.get_nearby_triggers(player_x, player_y, self.distance):
+            self.request(target)
+    
+    def request(self, map_name):
+        """指定マップの先読みを開始（読み込み済み・読み込み中なら何もしない）"""
+        if map_name not in GameConfig.MAP_FILES:
+            return
+        if map_name in self._pending or self.map_pool.contains(map_name):
+            return
+        
+        self._pending[map_name] = self._executor.submit(self.map_factory, map_name)
+    
+    def is_pending(self, map_name):
+        """指定マップを読み込み中かどうか"""
+        return map_name in self._pending
+    
+    def wait_for(self, map_name):
+        """読み込み中のマップがあれば完了を待ってプールに登録"""
+        future = self._pending.pop(map_name, None)
+        if future is not None:
+            self._register(map_name, future)
+    
+    def collect_finished(self):
+        """完了した読み込みをプールに登録"""
+        for map_name in [name for name, future in self._pending.items() if future.done()]:
+            self._register(map_name, self._pending.pop(map_name))
+    
+    def _register(self, map_name, future):
+        """Futureの結果をプールに登録（失敗時は遷移時の通常読み込みに任せる）"""
+        try:
+            self.map_pool.put(map_name, future.result())
+        except Exception as e:
+            print(f"マップの先読みに失敗しました: {e}")
+    
+    def shutdown(self):
+        """ワーカースレッドを停止"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._pending.clear()
@@ -4,7 +4,8 @@
 """
 
 from src.entities.entities import GameConfig
-from src.systems.map_system import SingleMap
+from src.managers.map_pool import MapPool
+from src.managers.map_prefetcher import MapPrefetcher
 
 
 class MapTransitionManager:
@@ -12,55 +13,110 @@ class MapTransitionManager:
     
     def __init__(self):
         self.previous_position = None
-        self.current_map_type = "combined"  # "combined" または "single"
+        self.current_map_type = "combined"  # "combined"（ワールドマップ）または "single"
         self.single_map = None
+        # 一度訪れた単体マップを再利用するためのプール
+        self.map_pool = MapPool()
+        # 遷移トリガーに近づいたら遷移先を先読みする
+        self.map_prefetcher = MapPrefetcher(self.map_pool)
+        # 読み込みが終わるのを待っている遷移先（Noneなら待っていない）
+        self.pending_map = None
+        # 遷移先をその場で読み込むか（入力の記録・再生中は遷移するフレームを毎回同じにするためTrue）
+        self.synchronous_loading = False
+    
+    def update_prefetch(self, tmx_map, player_x, player_y):
+        """プレイヤー位置に応じてワールドのリージョンを入れ替え、遷移先マップを先読み"""
+        if not self.is_single_map():
+            tmx_map.update_regions(player_x, player_y)
+        self.map_prefetcher.update(self.get_current_map(tmx_map), player_x, player_y)
     
     def check_transition_trigger(self, tmx_map, player_x, player_y):
         """遷移トリガーをチェックし、遷移先を返す"""
         if self.current_map_type == "combined":
             return tmx_map.check_door_interaction(player_x, player_y)
-        else:
+        elif self.single_map:
             # 単体マップでの出口チェック
-            tile_x = int(player_x / (GameConfig.TILE_SIZE * GameConfig.SCALE))
-            tile_y = int(player_y / (GameConfig.TILE_SIZE * GameConfig.SCALE))
-            
-            if (tile_x == 4 and tile_y == 11) or (tile_x == 5 and tile_y == 11):
-                return "return_to_previous"
+            return self.single_map.check_door_interaction(player_x, player_y)
         
         return None
     
     def transition_to_map(self, map_name, player):
-        """指定されたマップに遷移する"""
+        """
+        指定されたマップに遷移する（遷移先が読み込まれていなければ、フレームを止めずに読み込みを待つ）
+        
+        Returns:
+            bool: 遷移したかどうか（読み込み待ちになった場合やエラー時はFalse）
+        """
         try:
-            if map_name == "lab":
-                self._transition_to_lab(player)
-            elif map_name == "return_to_previous":
+            if map_name == "return_to_previous":
                 self._return_to_previous_map(player)
+                return True
+            elif map_name in GameConfig.MAP_FILES and map_name not in GameConfig.WORLD_LAYOUT:
+                return self._transition_to_single_map(map_name, player)
             else:
                 print(f"Unknown map transition: {map_name}")
         except Exception as e:
             print(f"Error during map transition: {e}")
             # エラー時は遷移をキャンセル
+        return False
+    
+    def _transition_to_single_map(self, map_name, player):
+        """ワールド外の単体マップ（建物の中など）に遷移（プールになければワーカーで読み込み、完了後に遷移）"""
+        if not self.map_pool.contains(map_name) and not self.synchronous_loading:
+            # 読み込みが終わるまでは現在のマップにとどまる
+            self.map_prefetcher.request(map_name)
+            self.pending_map = map_name
+            return False
+        
+        self._enter_single_map(map_name, player)
+        return True
     
-    def _transition_to_lab(self, player):
-        """labマップに遷移"""
+    def is_transition_pending(self):
+        """遷移先の読み込みを待っているかどうか"""
+        return self.pending_map is not None
+    
+    def update_pending_transition(self, player):
+        """
+        読み込みを待っている遷移先が読み込まれていれば遷移する（メインスレッドから毎フレーム呼ぶ）
+        
+        Returns:
+            str: 遷移したマップ名（遷移しなかった場合はNone）
+        """
+        if self.pending_map is None:
+            return None
+        
+        map_name = self.pending_map
+        self.map_prefetcher.collect_finished()
+        if not self.map_pool.contains(map_name):
+            # 読み込みに失敗した場合は遷移をやめる
+            if not self.map_prefetcher.is_pending(map_name):
+                self.pending_map = None
+            return None
+        
+        self._enter_single_map(map_name, player)
+        return map_name
+    
+    def _enter_single_map(self, map_name, player):
+        """単体マップに切り替えてプレイヤーを入り口に置く"""
+        self.pending_map = None
         # 現在の位置を記録
         self.previous_position = (player.x, player.y)
         
-        # labマップに遷移
-        self.single_map = SingleMap("lab")
+        # 単体マップに遷移（同期読み込みのときは先読み中なら完了を待ち、プールになければその場で読み込む）
+        self.map_prefetcher.wait_for(map_name)
+        self.single_map = self.map_pool.get(map_name)
         self.current_map_type = "single"
         
-        # プレイヤーを入り口に配置
-        lab_width, lab_height = GameConfig.MAP_SIZES["lab"]
-        new_x = (lab_width * GameConfig.TILE_SIZE * GameConfig.SCALE / 2) - (player.width / 2)
-        new_y = (lab_height - 1) * GameConfig.TILE_SIZE * GameConfig.SCALE - player.height
+        # プレイヤーを入り口（下端中央）に配置
+        map_width, map_height = GameConfig.MAP_SIZES[map_name]
+        new_x = (map_width * GameConfig.TILE_SIZE * GameConfig.SCALE / 2) - (player.width / 2)
+        new_y = (map_height - 1) * GameConfig.TILE_SIZE * GameConfig.SCALE - player.height
         player.set_position(new_x, new_y)
     
     def _return_to_previous_map(self, player):
         """前のマップに戻る"""
         if self.previous_position:
-            # 結合マップに戻る
+            # ワールドマップに戻る
             self.current_map_type = "combined"
             self.single_map = None
             
@@ -77,4 +133,8 @@ class MapTransitionManager:
     
     def is_single_map(self):
         """単体マップかどうかを判定"""
-        return self.current_map_type == "single"
\ No newline at end of file
+        return self.current_map_type == "single"
+    
+    def shutdown(self):
+        """先読み用のワーカーを停止"""
+        self.map_prefetcher.shutdown()
\ No newline at end of file
@@ -3,19 +3,25 @@ import pygame
 class ResourceManager:
     """リソース管理クラス - 画像の読み込みとキャッシュを担当"""
     
-    def __init__(self):
+    def __init__(self, rle_accel=False):
+        """
+        Args:
+            rle_accel: カラーキー画像にRLEACCELを使うかの既定値
+        """
         self._image_cache = {}
+        self.rle_accel = rle_accel
     
-    def load_image(self, path, size=None):
+    def load_image(self, path, size=None, rle_accel=None):
         """
         画像を読み込んでキャッシュする
         
         Args:
             path: 画像ファイルのパス
             size: リサイズする場合のサイズ (width, height) のタプル
+            rle_accel: カラーキー画像にRLEACCELを使うか（Noneの場合は既定値）
             
         Returns:
-            pygame.Surface: 読み込まれた画像
+            pygame.Surface: 画面のピクセル形式に変換された画像
         """
         cache_key = f"{path}_{size}" if size else path
         
@@ -23,17 +29,72 @@ class ResourceManager:
             image = pygame.image.load(path)
             if size:
                 image = pygame.transform.scale(image, size)
-            self._image_cache[cache_key] = image
+            if rle_accel is None:
+                rle_accel = self.rle_accel
+            self._image_cache[cache_key] = self.convert_surface(image, rle_accel)
         
         return self._image_cache[cache_key]
     
+    @staticmethod
+    def convert_surface(surface, rle_accel=False):
+        """
+        サーフェスを画面のピクセル形式に変換する（毎回の描画で形式変換が起きないようにする）
+        
+        Args:
+            surface: 変換するサーフェス
+            rle_accel: カラーキー画像にRLEACCELを使うか（描画は速くなるが拡大縮小などは遅くなる）
+        
+        Returns:
+            pygame.Surface: 変換後のサーフェス（画面が未作成の場合は元のサーフェス）
+        """
+        if pygame.display.get_surface() is None:
+            return surface
+        
+        colorkey = surface.get_colorkey()
+        if colorkey is not None:
+            # カラーキー画像は不透明形式に変換してからカラーキーを設定し直す
+            converted = surface.convert()
+            converted.set_colorkey(colorkey, pygame.RLEACCEL if rle_accel else 0)
+            return converted
+        
+        if surface.get_flags() & pygame.SRCALPHA:
+            return surface.convert_alpha()
+        return surface.convert()
+    
+    def _is_display_format(self, surface):
+        """サーフェスが画面と同じピクセル形式かどうか"""
+        display = pygame.display.get_surface()
+        if display is None:
+            return False
+        return (surface.get_bytesize() == display.get_bytesize()
+                and surface.get_masks()[:3] == display.get_masks()[:3])
+    
     def clear_cache(self):
         """キャッシュをクリアする"""
         self._image_cache.clear()
     
+    def get_asset_report(self):
+        """デバッグ用: キャッシュ済み画像ごとのピクセル形式とメモリ使用量を取得"""
+        report = []
+        for cache_key, image in self._image_cache.items():
+            flags = image.get_flags()
+            report.append({
+                'key': cache_key,
+                'size': image.get_size(),
+                'bitsize': image.get_bitsize(),
+                'per_pixel_alpha': bool(flags & pygame.SRCALPHA),
+                'colorkey': image.get_colorkey() is not None,
+                # RLEACCELOKは指定済み、RLEACCELは初回描画でRLE圧縮済み
+                'rle_accel': bool(flags & (pygame.RLEACCEL | pygame.RLEACCELOK)),
+                'display_format': self._is_display_format(image),
+                'bytes': image.get_pitch() * image.get_height()
+            })
+        return report
+    
     def get_cache_info(self):
         """デバッグ用: キャッシュ情報を取得"""
         return {
             'cached_images': len(self._image_cache),
-            'cache_keys': list(self._image_cache.keys())
-        }
\ No newline at end of file
+            'cache_keys': list(self._image_cache.keys()),
+            'total_bytes': sum(image.get_pitch() * image.get_height() for image in self._image_cache.values())
+        }
@@ -0,0 +1,67 @@
+"""
+スプライトアトラス登録モジュール
+単一責任の原則：同じ見た目のキャラクター間でのスプライトアトラスの共有と、参照数による解放のみを担当
+"""
+
+from src.systems.sprite_atlas import SpriteAtlas
+
+
+class SpriteAtlasRegistry:
+    """スプライトシートのパス・表示サイズ・フレーム配置が同じアトラスを1つだけ作り、全インスタンスで共有するクラス"""
+    
+    # (パス, フレームサイズ, 表示サイズ, フレーム配置) → SpriteAtlas
+    _atlases = {}
+    # (パス, フレームサイズ, 表示サイズ, フレーム配置) → 参照数
+    _ref_counts = {}
+    # SpriteAtlas → 登録キー（解放時に引く）
+    _keys = {}
+    
+    @classmethod
+    def acquire(cls, resource_manager, path, frame_size, size, layout):
+        """
+        アトラスを取得して参照数を増やす（最初の取得時だけスプライトシートを切り出す）
+        
+        Args:
+            resource_manager: スプライトシートの読み込みに使うリソース管理
+            path: スプライトシートのパス
+            frame_size: スプライトシートでの1フレームの (幅, 高さ)
+            size: 表示サイズ (幅, 高さ)
+            layout: (向き, フレーム, 行, 列, 左右反転) のタプル
+        
+        Returns:
+            SpriteAtlas: 共有のアトラス（不要になったらreleaseに渡す）
+        """
+        key = (path, tuple(frame_size), tuple(size), layout)
+        atlas = cls._atlases.get(key)
+        if atlas is None:
+            sprite_sheet = resource_manager.load_image(path)
+            atlas = SpriteAtlas(sprite_sheet, frame_size, size, layout)
+            cls._atlases[key] = atlas
+            cls._ref_counts[key] = 0
+            cls._keys[atlas] = key
+        
+        cls._ref_counts[key] += 1
+        return atlas
+    
+    @classmethod
+    def release(cls, atlas):
+        """アトラスの参照数を減らし、誰も使わなくなったら破棄する"""
+        key = cls._keys.get(atlas)
+        if key is None:
+            return
+        
+        cls._ref_counts[key] -= 1
+        if cls._ref_counts[key] <= 0:
+            del cls._atlases[key]
+            del cls._ref_counts[key]
+            del cls._keys[atlas]
+    
+    @classmethod
+    def get_stats(cls):
+        """
+        共有状況を取得
+        
+        Returns:
+            dict: {'atlases': 保持しているアトラス数, 'references': 参照数の合計}
+        """
+        return {'atlases': len(cls._atlases), 'references': sum(cls._ref_counts.values())}
@@ -0,0 +1,79 @@
+"""
+テキストキャッシュ管理モジュール
+単一責任の原則：描画済みテキストのサーフェスの再利用とLRU方式での破棄のみを担当
+"""
+
+from collections import OrderedDict
+
+from src.entities.entities import GameConfig
+
+
+class TextCache:
+    """フォント・文字列・色ごとに描画済みのサーフェスを合計メモリの上限付きで保持するクラス"""
+    
+    def __init__(self, memory_budget=GameConfig.TEXT_CACHE_MEMORY_BUDGET):
+        """
+        Args:
+            memory_budget: 保持するサーフェスの合計メモリ上限（バイト）
+        """
+        self.memory_budget = memory_budget
+        
+        # (フォント, 文字列, アンチエイリアス, 色) → (サーフェス, メモリ使用量)。末尾ほど最近使用
+        # フォントはFontManagerがサイズ・太さごとに1つだけ作るため、フォントでサイズと太さも区別される
+        self._surfaces = OrderedDict()
+        self.memory_usage = 0
+        
+        # 統計情報
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def render(self, font, text, antialias, color):
+        """
+        テキストを描画したサーフェスを取得（キャッシュになければ描画して登録）
+        
+        返すサーフェスは共有されるため、呼び出し側で書き換えないこと
+        
+        Args:
+            font: pygame.font.Font
+            text: 描画する文字列
+            antialias: アンチエイリアスを使うか
+            color: 文字色
+        """
+        key = (font, text, antialias, tuple(color))
+        entry = self._surfaces.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return entry[0]
+        
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        memory_size = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        self._surfaces[key] = (surface, memory_size)
+        self.memory_usage += memory_size
+        self._evict()
+        return surface
+    
+    def _evict(self):
+        """上限を超えた分を古い順に破棄（最新の1つは残す）"""
+        while len(self._surfaces) > 1 and self.memory_usage > self.memory_budget:
+            _, (_, memory_size) = self._surfaces.popitem(last=False)
+            self.memory_usage -= memory_size
+            self.evictions += 1
+    
+    def clear(self):
+        """キャッシュを空にする"""
+        self._surfaces.clear()
+        self.memory_usage = 0
+    
+    def get_stats(self):
+        """デバッグ用: キャッシュの統計情報を取得"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._surfaces),
+            'memory_usage': self.memory_usage,
+            'memory_budget': self.memory_budget
+        }
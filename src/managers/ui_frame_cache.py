@@ -0,0 +1,84 @@
+"""
+UI枠キャッシュ管理モジュール
+単一責任の原則：UI枠画像を9分割して任意のサイズに組み立て、サイズごとに再利用することのみを担当
+"""
+
+import pygame
+
+from src.entities.entities import GameConfig
+from src.managers.resource_manager import ResourceManager
+
+
+class UIFrameCache:
+    """メッセージ枠・情報枠・HPバーを9分割で指定サイズに組み立て、(画像, サイズ)ごとに1度だけ作るクラス"""
+    
+    def __init__(self, resource_manager: ResourceManager, insets=GameConfig.UI_FRAME_INSETS,
+                 border_scale=GameConfig.SCALE):
+        """
+        Args:
+            resource_manager: 元画像の読み込みに使うリソース管理
+            insets: 画像パス → 元画像の左・上・右・下の枠の幅（登録のない画像は全体を拡大する）
+            border_scale: 角と辺の拡大率
+        """
+        self.resource_manager = resource_manager
+        self.insets = insets
+        self.border_scale = border_scale
+        
+        # (画像パス, サイズ) → 組み立て済みのサーフェス
+        self._frames = {}
+    
+    def get_frame(self, path, size):
+        """
+        指定サイズの枠を取得（初回だけ組み立てる）
+        
+        Args:
+            path: 枠画像のパス
+            size: 表示サイズ (幅, 高さ)
+        
+        Returns:
+            pygame.Surface: 共有のサーフェス（書き換えないこと）
+        """
+        key = (path, tuple(size))
+        frame = self._frames.get(key)
+        if frame is None:
+            image = self.resource_manager.load_image(path)
+            insets = self.insets.get(path)
+            if insets is None:
+                frame = ResourceManager.convert_surface(pygame.transform.scale(image, key[1]))
+            else:
+                frame = self._build_nine_slice(image, insets, key[1])
+            self._frames[key] = frame
+        return frame
+    
+    def _build_nine_slice(self, image, insets, size):
+        """角はそのまま拡大し、辺は長さ方向だけ、中央は両方向に伸ばして組み立てる"""
+        left, top, right, bottom = insets
+        image_width, image_height = image.get_size()
+        width, height = size
+        
+        # 表示サイズが枠より小さい場合は枠を縮めて収める
+        scale_x = min(self.border_scale, width / max(1, left + right))
+        scale_y = min(self.border_scale, height / max(1, top + bottom))
+        
+        source_xs = (0, left, image_width - right, image_width)
+        source_ys = (0, top, image_height - bottom, image_height)
+        dest_xs = (0, int(left * scale_x), width - int(right * scale_x), width)
+        dest_ys = (0, int(top * scale_y), height - int(bottom * scale_y), height)
+        
+        frame = pygame.Surface(size, pygame.SRCALPHA)
+        frame.fill((0, 0, 0, 0))
+        for row in range(3):
+            for col in range(3):
+                source_rect = pygame.Rect(source_xs[col], source_ys[row],
+                                          source_xs[col + 1] - source_xs[col], source_ys[row + 1] - source_ys[row])
+                dest_size = (dest_xs[col + 1] - dest_xs[col], dest_ys[row + 1] - dest_ys[row])
+                if source_rect.width <= 0 or source_rect.height <= 0 or dest_size[0] <= 0 or dest_size[1] <= 0:
+                    continue
+                piece = pygame.transform.scale(image.subsurface(source_rect), dest_size)
+                frame.blit(piece, (dest_xs[col], dest_ys[row]))
+        
+        return ResourceManager.convert_surface(frame)
+    
+    def clear(self):
+        """キャッシュを空にする"""
+        self._frames.clear()
@@ -0,0 +1,173 @@
+"""
+ビットマップフォントモジュール
+単一責任の原則：TTFフォントの文字を一度だけアトラスに描画し、文字列をアトラスの切り出しの転送で描画することのみを担当
+"""
+
+import pygame
+
+
+class BitmapFont:
+    """
+    文字をアトラスに描画しておき、Surface.blitsで並べて文字列を描くフォント
+    
+    pygame.font.Fontと同じ render・size・metrics・get_linesize・get_height を持つため、get_fontの代わりに使える。
+    カーニングは行わず、各文字を送り幅で並べる
+    """
+    
+    # アトラスの幅（px）。高さは足りなくなったら倍にする
+    ATLAS_WIDTH = 512
+    
+    def __init__(self, font, glyphs="", scale=1, antialias=True):
+        """
+        Args:
+            font: 文字の描画に使うpygame.font.Font
+            glyphs: 最初にアトラスへ描画する文字（それ以外の文字は初めて使うときに追加する）
+            scale: 文字の拡大率（2以上でドット絵のように最近傍で拡大する）
+            antialias: 文字をアンチエイリアスで描画するか（renderの引数ではなくここで決める）
+        """
+        self.font = font
+        self.scale = scale
+        self.antialias = antialias
+        
+        self._height = font.get_height() * scale
+        self._linesize = font.get_linesize() * scale
+        
+        # 白で描画した文字のアトラスと、色 → 着色済みのアトラス
+        self._atlas = pygame.Surface((self.ATLAS_WIDTH, max(self._height, 1) * 4), pygame.SRCALPHA)
+        self._atlas.fill((0, 0, 0, 0))
+        self._tinted = {}
+        # 文字 → (アトラス内の矩形, 送り幅)
+        self._glyphs = {}
+        # 次に文字を置く位置と、現在の行の高さ
+        self._cursor_x = 0
+        self._cursor_y = 0
+        self._row_height = 0
+        
+        self.add_glyphs(glyphs)
+    
+    def add_glyphs(self, text):
+        """アトラスにない文字を描画して追加"""
+        for char in dict.fromkeys(text):
+            if char not in self._glyphs and char != '\n':
+                self._add_glyph(char)
+    
+    def _add_glyph(self, char):
+        """1文字を白で描画し、アトラスの空いている位置に置く"""
+        metrics = self.font.metrics(char)
+        advance = metrics[0][4] if metrics and metrics[0] else self.font.size(char)[0]
+        try:
+            glyph = self.font.render(char, self.antialias, (255, 255, 255))
+        except pygame.error:
+            # 幅のない文字（フォントにない制御文字など）は何も描画しない
+            self._glyphs[char] = (pygame.Rect(0, 0, 0, 0), advance * self.scale)
+            return
+        if self.scale != 1:
+            glyph = pygame.transform.scale(glyph, (glyph.get_width() * self.scale, glyph.get_height() * self.scale))
+            advance *= self.scale
+        
+        width, height = glyph.get_size()
+        if self._cursor_x + width > self.ATLAS_WIDTH:
+            self._cursor_x = 0
+            self._cursor_y += self._row_height
+            self._row_height = 0
+        if self._cursor_y + height > self._atlas.get_height():
+            self._grow_atlas(self._cursor_y + height)
+        
+        rect = pygame.Rect(self._cursor_x, self._cursor_y, width, height)
+        if glyph.get_colorkey() is not None:
+            # アンチエイリアスなしの文字はカラーキーの画素を飛ばして置く
+            self._atlas.blit(glyph, rect)
+        else:
+            # 透明部分も含めて画素をそのまま置く
+            self._atlas.blit(glyph, rect, special_flags=pygame.BLEND_RGBA_MAX)
+        self._glyphs[char] = (rect, advance)
+        
+        self._cursor_x += width
+        self._row_height = max(self._row_height, height)
+        # 着色済みのアトラスは作り直す
+        self._tinted.clear()
+    
+    def _get_glyphs(self, text):
+        """各文字の (アトラス内の矩形, 送り幅) のリストを取得（アトラスにない文字は追加する）"""
+        glyphs = self._glyphs
+        try:
+            return [glyphs[char] for char in text]
+        except KeyError:
+            self.add_glyphs(text)
+            return [glyphs[char] for char in text]
+    
+    def _grow_atlas(self, min_height):
+        """アトラスの高さを倍にする（描画済みの文字の位置は変えない）"""
+        height = self._atlas.get_height()
+        while height < min_height:
+            height *= 2
+        atlas = pygame.Surface((self.ATLAS_WIDTH, height), pygame.SRCALPHA)
+        atlas.fill((0, 0, 0, 0))
+        atlas.blit(self._atlas, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        self._atlas = atlas
+    
+    def _get_atlas(self, color):
+        """指定色で着色したアトラスを取得（色ごとに1回だけ作る）"""
+        color = tuple(color)
+        atlas = self._tinted.get(color)
+        if atlas is None:
+            atlas = self._atlas.copy()
+            atlas.fill(color[:3] + (255,), special_flags=pygame.BLEND_RGBA_MULT)
+            self._tinted[color] = atlas
+        return atlas
+    
+    def draw(self, surface, text, position, color):
+        """
+        文字列を描画先に直接描画（サーフェスを作らない）
+        
+        Args:
+            surface: 描画先
+            text: 描画する文字列（1行）
+            position: 左上の座標
+            color: 文字色
+        
+        Returns:
+            int: 描画した幅（px）
+        """
+        return self._draw_glyphs(surface, self._get_glyphs(text), position, color)
+    
+    def _draw_glyphs(self, surface, glyphs, position, color):
+        """文字ごとの (矩形, 送り幅) を送り幅で並べて1回のblitsで描画し、描画した幅を返す"""
+        atlas = self._get_atlas(color)
+        pen_x, y = position
+        blits = []
+        for rect, advance in glyphs:
+            blits.append((atlas, (pen_x, y), rect))
+            pen_x += advance
+        surface.blits(blits, doreturn=False)
+        return pen_x - position[0]
+    
+    def render(self, text, antialias, color, background=None):
+        """pygame.font.Font.renderと同じ引数で文字列のサーフェスを作る（antialiasは生成時の設定を使う）"""
+        glyphs = self._get_glyphs(text)
+        width = sum(advance for _, advance in glyphs)
+        surface = pygame.Surface((max(width, 1), self._height), pygame.SRCALPHA)
+        if background is not None:
+            surface.fill(background)
+        self._draw_glyphs(surface, glyphs, (0, 0), color)
+        return surface
+    
+    def size(self, text):
+        """文字列の幅と高さ（px）"""
+        return sum(advance for _, advance in self._get_glyphs(text)), self._height
+    
+    def metrics(self, text):
+        """各文字の (最小x, 最大x, 最小y, 最大y, 送り幅) のリスト（送り幅だけが正確）"""
+        return [(0, rect.width, 0, rect.height, advance) for rect, advance in self._get_glyphs(text)]
+    
+    def get_linesize(self):
+        """行の間隔（px）"""
+        return self._linesize
+    
+    def get_height(self):
+        """文字の高さ（px）"""
+        return self._height
+    
+    def get_glyph_count(self):
+        """アトラスに描画済みの文字数"""
+        return len(self._glyphs)
@@ -0,0 +1,59 @@
+"""
+チャンク描画モジュール
+単一責任の原則：レイヤーサーフェスのビューポートカリング描画のみを担当
+"""
+
+import pygame
+
+
+class ChunkedLayer:
+    """スケール済みレイヤーを固定サイズのチャンクに分割し、画面と重なるチャンクのみ描画するクラス"""
+    
+    def __init__(self, surface, chunk_size):
+        """
+        Args:
+            surface: スケール済みのレイヤーサーフェス
+            chunk_size: チャンク1辺のピクセル数
+        """
+        self.surface = surface
+        self.chunk_size = chunk_size
+        self.width = surface.get_width()
+        self.height = surface.get_height()
+        
+        # チャンクの列数・行数（端は切り上げ）
+        self.cols = (self.width + chunk_size - 1) // chunk_size
+        self.rows = (self.height + chunk_size - 1) // chunk_size
+        
+        # サブサーフェスで分割するため画素のコピーは発生しない
+        self.chunks = [
+            [self._create_chunk(col, row) for col in range(self.cols)]
+            for row in range(self.rows)
+        ]
+    
+    def _create_chunk(self, col, row):
+        """指定位置のチャンク（サブサーフェス）を作成"""
+        x = col * self.chunk_size
+        y = row * self.chunk_size
+        width = min(self.chunk_size, self.width - x)
+        height = min(self.chunk_size, self.height - y)
+        return self.surface.subsurface(pygame.Rect(x, y, width, height))
+    
+    def draw(self, screen, offset_x, offset_y):
+        """画面と重なるチャンクのみを描画"""
+        # 全体を1枚でblitした場合と同じ位置になるよう、オフセットを先に整数化する
+        offset_x = int(offset_x)
+        offset_y = int(offset_y)
+        start_col, end_col = self._visible_range(-offset_x, screen.get_width(), self.cols)
+        start_row, end_row = self._visible_range(-offset_y, screen.get_height(), self.rows)
+        
+        for row in range(start_row, end_row):
+            chunk_y = row * self.chunk_size + offset_y
+            chunk_row = self.chunks[row]
+            for col in range(start_col, end_col):
+                screen.blit(chunk_row[col], (col * self.chunk_size + offset_x, chunk_y))
+    
+    def _visible_range(self, view_start, view_length, count):
+        """ビューポートと重なるチャンクの範囲 [start, end) を計算"""
+        start = max(0, int(view_start // self.chunk_size))
+        end = min(count, int((view_start + view_length - 1) // self.chunk_size) + 1)
+        return start, max(start, end)
@@ -5,6 +5,8 @@ NPCとの会話を管理する
 
 import pygame
 from src.entities.entities import GameConfig
+from src.managers.ui_frame_cache import UIFrameCache
+from src.systems.typewriter_text import TypewriterText
 
 
 class DialogueManager:
@@ -16,13 +18,17 @@ class DialogueManager:
         self.is_active = False
         self.current_dialogue = []
         self.current_index = 0
-        self.current_text = ""
         self.text_timer = 0
         self.char_index = 0
         self.text_speed = 50  # ミリ秒
         
-        # メッセージ背景画像を読み込み
+        # メッセージ背景画像を読み込み（表示サイズの枠は初回だけ組み立てる）
         self.message_bg = self.resource_manager.load_image(GameConfig.MESSAGE_ALL_IMG)
+        self.ui_frames = UIFrameCache(resource_manager)
+        
+        # メッセージ全文を一度だけ折り返して描画し、表示した文字数だけ切り出す
+        self.typewriter = TypewriterText(font_manager, 16, (0, 0, 0),
+                                         max_width=self.get_message_rect().width - 40, line_height=20)
         
     def start_dialogue(self, dialogue_text_list):
         """会話を開始"""
@@ -31,7 +37,6 @@ class DialogueManager:
             
         self.current_dialogue = dialogue_text_list
         self.current_index = 0
-        self.current_text = ""
         self.char_index = 0
         self.text_timer = 0
         self.is_active = True
@@ -45,7 +50,6 @@ class DialogueManager:
         if self.char_index < len(self.current_dialogue[self.current_index]):
             self.text_timer += dt
             if self.text_timer >= self.text_speed:
-                self.current_text += self.current_dialogue[self.current_index][self.char_index]
                 self.char_index += 1
                 self.text_timer = 0
         
@@ -57,7 +61,6 @@ class DialogueManager:
         if event.type == pygame.KEYDOWN and event.key == pygame.K_z:
             # テキストアニメーション中の場合は即座に全文表示
             if self.char_index < len(self.current_dialogue[self.current_index]):
-                self.current_text = self.current_dialogue[self.current_index]
                 self.char_index = len(self.current_dialogue[self.current_index])
                 return True
             
@@ -70,7 +73,6 @@ class DialogueManager:
                 return True
             else:
                 # 次のメッセージを準備
-                self.current_text = ""
                 self.char_index = 0
                 self.text_timer = 0
                 return True
@@ -82,7 +84,6 @@ class DialogueManager:
         self.is_active = False
         self.current_dialogue = []
         self.current_index = 0
-        self.current_text = ""
         self.char_index = 0
         
     def draw(self, screen):
@@ -91,26 +92,15 @@ class DialogueManager:
             return
             
         # メッセージ背景を描画
-        bg_width = self.message_bg.get_width() * GameConfig.SCALE
-        bg_height = self.message_bg.get_height() * GameConfig.SCALE
-        bg_x = (GameConfig.WIDTH - bg_width) // 2
-        bg_y = GameConfig.HEIGHT - bg_height
+        bg_x, bg_y, bg_width, bg_height = self.get_message_rect()
         
-        scaled_bg = pygame.transform.scale(self.message_bg, (bg_width, bg_height))
+        scaled_bg = self.ui_frames.get_frame(GameConfig.MESSAGE_ALL_IMG, (bg_width, bg_height))
         screen.blit(scaled_bg, (bg_x, bg_y))
         
-        # テキストを描画
-        if self.current_text:
-            font = self.font_manager.get_font(16)
-            
-            # テキストを行に分割
-            lines = self._wrap_text(self.current_text, bg_width - 40, font)
-            
-            for i, line in enumerate(lines):
-                text_surface = font.render(line, True, (0, 0, 0))
-                text_x = bg_x + 20
-                text_y = bg_y + 20 + i * 20
-                screen.blit(text_surface, (text_x, text_y))
+        # テキストを描画（表示済みの文字数だけ切り出す）
+        if self.char_index > 0:
+            self.typewriter.set_text(self.current_dialogue[self.current_index])
+            self.typewriter.draw(screen, bg_x + 20, bg_y + 20, self.char_index)
                 
         # 続行インジケーター（テキスト表示完了時）
         if self.char_index >= len(self.current_dialogue[self.current_index]):
@@ -127,24 +117,14 @@ class DialogueManager:
             
             pygame.draw.polygon(screen, (50, 50, 50), triangle_points)
     
-    def _wrap_text(self, text, max_width, font):
-        """テキストを指定幅で折り返し"""
-        words = text.split(' ')
-        lines = []
-        current_line = ""
-        
-        for word in words:
-            test_line = current_line + word if not current_line else current_line + " " + word
-            test_width = font.size(test_line)[0]
-            
-            if test_width <= max_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
-        
-        if current_line:
-            lines.append(current_line)
-            
-        return lines
\ No newline at end of file
+    def get_message_rect(self):
+        """メッセージ枠の画面上の矩形を取得"""
+        bg_width = self.message_bg.get_width() * GameConfig.SCALE
+        bg_height = self.message_bg.get_height() * GameConfig.SCALE
+        bg_x = (GameConfig.WIDTH - bg_width) // 2
+        bg_y = GameConfig.HEIGHT - bg_height
+        return pygame.Rect(bg_x, bg_y, bg_width, bg_height)
+    
+    def get_display_state(self):
+        """表示内容を決める状態を取得（変化領域の判定用）"""
+        return self.is_active, self.current_index, self.char_index
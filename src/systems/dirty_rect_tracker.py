@@ -0,0 +1,74 @@
+"""
+変化領域追跡モジュール
+単一責任の原則：前フレームから変化した画面領域の記録のみを担当
+"""
+
+import pygame
+
+
+class DirtyRectTracker:
+    """描画要素ごとの矩形と状態を前フレームと比較し、再描画・転送が必要な領域を集めるクラス"""
+    
+    def __init__(self, screen_rect):
+        self.screen_rect = pygame.Rect(screen_rect)
+        self._rects = []
+        self._full = True  # 初回は全画面を転送
+        # 要素キー → (矩形, 状態)
+        self._previous = {}
+    
+    def mark_full(self):
+        """全画面を変化領域にする"""
+        self._full = True
+    
+    def add(self, rect):
+        """変化領域を追加"""
+        if rect is not None:
+            self._rects.append(pygame.Rect(rect))
+    
+    def track(self, key, rect, state=None):
+        """
+        要素の矩形と状態を前フレームと比較し、変化していれば前後の矩形を追加する
+        
+        Args:
+            key: 要素を識別するキー
+            rect: 画面上の矩形（非表示ならNone）
+            state: 見た目を決める状態（画像フレームや表示文字数など）
+        """
+        rect = pygame.Rect(rect) if rect is not None else None
+        previous = self._previous.get(key)
+        
+        if previous != (rect, state):
+            if previous is not None:
+                self.add(previous[0])
+            self.add(rect)
+        
+        self._previous[key] = (rect, state)
+    
+    def track_value(self, key, value):
+        """値の変化を確認し、変化していれば全画面を変化領域にする（カメラ移動・画面切り替え用）"""
+        if key not in self._previous or self._previous[key] != (None, value):
+            self._full = True
+        self._previous[key] = (None, value)
+    
+    def has_changes(self):
+        """変化領域があるかどうか"""
+        return self._full or bool(self._rects)
+    
+    def get_rects(self):
+        """画面内に切り詰めた変化領域のリストを取得"""
+        if self._full:
+            return [self.screen_rect.copy()]
+        clipped = (rect.clip(self.screen_rect) for rect in self._rects)
+        return [rect for rect in clipped if rect.width and rect.height]
+    
+    def get_bounds(self):
+        """変化領域全体を囲む矩形を取得（描画のクリップ用）"""
+        rects = self.get_rects()
+        if not rects:
+            return pygame.Rect(0, 0, 0, 0)
+        return rects[0].unionall(rects[1:])
+    
+    def reset(self):
+        """転送後に変化領域をクリア"""
+        self._rects.clear()
+        self._full = False
@@ -0,0 +1,102 @@
+"""
+フォントパスキャッシュモジュール
+単一責任の原則：見つけた日本語フォントのファイルパスのディスクへの保存と読み込みのみを担当
+"""
+
+import hashlib
+import json
+import os
+import sys
+
+from src.entities.entities import GameConfig
+
+
+class FontPathCache:
+    """太さごとに見つけたフォントのパスをファイルに保存し、フォントのディレクトリが変わったら無効にするクラス"""
+    
+    # キャッシュ形式のバージョン（形式や探し方を変えたら上げる）
+    CACHE_VERSION = 1
+    
+    def __init__(self, cache_path=GameConfig.FONT_CACHE_PATH):
+        self.cache_path = cache_path
+    
+    def get_font_dirs(self):
+        """OSのフォントのディレクトリの一覧を取得"""
+        if sys.platform == 'darwin':
+            dirs = ['/System/Library/Fonts', '/Library/Fonts', '~/Library/Fonts']
+        elif sys.platform == 'win32':
+            dirs = [
+                os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts'),
+                os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Microsoft', 'Windows', 'Fonts')
+            ]
+        else:
+            dirs = ['/usr/share/fonts', '/usr/local/share/fonts', '~/.fonts', '~/.local/share/fonts']
+        return [os.path.expanduser(path) for path in dirs]
+    
+    def get_source_key(self):
+        """フォントのディレクトリとその直下のディレクトリの更新日時からキャッシュキーを計算"""
+        digest = hashlib.sha1(f"{self.CACHE_VERSION}:{sys.platform}".encode('utf-8'))
+        for font_dir in self.get_font_dirs():
+            paths = [font_dir]
+            try:
+                with os.scandir(font_dir) as entries:
+                    paths += sorted(entry.path for entry in entries if entry.is_dir())
+            except OSError:
+                pass
+            
+            for path in paths:
+                try:
+                    mtime = os.stat(path).st_mtime_ns
+                except OSError:
+                    mtime = None
+                digest.update(f"{path}:{mtime}".encode('utf-8'))
+        return digest.hexdigest()
+    
+    def load(self, source_key):
+        """
+        キャッシュを読み込む
+        
+        Args:
+            source_key: get_source_keyで計算したキー
+        
+        Returns:
+            dict: 太さ → フォントのパス（見つかった太さのみ）。無効な場合は空の辞書
+        """
+        if not os.path.exists(self.cache_path):
+            return {}
+        
+        try:
+            with open(self.cache_path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"フォントキャッシュの読み込みに失敗しました: {e}")
+            return {}
+        
+        # バージョンまたはフォントのディレクトリが変わっていれば探し直す
+        if data.get('version') != self.CACHE_VERSION or data.get('source_key') != source_key:
+            return {}
+        
+        # 削除されたフォントのパスと、見つからなかった結果（探し直す）は使わない
+        return {
+            font_weight: path
+            for font_weight, path in data.get('paths', {}).items()
+            if path is not None and os.path.exists(path)
+        }
+    
+    def save(self, source_key, paths):
+        """太さ → フォントのパスの辞書をキャッシュに保存（見つかったパスのみ渡す）"""
+        data = {
+            'version': self.CACHE_VERSION,
+            'source_key': source_key,
+            'paths': paths
+        }
+        
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+            # 書き込み途中のファイルを読まないよう、一時ファイルから置き換える
+            temp_path = f"{self.cache_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            print(f"フォントキャッシュの保存に失敗しました: {e}")
@@ -0,0 +1,126 @@
+"""
+フレームプロファイラモジュール
+単一責任の原則：処理区間ごとの所要時間の計測と、直近フレームの統計の保持のみを担当
+"""
+
+import time
+from src.entities.entities import GameConfig
+
+
+class FrameProfiler:
+    """処理区間ごとの所要時間を直近のフレーム数だけリングバッファに保持し、平均と最大値を提供するクラス"""
+    
+    # フレーム全体の時間を記録する区間名
+    FRAME = 'frame'
+    
+    def __init__(self, history=GameConfig.PROFILER_HISTORY):
+        """
+        Args:
+            history: 統計に使う直近のフレーム数
+        """
+        self.history = history
+        
+        # 区間名 → 直近historyフレームの所要時間（ms）のリングバッファ（計測順に登録）
+        self._samples = {}
+        # 区間名 → リングバッファの合計（移動平均用）
+        self._sums = {}
+        # 現在のフレームの区間名 → 所要時間（ms）
+        self._current = {}
+        # 時間以外の指標名 → 最新の値（キャッシュのヒット数など。設定順）
+        self._counters = {}
+        
+        # 次に書き込むリングバッファの位置と、記録済みのフレーム数
+        self._index = 0
+        self._frame_count = 0
+        self._frame_start = None
+    
+    def begin_frame(self):
+        """フレームの計測を開始"""
+        self._current.clear()
+        self._frame_start = time.perf_counter()
+    
+    def measure(self, name, func, *args):
+        """
+        関数を呼び出し、所要時間を区間に加算する（同じフレームで複数回呼ばれた区間は合計）
+        
+        Returns:
+            関数の戻り値
+        """
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            self._current[name] = self._current.get(name, 0.0) + (time.perf_counter() - start) * 1000
+    
+    def end_frame(self):
+        """フレームの計測を終了し、各区間の所要時間をリングバッファに記録（計測されなかった区間は0）"""
+        if self._frame_start is None:
+            return
+        self._current[self.FRAME] = (time.perf_counter() - self._frame_start) * 1000
+        self._frame_start = None
+        
+        for name in self._current:
+            if name not in self._samples:
+                self._samples[name] = [0.0] * self.history
+                self._sums[name] = 0.0
+        
+        index = self._index
+        for name, samples in self._samples.items():
+            value = self._current.get(name, 0.0)
+            self._sums[name] += value - samples[index]
+            samples[index] = value
+        
+        self._index = (index + 1) % self.history
+        self._frame_count += 1
+    
+    def set_counter(self, name, value):
+        """時間以外の指標の最新の値を設定"""
+        self._counters[name] = value
+    
+    def get_counters(self):
+        """時間以外の指標名 → 最新の値の辞書を取得（設定順）"""
+        return dict(self._counters)
+    
+    def get_sections(self):
+        """計測したことのある区間名のリストを取得（フレーム全体を除く、計測順）"""
+        return [name for name in self._samples if name != self.FRAME]
+    
+    def get_history(self, name):
+        """区間の直近の所要時間（ms）を古い順に取得"""
+        samples = self._samples.get(name)
+        if samples is None:
+            return []
+        count = min(self._frame_count, self.history)
+        ordered = samples[self._index:] + samples[:self._index]
+        return ordered[self.history - count:]
+    
+    def get_stats(self):
+        """
+        区間ごとの直近の統計を取得
+        
+        Returns:
+            dict: 区間名 → {'last': 直前のフレーム, 'avg': 平均, 'max': 最大}（ms）。フレーム全体は'frame'
+        """
+        count = min(self._frame_count, self.history)
+        if count == 0:
+            return {}
+        
+        last_index = (self._index - 1) % self.history
+        stats = {}
+        for name, samples in self._samples.items():
+            stats[name] = {
+                'last': samples[last_index],
+                'avg': self._sums[name] / count,
+                'max': max(samples) if count == self.history else max(self.get_history(name))
+            }
+        return stats
+    
+    def reset(self):
+        """記録をすべて消去"""
+        self._samples.clear()
+        self._sums.clear()
+        self._current.clear()
+        self._counters.clear()
+        self._index = 0
+        self._frame_count = 0
+        self._frame_start = None
@@ -0,0 +1,41 @@
+"""
+ゲーム時計モジュール
+単一責任の原則：ゲームロジックが参照する経過時間（ms）の提供のみを担当
+"""
+
+import pygame
+
+
+class GameClock:
+    """
+    ゲームロジックが参照する経過時間を提供するクラス
+    
+    GameEngineは固定の時間刻みの合計を使う（フレームレートや処理落ちでゲームの進み方が変わらず、リプレイも記録時と一致させるため）。
+    use_simulated_timeを呼ぶまではpygameの実時間を返す
+    """
+    
+    # 時間刻みの合計（ms）。Noneの場合は実時間
+    _simulated_ticks = None
+    
+    @classmethod
+    def get_ticks(cls):
+        """経過時間（ms）を取得"""
+        if cls._simulated_ticks is None:
+            return pygame.time.get_ticks()
+        return cls._simulated_ticks
+    
+    @classmethod
+    def use_simulated_time(cls, start=0):
+        """時間刻みの合計を使う"""
+        cls._simulated_ticks = start
+    
+    @classmethod
+    def use_real_time(cls):
+        """実時間に戻す"""
+        cls._simulated_ticks = None
+    
+    @classmethod
+    def advance(cls, dt):
+        """時間刻みを加算（実時間を使っている場合は何もしない）"""
+        if cls._simulated_ticks is not None:
+            cls._simulated_ticks += dt
@@ -0,0 +1,84 @@
+"""
+入力記録モジュール
+単一責任の原則：フレームごとの入力・経過時間と乱数のシードの保持と、ファイルへの保存・読み込みのみを担当
+"""
+
+import json
+import pygame
+
+
+class InputRecording:
+    """記録したフレームごとの入力を保持し、リプレイ時に順に取り出すクラス"""
+    
+    # 押し続けている状態を記録するキー（ゲームがget_pressedで参照するもの）
+    TRACKED_KEYS = (pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT, pygame.K_f)
+    # 記録するイベントの種類
+    RECORDED_EVENTS = (pygame.KEYDOWN, pygame.KEYUP, pygame.QUIT)
+    
+    def __init__(self, seed):
+        """
+        Args:
+            seed: ゲームの乱数生成器のシード
+        """
+        self.seed = seed
+        # フレームごとの ([(イベントの種類, キー), ...], 押し続けているキーのリスト, 経過時間ms)
+        self.frames = []
+        # リプレイで次に取り出すフレーム
+        self._position = 0
+    
+    def add_frame(self, events, held_keys, dt):
+        """フレームの入力を追加"""
+        self.frames.append((
+            [(event.type, getattr(event, 'key', 0)) for event in events if event.type in self.RECORDED_EVENTS],
+            list(held_keys),
+            dt
+        ))
+    
+    def next_frame(self):
+        """
+        次のフレームの入力を取り出す
+        
+        Returns:
+            tuple: (イベントのリスト, 押し続けているキーのリスト, 経過時間ms)。最後まで再生した場合はNone
+        """
+        if self._position >= len(self.frames):
+            return None
+        
+        events, held_keys, dt = self.frames[self._position]
+        self._position += 1
+        return [self._create_event(event_type, key) for event_type, key in events], held_keys, dt
+    
+    def _create_event(self, event_type, key):
+        """記録した種類とキーからイベントを作り直す"""
+        if event_type == pygame.QUIT:
+            return pygame.event.Event(event_type)
+        return pygame.event.Event(event_type, key=key, mod=0, unicode='')
+    
+    def is_finished(self):
+        """最後まで再生したかどうか"""
+        return self._position >= len(self.frames)
+    
+    def rewind(self):
+        """最初から再生し直す"""
+        self._position = 0
+    
+    def save(self, path):
+        """JSONファイルに保存"""
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({'seed': self.seed, 'frames': self.frames}, f)
+        except Exception as e:
+            print(f"入力記録の保存に失敗しました: {e}")
+    
+    @classmethod
+    def load(cls, path):
+        """JSONファイルから読み込む"""
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        
+        recording = cls(data['seed'])
+        recording.frames = [
+            ([tuple(event) for event in events], held_keys, dt)
+            for events, held_keys, dt in data['frames']
+        ]
+        return recording
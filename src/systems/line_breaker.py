@@ -0,0 +1,141 @@
+"""
+改行位置決定モジュール
+単一責任の原則：禁則処理に従ったテキストの折り返し位置の決定と、文字幅・折り返し結果のキャッシュのみを担当
+"""
+
+from collections import OrderedDict
+
+from src.entities.entities import GameConfig
+
+
+class LineBreaker:
+    """フォントごとの文字幅の表を使い、日本語の禁則処理に従ってテキストを線形時間で折り返すクラス"""
+    
+    # 行頭に置かない文字（閉じ括弧・句読点・小書きの仮名・長音など）
+    NO_LINE_START = frozenset(
+        "、。，．・：；？！ー―…‥〜」』）］｝〕〉》】〙〗ゝゞヽヾ々"
+        "ぁぃぅぇぉっゃゅょゎゕゖァィゥェォッャュョヮヵヶ"
+        ",.:;!?)]}%"
+    )
+    # 行末に置かない文字（開き括弧）
+    NO_LINE_END = frozenset("「『（［｛〔〈《【〘〖([{")
+    
+    def __init__(self, max_layouts=GameConfig.LINE_LAYOUT_CACHE_SIZE):
+        """
+        Args:
+            max_layouts: 保持する折り返し結果の最大数
+        """
+        self.max_layouts = max_layouts
+        
+        # フォント → {文字: 送り幅}（初めて出てきた文字だけフォントに問い合わせる）
+        self._advances = {}
+        # (テキスト, 折り返し幅, フォント) → 行のリスト。末尾ほど最近使用
+        self._layouts = OrderedDict()
+    
+    def get_advances(self, font, text):
+        """各文字の送り幅（px）のリストを取得"""
+        table = self._advances.setdefault(font, {})
+        missing = ''.join(sorted(set(text) - table.keys()))
+        if missing:
+            # 未登録の文字はまとめて1回で問い合わせる
+            for char, metrics in zip(missing, font.metrics(missing)):
+                table[char] = metrics[4] if metrics else font.size(char)[0]
+        return [table[char] for char in text]
+    
+    def wrap(self, text, font, max_width=None):
+        """
+        テキストを折り返す（同じテキスト・幅・フォントの結果は再利用する）
+        
+        Args:
+            text: 折り返すテキスト（改行文字でも改行する）
+            font: 幅の計算に使うフォント
+            max_width: 折り返す幅（Noneの場合は改行文字でのみ改行）
+        
+        Returns:
+            list: (テキストでの開始位置, 行の文字列) のリスト（改行位置の空白と改行文字はどの行にも含めない）
+        """
+        key = (text, max_width, font)
+        lines = self._layouts.get(key)
+        if lines is not None:
+            self._layouts.move_to_end(key)
+            return lines
+        
+        lines = self._layout(text, font, max_width)
+        self._layouts[key] = lines
+        if len(self._layouts) > self.max_layouts:
+            self._layouts.popitem(last=False)
+        return lines
+    
+    def _layout(self, text, font, max_width):
+        """先頭から順に文字幅を足し、はみ出した文字の手前で最後に改行できる位置で改行する"""
+        # prefix[i]: 先頭からi文字の幅
+        prefix = [0]
+        for advance in self.get_advances(font, text):
+            prefix.append(prefix[-1] + advance)
+        
+        lines = []
+        length = len(text)
+        start = 0
+        last_break = None
+        index = 0
+        while index < length:
+            char = text[index]
+            
+            if char == '\n':
+                lines.append(self._make_line(text, start, index))
+                start = index + 1
+                last_break = None
+                index = start
+                continue
+            
+            if index > start and self._can_break(text[index - 1], char):
+                last_break = index
+            
+            # 空白ははみ出しても次の行に送らない（行末で切り捨てる）
+            if (max_width is not None and index > start and char != ' '
+                    and prefix[index + 1] - prefix[start] > max_width):
+                if last_break is not None and last_break > start:
+                    end = last_break
+                else:
+                    # 改行できる位置がない場合は強制的に改行（行頭禁則の文字は前の行にぶら下げる）
+                    end = index
+                    while end < length and text[end] in self.NO_LINE_START:
+                        end += 1
+                lines.append(self._make_line(text, start, end))
+                
+                # 次の行は空白を飛ばして始める（はみ出した位置までの文字は次の行で数え直す）
+                start = end
+                while start < length and text[start] == ' ':
+                    start += 1
+                last_break = None
+                index = start
+                continue
+            
+            index += 1
+        
+        if start < length:
+            lines.append(self._make_line(text, start, length))
+        return lines
+    
+    def _make_line(self, text, start, end):
+        """行末の空白を除いた行を作る"""
+        return start, text[start:end].rstrip(' ')
+    
+    def _can_break(self, previous, char):
+        """previousとcharの間で改行できるかどうか"""
+        if previous == ' ':
+            return char != ' '
+        if char == ' ' or char in self.NO_LINE_START or previous in self.NO_LINE_END:
+            return False
+        # 英数字どうしの間（単語の途中）では改行しない
+        return self._is_wide(previous) or self._is_wide(char)
+    
+    @staticmethod
+    def _is_wide(char):
+        """日本語など文字ごとに改行できる文字かどうか（CJKの記号・仮名・漢字・全角文字）"""
+        return ord(char) >= 0x2E80
+    
+    def clear(self):
+        """キャッシュを空にする"""
+        self._advances.clear()
+        self._layouts.clear()
@@ -0,0 +1,150 @@
+"""
+マップベイクモジュール
+単一責任の原則：TMXマップから合成済みスタックとタイルグリッドを生成することのみを担当
+"""
+
+import hashlib
+
+import pygame
+import pytmx
+from src.entities.entities import GameConfig
+from src.systems.map_cache import MapCache
+from src.systems.tile_animator import TileAnimator
+from src.systems.tile_grid import TileGrid
+
+
+class BakedMap:
+    """ベイク済みマップ - 合成済みスタックサーフェスとタイルグリッド、タイルアニメーションを保持"""
+    
+    def __init__(self, map_name, stacks, tile_grid, layer_names, tile_animator):
+        self.map_name = map_name
+        self.stacks = stacks
+        self.tile_grid = tile_grid
+        self.layer_names = layer_names
+        self.tile_animator = tile_animator
+
+
+class MapBaker:
+    """TMXマップのベイクとキャッシュを管理するクラス"""
+    
+    # 描画先レイヤーの一覧（backgroundのみ不透明）
+    LAYER_NAMES = ('background', 'obstacles', 'grassy_bottom', 'grassy_top')
+    # プレイヤーの描画位置で分けたスタック（groundはプレイヤーより下、overlayは草むらにいるときプレイヤーより上）
+    STACK_NAMES = ('ground', 'overlay')
+    # overlayに重ねる順序（フィールドの描画順と同じ）
+    OVERLAY_LAYERS = ('grassy_top', 'grassy_bottom', 'obstacles')
+    
+    def __init__(self, map_cache=None):
+        self.map_cache = map_cache or MapCache()
+    
+    def bake(self, map_name, layer_targets):
+        """
+        マップをベイクする（キャッシュが有効ならそれを使う）
+        
+        Args:
+            map_name: GameConfig.MAP_FILESのマップ名
+            layer_targets: TMXレイヤー名→描画先レイヤー名の辞書（未定義はbackground）
+        
+        Returns:
+            BakedMap: ベイク済みマップ（スタックはスケール前）
+        """
+        if not GameConfig.MAP_CACHE_ENABLED:
+            return self._bake_from_tmx(map_name, layer_targets)
+        
+        tmx_path = GameConfig.MAP_FILES[map_name]
+        source_files = self.map_cache.get_source_files(tmx_path)
+        layer_key = repr(sorted(layer_targets.items()))
+        # タイルグリッドに書き込む扉のトリガーも設定ファイル側のソースとしてキーに含める
+        trigger_key = repr(sorted(GameConfig.MAP_TRIGGERS.get(map_name, {}).items()))
+        source_key = self.map_cache.get_source_key(source_files, f"{layer_key}:{trigger_key}")
+        # 描画先レイヤーの割り当てが違うベイク結果は別のファイルに保存する（同じマップを交互に上書きしない）
+        cache_name = f"{map_name}_{hashlib.sha1(layer_key.encode('utf-8')).hexdigest()[:8]}"
+        
+        cached = self.map_cache.load(cache_name, source_key)
+        if cached:
+            stacks, tile_grid, extra = cached
+            tile_animator = TileAnimator.deserialize(extra['tile_animator'])
+            return BakedMap(map_name, stacks, tile_grid, extra.get('layer_names', []), tile_animator)
+        
+        baked_map = self._bake_from_tmx(map_name, layer_targets)
+        self.map_cache.save(cache_name, source_key, baked_map.stacks, baked_map.tile_grid, {
+            'layer_names': baked_map.layer_names,
+            'tile_animator': baked_map.tile_animator.serialize()
+        })
+        return baked_map
+    
+    def scale_stacks(self, stacks):
+        """
+        合成済みスタックをゲームのスケールに合わせて拡大
+        
+        groundにoverlayを重ねたcompositedスタック（草むらにいないときに1回で描画する用）も追加する
+        """
+        composited = stacks['ground'].copy()
+        composited.blit(stacks['overlay'], (0, 0))
+        
+        width, height = stacks['ground'].get_size()
+        scaled_size = (width * GameConfig.SCALE, height * GameConfig.SCALE)
+        scaled_stacks = {name: pygame.transform.scale(surface, scaled_size) for name, surface in stacks.items()}
+        scaled_stacks['composited'] = pygame.transform.scale(composited, scaled_size)
+        return scaled_stacks
+    
+    def _bake_from_tmx(self, map_name, layer_targets):
+        """TMXを読み込み、レイヤーをスタックに合成してタイルグリッドを構築（スケール前）"""
+        tmx_data = pytmx.load_pygame(GameConfig.MAP_FILES[map_name])
+        width = tmx_data.width * GameConfig.TILE_SIZE
+        height = tmx_data.height * GameConfig.TILE_SIZE
+        
+        layers = self._compose_layers(tmx_data, layer_targets, width, height)
+        stacks = self._build_stacks(layers, width, height)
+        
+        tile_grid = TileGrid(tmx_data.width, tmx_data.height, GameConfig.TILE_SIZE * GameConfig.SCALE)
+        tile_grid.load_tmx(tmx_data)
+        for (tile_x, tile_y), target in GameConfig.MAP_TRIGGERS.get(map_name, {}).items():
+            tile_grid.add_trigger(tile_x, tile_y, target)
+        
+        tile_animator = TileAnimator()
+        tile_animator.load_tmx(tmx_data, self._get_stack_layers(tmx_data, layer_targets))
+        
+        layer_names = [layer.name for layer in tmx_data.visible_layers if hasattr(layer, 'name')]
+        return BakedMap(map_name, stacks, tile_grid, layer_names, tile_animator)
+    
+    def _compose_layers(self, tmx_data, layer_targets, width, height):
+        """タイルを描画先レイヤーごとのサーフェスに合成"""
+        surfaces = {}
+        for name in self.LAYER_NAMES:
+            flags = 0 if name == 'background' else pygame.SRCALPHA
+            surfaces[name] = pygame.Surface((width, height), flags)
+            surfaces[name].fill((0, 0, 0, 0))
+        
+        for layer in tmx_data.visible_layers:
+            if not hasattr(layer, 'data'):
+                continue
+            
+            target_surface = surfaces[layer_targets.get(layer.name, 'background')]
+            for x, y, gid in layer:
+                # gidが0の場合はタイルなし
+                if gid:
+                    tile = tmx_data.get_tile_image_by_gid(gid)
+                    if tile:
+                        target_surface.blit(tile, (x * GameConfig.TILE_SIZE, y * GameConfig.TILE_SIZE))
+        
+        return surfaces
+
+    def _get_stack_layers(self, tmx_data, layer_targets):
+        """スタックごとに、そのスタックに描画されるTMXタイルレイヤーを描画順に並べる"""
+        tile_layers = [layer for layer in tmx_data.visible_layers if hasattr(layer, 'data')]
+        targets = {layer.name: layer_targets.get(layer.name, 'background') for layer in tile_layers}
+        
+        return {
+            'ground': [layer for layer in tile_layers if targets[layer.name] == 'background'],
+            'overlay': [layer for name in self.OVERLAY_LAYERS for layer in tile_layers if targets[layer.name] == name]
+        }
+    
+    def _build_stacks(self, layers, width, height):
+        """描画先レイヤーをプレイヤーとの前後関係ごとのスタックにまとめる"""
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 0))
+        for name in self.OVERLAY_LAYERS:
+            overlay.blit(layers[name], (0, 0))
+        
+        return {'ground': layers['background'], 'overlay': overlay}
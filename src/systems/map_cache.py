@@ -0,0 +1,131 @@
+"""
+マップキャッシュモジュール
+単一責任の原則：ベイク済みマップのディスクへの保存と読み込みのみを担当
+"""
+
+import hashlib
+import os
+import pickle
+import zlib
+import xml.etree.ElementTree as ET
+
+import pygame
+from src.entities.entities import GameConfig
+from src.managers.resource_manager import ResourceManager
+from src.systems.tile_grid import TileGrid
+
+
+class MapCache:
+    """ベイク済みマップ（合成済みレイヤー画素とタイルグリッド）をファイルに保存するクラス"""
+    
+    # キャッシュ形式のバージョン（形式やベイク内容を変えたら上げる）
+    CACHE_VERSION = 3
+    
+    def __init__(self, cache_dir=GameConfig.MAP_CACHE_DIR):
+        self.cache_dir = cache_dir
+    
+    def get_source_files(self, tmx_path):
+        """TMXファイルと、そこから参照されるタイルセット・画像ファイルの一覧を取得"""
+        source_files = [tmx_path]
+        pending = [tmx_path]
+        
+        while pending:
+            path = pending.pop()
+            base_dir = os.path.dirname(path)
+            root = ET.parse(path).getroot()
+            
+            for element in root.iter():
+                source = element.get('source')
+                if element.tag not in ('tileset', 'image') or not source:
+                    continue
+                
+                source_path = os.path.normpath(os.path.join(base_dir, source))
+                if source_path in source_files:
+                    continue
+                source_files.append(source_path)
+                
+                # 外部タイルセット（.tsx）はさらに画像を参照する
+                if element.tag == 'tileset':
+                    pending.append(source_path)
+        
+        return source_files
+    
+    def get_source_key(self, source_files, extra=""):
+        """ソースファイルの内容からキャッシュキーを計算"""
+        digest = hashlib.sha1(f"{self.CACHE_VERSION}:{GameConfig.SCALE}:{extra}".encode('utf-8'))
+        for path in source_files:
+            digest.update(path.encode('utf-8'))
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        return digest.hexdigest()
+    
+    def _get_cache_path(self, cache_name):
+        """キャッシュファイルのパスを取得"""
+        return os.path.join(self.cache_dir, f"{cache_name}.bake")
+    
+    def load(self, cache_name, source_key):
+        """
+        キャッシュを読み込む
+        
+        Args:
+            cache_name: キャッシュ名（マップ名と描画先レイヤーの割り当てから作る）
+            source_key: get_source_keyで計算したキー
+        
+        Returns:
+            tuple: (レイヤー名→サーフェスの辞書, TileGrid, 追加情報の辞書)。無効な場合はNone
+        """
+        cache_path = self._get_cache_path(cache_name)
+        if not os.path.exists(cache_path):
+            return None
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                data = pickle.loads(zlib.decompress(f.read()))
+        except (OSError, zlib.error, pickle.UnpicklingError, EOFError) as e:
+            print(f"マップキャッシュの読み込みに失敗しました: {e}")
+            return None
+        
+        # バージョンまたはソースが変わっていれば再ベイクが必要
+        if data.get('version') != self.CACHE_VERSION or data.get('source_key') != source_key:
+            return None
+        
+        layers = {
+            name: self._surface_from_bytes(pixels, size, has_alpha)
+            for name, (pixels, size, has_alpha) in data['layers'].items()
+        }
+        tile_grid = TileGrid.deserialize(data['tile_grid'])
+        return layers, tile_grid, data.get('extra', {})
+    
+    def save(self, cache_name, source_key, layers, tile_grid, extra=None):
+        """ベイク結果をキャッシュに保存"""
+        data = {
+            'version': self.CACHE_VERSION,
+            'source_key': source_key,
+            'layers': {name: self._surface_to_bytes(surface) for name, surface in layers.items()},
+            'tile_grid': tile_grid.serialize(),
+            'extra': extra or {}
+        }
+        
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # 書き込み途中のファイルを読まないよう、一時ファイルから置き換える
+            cache_path = self._get_cache_path(cache_name)
+            temp_path = f"{cache_path}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(zlib.compress(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL), 1))
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            print(f"マップキャッシュの保存に失敗しました: {e}")
+    
+    def _surface_to_bytes(self, surface):
+        """サーフェスを画素バイト列に変換"""
+        has_alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+        pixel_format = 'RGBA' if has_alpha else 'RGB'
+        return pygame.image.tobytes(surface, pixel_format), surface.get_size(), has_alpha
+    
+    def _surface_from_bytes(self, pixels, size, has_alpha):
+        """画素バイト列からサーフェスを復元"""
+        surface = pygame.image.frombytes(pixels, size, 'RGBA' if has_alpha else 'RGB')
+        
+        # 画面が初期化済みなら表示形式に変換して描画を高速化
+        return ResourceManager.convert_surface(surface)
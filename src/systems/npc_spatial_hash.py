@@ -0,0 +1,175 @@
+"""
+NPC空間ハッシュモジュール
+単一責任の原則：マップ上のNPCをタイル単位のバケットに振り分け、近くのNPCだけを検索することのみを担当
+"""
+
+from src.entities.entities import GameConfig
+
+
+class NpcSpatialHash:
+    """1枚のマップのNPCをタイルのバケットで管理し、衝突判定や会話相手の検索で近くのバケットだけを調べるクラス"""
+    
+    def __init__(self, npcs=(), cell_size=None):
+        """
+        Args:
+            npcs: 最初に登録するNPCのリスト
+            cell_size: バケット1つのピクセル数（Noneの場合はスケール後の1タイル）
+        """
+        self.cell_size = cell_size or GameConfig.TILE_SIZE * GameConfig.SCALE
+        # バケット座標 → NPCのリスト
+        self._buckets = {}
+        # NPC → 登録先のバケット座標のタプル
+        self._cells = {}
+        # NPC → 登録順（検索結果を描画順・会話の優先順にそろえるため）
+        self._order = {}
+        self._next_order = 0
+        # 移動アニメーション中のNPC（画面外でも更新が必要）
+        self._moving = set()
+        
+        for npc in npcs:
+            self.add(npc)
+    
+    def __len__(self):
+        return len(self._order)
+    
+    def __iter__(self):
+        """登録順にすべてのNPCを返す"""
+        return iter(list(self._order))
+    
+    def add(self, npc):
+        """NPCを登録し、移動時にバケットを更新するようNPCに自身を設定"""
+        if npc in self._order:
+            return
+        self._order[npc] = self._next_order
+        self._next_order += 1
+        self._cells[npc] = ()
+        npc.spatial_hash = self
+        self.update(npc)
+    
+    def remove(self, npc):
+        """NPCの登録を解除"""
+        if npc not in self._order:
+            return
+        self._set_cells(npc, ())
+        del self._cells[npc]
+        del self._order[npc]
+        self._moving.discard(npc)
+        if npc.spatial_hash is self:
+            npc.spatial_hash = None
+    
+    def update(self, npc):
+        """NPCの位置と移動状態の変化をバケットに反映（位置が同じバケット内なら何もしない）"""
+        if npc not in self._order:
+            return
+        
+        if npc.is_moving:
+            self._moving.add(npc)
+        else:
+            self._moving.discard(npc)
+        
+        cells = self._get_cells(int(npc.x), int(npc.y), npc.width, npc.height)
+        if cells != self._cells[npc]:
+            self._set_cells(npc, cells)
+    
+    def _get_cells(self, left, top, width, height):
+        """矩形が重なるバケット座標のタプルを取得"""
+        size = self.cell_size
+        return tuple(
+            (cell_x, cell_y)
+            for cell_y in range(top // size, (top + height - 1) // size + 1)
+            for cell_x in range(left // size, (left + width - 1) // size + 1)
+        )
+    
+    def _set_cells(self, npc, cells):
+        """NPCを古いバケットから外して新しいバケットに入れる"""
+        for cell in self._cells[npc]:
+            bucket = self._buckets[cell]
+            bucket.remove(npc)
+            if not bucket:
+                del self._buckets[cell]
+        for cell in cells:
+            self._buckets.setdefault(cell, []).append(npc)
+        self._cells[npc] = cells
+    
+    def query_rect(self, left, top, width, height):
+        """
+        矩形と重なるバケットにいるNPCを取得（候補なので厳密な判定は呼び出し側で行う）
+        
+        Returns:
+            list: 登録順に並べたNPCのリスト
+        """
+        size = self.cell_size
+        left = int(left)
+        top = int(top)
+        found = set()
+        for cell_y in range(top // size, (top + int(height) - 1) // size + 1):
+            for cell_x in range(left // size, (left + int(width) - 1) // size + 1):
+                bucket = self._buckets.get((cell_x, cell_y))
+                if bucket:
+                    found.update(bucket)
+        return sorted(found, key=self._order.__getitem__)
+    
+    def query_near(self, x, y, radius):
+        """座標から縦横radiusピクセル以内にいるNPCの候補を取得"""
+        return self.query_rect(x - radius, y - radius, radius * 2 + 1, radius * 2 + 1)
+    
+    def get_active(self, left, top, width, height):
+        """矩形内のNPCと移動中のNPCを登録順に取得（アニメーション更新用）"""
+        found = set(self.query_rect(left, top, width, height)) | self._moving
+        return sorted(found, key=self._order.__getitem__)
+    
+    def check_collision(self, player_x, player_y, new_x, new_y, size):
+        """
+        プレイヤーの移動先がNPCと衝突するかチェック（移動範囲のバケットにいるNPCだけを調べる）
+        
+        Args:
+            player_x, player_y: プレイヤーの現在の左上座標
+            new_x, new_y: プレイヤーの移動先の左上座標
+            size: プレイヤーの当たり判定の一辺のピクセル数
+        """
+        left = int(min(player_x, new_x))
+        top = int(min(player_y, new_y))
+        width = int(max(player_x, new_x)) + size - left
+        height = int(max(player_y, new_y)) + size - top
+        npcs = self.query_rect(left, top, width, height)
+        return self.check_collision_among(npcs, player_x, player_y, new_x, new_y, size)
+    
+    @staticmethod
+    def check_collision_among(npcs, player_x, player_y, new_x, new_y, size):
+        """
+        指定したNPCの中でプレイヤーの移動先と衝突するものがあるかチェック（矩形を作らず整数で判定）
+        
+        現在位置でNPCと重なっている場合は、NPCから離れる方向の移動を許可する
+        """
+        # pygame.Rectと同じく座標は整数に切り捨てる
+        current_x, current_y = int(player_x), int(player_y)
+        new_x, new_y = int(new_x), int(new_y)
+        half = size // 2
+        
+        for npc in npcs:
+            # 非表示のNPCとは衝突しない
+            if not npc.visible:
+                continue
+            
+            npc_x, npc_y = int(npc.x), int(npc.y)
+            npc_right = npc_x + npc.width
+            npc_bottom = npc_y + npc.height
+            
+            # 現在位置でNPCと重なっている場合は、NPCから離れる方向の移動を許可
+            if (current_x < npc_right and npc_x < current_x + size
+                    and current_y < npc_bottom and npc_y < current_y + size):
+                npc_center_x = npc_x + npc.width // 2
+                npc_center_y = npc_y + npc.height // 2
+                current_dx = current_x + half - npc_center_x
+                current_dy = current_y + half - npc_center_y
+                new_dx = new_x + half - npc_center_x
+                new_dy = new_y + half - npc_center_y
+                if new_dx * new_dx + new_dy * new_dy >= current_dx * current_dx + current_dy * current_dy:
+                    continue
+            
+            # 新しい位置でNPCと衝突する場合は移動を禁止
+            if (new_x < npc_right and npc_x < new_x + size
+                    and new_y < npc_bottom and npc_y < new_y + size):
+                return True
+        
+        return False
@@ -5,6 +5,7 @@
 
 import pygame
 from src.entities.entities import GameConfig
+from src.systems.tile_grid import TileGrid
 
 
 class PlayerMovement:
@@ -53,11 +54,11 @@ class PlayerMovement:
         # 方向を更新（移動できなくても向きは変える）
         self.player.direction = direction
         
-        # 衝突判定をチェック
-        if current_map and not self.collision_checker.can_move_to(
-            self.player, new_x, new_y, current_map, npcs
-        ):
-            return False
+        # 衝突判定をチェック（歩行不可タイルの手前まで進み、NPCに当たる場合は移動しない）
+        if current_map:
+            new_x, new_y = self.collision_checker.sweep(self.player, dx, dy, current_map)
+            if self.collision_checker.collides_with_npc(self.player, new_x, new_y, current_map, npcs):
+                return False
         
         # 移動実行
         old_x, old_y = self.player.x, self.player.y
@@ -79,26 +80,76 @@ class CollisionChecker:
     
     def can_move_to(self, player, new_x, new_y, current_map, npcs=None):
         """指定された位置に移動可能かチェック"""
-        collision_points = self._get_collision_points(player, new_x, new_y)
-        
-        # マップとの衝突をチェック
-        for point_x, point_y in collision_points:
-            if not current_map.is_walkable(point_x, point_y):
-                return False
-        
-        # NPCとの衝突をチェック
-        if npcs and current_map.check_npc_collision(player.x, player.y, npcs, new_x, new_y):
+        # 途中で歩行不可タイルに当たらずに移動先まで進めるか
+        if self.sweep(player, new_x - player.x, new_y - player.y, current_map) != (new_x, new_y):
             return False
         
-        return True
+        # NPCとの衝突をチェック
+        return not self.collides_with_npc(player, new_x, new_y, current_map, npcs)
     
-    def _get_collision_points(self, player, x, y):
-        """プレイヤーの当たり判定ポイントを取得"""
+    def collides_with_npc(self, player, new_x, new_y, current_map, npcs=None):
+        """指定された位置でNPCと衝突するかチェック"""
+        return bool(npcs) and current_map.check_npc_collision(player.x, player.y, npcs, new_x, new_y)
+    
+    def sweep(self, player, dx, dy, current_map):
+        """
+        当たり判定の矩形を移動方向に掃引し、歩行不可タイルに当たる手前の位置を取得
+        
+        通過するタイルの列（行）をすべて調べるため、移動速度が1タイルを超えても障害物をすり抜けない
+        
+        Args:
+            player: プレイヤー
+            dx, dy: 移動量（横→縦の順に解決）
+            current_map: タイル属性フラグを取得できるマップ
+        
+        Returns:
+            tuple: 移動できる最も遠い位置 (x, y)
+        """
         margin = 6 * GameConfig.SCALE
+        left = player.x + margin
+        right = player.x + player.width - margin
+        top = player.y + margin
+        bottom = player.y + player.height - margin
+        
+        dx = self._sweep_axis(current_map, left, right, top, bottom, dx, True)
+        dy = self._sweep_axis(current_map, top, bottom, left + dx, right + dx, dy, False)
+        return player.x + dx, player.y + dy
+    
+    def _sweep_axis(self, current_map, start, end, side_start, side_end, delta, horizontal):
+        """
+        1軸の移動量を、最初に当たる歩行不可タイルの手前までに切り詰める
+        
+        Args:
+            start, end: 移動軸方向の当たり判定の両端（端のピクセルを含む）
+            side_start, side_end: もう一方の軸の当たり判定の両端（端のピクセルを含む）
+            delta: 移動量
+            horizontal: 横方向の移動かどうか
+        """
+        if not delta:
+            return delta
+        
+        size = current_map.scaled_tile_width
+        side_first = int(side_start // size)
+        side_last = int(side_end // size)
+        
+        if delta > 0:
+            # 前端が新しく入るタイルを近い順に調べる
+            tile = int(end // size) + 1
+            last = int((end + delta) // size)
+            step = 1
+        else:
+            tile = int(start // size) - 1
+            last = int((start + delta) // size)
+            step = -1
+        
+        while tile * step <= last * step:
+            side = side_first
+            while side <= side_last:
+                flags = current_map.get_tile_flags(tile, side) if horizontal else current_map.get_tile_flags(side, tile)
+                if not flags & TileGrid.WALKABLE:
+                    # 当たったタイルの1ピクセル手前（左・上向きはタイルの右・下端の次のピクセル）まで
+                    return tile * size - 1 - end if step > 0 else (tile + 1) * size - start
+                side += 1
+            tile += step
         
-        return [
-            (x + margin, y + margin),  # 左上
-            (x + player.width - margin, y + margin),  # 右上
-            (x + margin, y + player.height - margin),  # 左下
-            (x + player.width - margin, y + player.height - margin),  # 右下
-        ]
\ No newline at end of file
+        return delta
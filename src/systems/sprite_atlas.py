@@ -0,0 +1,53 @@
+"""
+スプライトアトラスモジュール
+単一責任の原則：スプライトシートを一度だけ切り出し、スケール・反転済みのフレームを（向き, フレーム）で引くことのみを担当
+"""
+
+import pygame
+from src.managers.resource_manager import ResourceManager
+
+
+class SpriteAtlas:
+    """スプライトシートの全フレームを事前に表示サイズへ加工して保持し、アニメーション中に画像を作らないようにするクラス"""
+    
+    def __init__(self, sprite_sheet, frame_size, size, layout, default_direction="down"):
+        """
+        Args:
+            sprite_sheet: スプライトシートのサーフェス
+            frame_size: スプライトシートでの1フレームの (幅, 高さ)
+            size: 表示サイズ (幅, 高さ)
+            layout: (向き, フレーム, 行, 列, 左右反転) のタプル
+            default_direction: 定義されていない向きの代わりに使う向き
+        """
+        self.size = size
+        self.default_direction = default_direction
+        
+        # (向き, フレーム) → 表示サイズの画像
+        self._frames = {}
+        # 同じセルを複数の(向き, フレーム)で使う場合は同じ画像を共有する
+        cut = {}
+        for direction, frame, row, col, flip in layout:
+            key = (row, col, flip)
+            if key not in cut:
+                cut[key] = self._cut_frame(sprite_sheet, frame_size, row, col, flip)
+            self._frames[(direction, frame)] = cut[key]
+    
+    def _cut_frame(self, sprite_sheet, frame_size, row, col, flip):
+        """スプライトシートから1フレームを切り出し、反転・拡大して画面の形式に変換"""
+        frame_width, frame_height = frame_size
+        sprite_rect = pygame.Rect(col * frame_width, row * frame_height, frame_width, frame_height)
+        
+        sprite = pygame.Surface(frame_size, pygame.SRCALPHA)
+        sprite.blit(sprite_sheet, (0, 0), sprite_rect)
+        
+        if flip:
+            sprite = pygame.transform.flip(sprite, True, False)
+        
+        return ResourceManager.convert_surface(pygame.transform.scale(sprite, self.size))
+    
+    def get_frame(self, direction, frame):
+        """指定された向きとフレームの画像を取得（定義されていない向きは既定の向き）"""
+        image = self._frames.get((direction, frame))
+        if image is None:
+            image = self._frames[(self.default_direction, frame)]
+        return image
@@ -0,0 +1,188 @@
+"""
+タイルアニメーションモジュール
+単一責任の原則：アニメーションするタイルの位置と表示フレームの管理、該当タイルだけの再描画のみを担当
+"""
+
+import pygame
+from src.entities.entities import GameConfig
+from src.managers.resource_manager import ResourceManager
+
+
+class TileAnimator:
+    """Tiledのタイルアニメーションを読み込み、スケール済みスタックのアニメーションするタイルだけを描き直すクラス"""
+    
+    def __init__(self):
+        # gid → [(フレームのgid, 表示時間ms), ...]
+        self.animations = {}
+        # gid → スケール前のタイル画像（アニメーションするセルの描画に使うものだけ）
+        self.images = {}
+        # アニメーションするセル: [(タイルX, タイルY, ((スタック名, gid), ...)), ...]（描画順）
+        self.cells = []
+        # アニメーション経過時間（ms）
+        self.time = 0
+        
+        # gid → アニメーション1周の時間
+        self._durations = {}
+        # チャンク座標 → セルの添字リスト（画面内のセルだけを調べるため）
+        self._chunks = {}
+        # セルごとに最後に描画したフレームのgid
+        self._drawn_frames = []
+    
+    def load_tmx(self, tmx_data, stack_layers):
+        """
+        TMXデータからアニメーションするタイルの位置を集める
+        
+        Args:
+            tmx_data: pytmxのマップデータ
+            stack_layers: スタック名→そのスタックに描画するTMXタイルレイヤーのリスト（描画順）
+        """
+        layers = [(stack_name, layer) for stack_name, stack in stack_layers.items() for layer in stack]
+        checked = {}
+        
+        for tile_y in range(tmx_data.height):
+            for tile_x in range(tmx_data.width):
+                column = tuple(
+                    (stack_name, layer.data[tile_y][tile_x])
+                    for stack_name, layer in layers if layer.data[tile_y][tile_x]
+                )
+                if any(self._load_animation(tmx_data, gid, checked) for _, gid in column):
+                    self._add_cell(tile_x, tile_y, column)
+                    for _, gid in column:
+                        self._load_image(tmx_data, gid)
+        
+        for frames in self.animations.values():
+            for frame_gid, _ in frames:
+                self._load_image(tmx_data, frame_gid)
+    
+    def _load_animation(self, tmx_data, gid, checked):
+        """タイルのアニメーション定義を読み込み、アニメーションするかどうかを返す"""
+        if gid not in checked:
+            properties = tmx_data.get_tile_properties_by_gid(gid) or {}
+            frames = [(frame.gid, frame.duration) for frame in properties.get('frames', [])]
+            checked[gid] = bool(frames)
+            if frames:
+                self.animations[gid] = frames
+                self._durations[gid] = sum(duration for _, duration in frames)
+        return checked[gid]
+    
+    def _load_image(self, tmx_data, gid):
+        """タイル画像を透過サーフェスとして保持（カラーキー画像も同じ形式にそろえる）"""
+        if gid in self.images:
+            return
+        image = tmx_data.get_tile_image_by_gid(gid)
+        if image:
+            tile = pygame.Surface(image.get_size(), pygame.SRCALPHA)
+            tile.fill((0, 0, 0, 0))
+            tile.blit(image, (0, 0))
+            self.images[gid] = tile
+    
+    def _add_cell(self, tile_x, tile_y, column):
+        """アニメーションするセルを登録"""
+        chunk = (tile_x // GameConfig.MAP_CHUNK_TILES, tile_y // GameConfig.MAP_CHUNK_TILES)
+        self._chunks.setdefault(chunk, []).append(len(self.cells))
+        self.cells.append((tile_x, tile_y, column))
+        self._drawn_frames.append(None)
+    
+    def serialize(self):
+        """キャッシュ保存用の辞書に変換"""
+        return {
+            'animations': self.animations,
+            'images': {
+                gid: (pygame.image.tobytes(image, 'RGBA'), image.get_size())
+                for gid, image in self.images.items()
+            },
+            'cells': self.cells
+        }
+    
+    @classmethod
+    def deserialize(cls, data):
+        """serializeした辞書から復元"""
+        animator = cls()
+        for gid, frames in data['animations'].items():
+            animator.animations[gid] = frames
+            animator._durations[gid] = sum(duration for _, duration in frames)
+        for gid, (pixels, size) in data['images'].items():
+            animator.images[gid] = ResourceManager.convert_surface(pygame.image.frombytes(pixels, size, 'RGBA'))
+        for tile_x, tile_y, column in data['cells']:
+            animator._add_cell(tile_x, tile_y, column)
+        return animator
+    
+    def update(self, dt):
+        """アニメーション時間を進める"""
+        self.time += dt
+    
+    def _get_frame_gid(self, gid):
+        """現在の時間に表示するフレームのgidを取得"""
+        frames = self.animations.get(gid)
+        if not frames or self._durations[gid] <= 0:
+            return gid
+        
+        remaining = self.time % self._durations[gid]
+        for frame_gid, duration in frames:
+            if remaining < duration:
+                return frame_gid
+            remaining -= duration
+        return frames[-1][0]
+    
+    def _get_frames(self, index):
+        """セルの各レイヤーの現在のフレームのgid"""
+        return tuple(self._get_frame_gid(gid) for _, gid in self.cells[index][2])
+    
+    def get_stale_cells(self, tile_rect):
+        """タイル矩形内で、表示フレームが描画済みのものから変わったセルの添字を取得"""
+        if not self.cells:
+            return []
+        
+        chunk_tiles = GameConfig.MAP_CHUNK_TILES
+        stale = []
+        for chunk_y in range(tile_rect.top // chunk_tiles, (tile_rect.bottom - 1) // chunk_tiles + 1):
+            for chunk_x in range(tile_rect.left // chunk_tiles, (tile_rect.right - 1) // chunk_tiles + 1):
+                for index in self._chunks.get((chunk_x, chunk_y), ()):
+                    tile_x, tile_y, _ = self.cells[index]
+                    if tile_rect.collidepoint(tile_x, tile_y) and self._drawn_frames[index] != self._get_frames(index):
+                        stale.append(index)
+        return stale
+    
+    def get_cell_position(self, index):
+        """セルのタイル座標を取得"""
+        tile_x, tile_y, _ = self.cells[index]
+        return tile_x, tile_y
+    
+    def redraw(self, stacks, tile_rect):
+        """
+        タイル矩形内で表示フレームが変わったセルだけをスケール済みスタックに描き直す
+        
+        Args:
+            stacks: スタック名（ground・overlay・composited）→スケール済みサーフェスの辞書
+            tile_rect: 描き直す範囲のタイル矩形（画面に映る範囲）
+        """
+        for index in self.get_stale_cells(tile_rect):
+            self._redraw_cell(index, stacks)
+    
+    def _redraw_cell(self, index, stacks):
+        """セルのレイヤーを現在のフレームで合成し、スケールしてスタックに書き込む"""
+        tile_x, tile_y, column = self.cells[index]
+        frames = self._get_frames(index)
+        tile_size = GameConfig.TILE_SIZE
+        
+        # ベイク時と同じく、groundは黒の不透明、overlayは透明から合成
+        tiles = {
+            'ground': pygame.Surface((tile_size, tile_size)),
+            'overlay': pygame.Surface((tile_size, tile_size), pygame.SRCALPHA)
+        }
+        tiles['overlay'].fill((0, 0, 0, 0))
+        for (stack_name, _), frame_gid in zip(column, frames):
+            image = self.images.get(frame_gid)
+            if image:
+                tiles[stack_name].blit(image, (0, 0))
+        tiles['composited'] = tiles['ground'].copy()
+        tiles['composited'].blit(tiles['overlay'], (0, 0))
+        
+        scaled_tile_size = tile_size * GameConfig.SCALE
+        rect = pygame.Rect(tile_x * scaled_tile_size, tile_y * scaled_tile_size, scaled_tile_size, scaled_tile_size)
+        for stack_name, tile in tiles.items():
+            # 透明部分も含めて画素を置き換える
+            stacks[stack_name].fill((0, 0, 0, 0), rect)
+            stacks[stack_name].blit(pygame.transform.scale(tile, rect.size), rect)
+        
+        self._drawn_frames[index] = frames
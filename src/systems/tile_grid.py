@@ -0,0 +1,177 @@
+"""
+タイルグリッドモジュール
+単一責任の原則：タイル単位の歩行可否・草むら・トリガー情報の保持と検索のみを担当
+"""
+
+
+class TileGrid:
+    """マップ読み込み時に構築するタイル属性グリッド"""
+    
+    # タイル属性のビットフラグ
+    WALKABLE = 1
+    GRASS = 2
+    
+    # 歩行不可とみなすレイヤー
+    BLOCKING_LAYERS = ('obstacles', 'object')
+    # 草むらとみなすレイヤー
+    GRASS_LAYERS = ('grassy_bottom',)
+    
+    def __init__(self, width, height, scaled_tile_size):
+        """
+        Args:
+            width: 横タイル数
+            height: 縦タイル数
+            scaled_tile_size: スケール後の1タイルのピクセル数
+        """
+        self.width = width
+        self.height = height
+        self.scaled_tile_size = scaled_tile_size
+        
+        # 1タイル1バイトのフラグ配列（初期値は歩行不可）
+        self.flags = bytearray(width * height)
+        # トリガーID配列（0はトリガーなし、1以降はtrigger_targetsの添字）
+        self.triggers = bytearray(width * height)
+        self.trigger_targets = [None]
+    
+    def load_tmx(self, tmx_data, offset_x=0, offset_y=0):
+        """TMXデータのレイヤーからフラグを構築"""
+        map_width = min(tmx_data.width, self.width - offset_x)
+        map_height = min(tmx_data.height, self.height - offset_y)
+        
+        # マップ内のタイルは歩行可能で初期化
+        for y in range(map_height):
+            start = (y + offset_y) * self.width + offset_x
+            self.flags[start:start + map_width] = bytes([self.WALKABLE]) * map_width
+        
+        for layer in tmx_data.layers:
+            if not hasattr(layer, 'data'):
+                continue
+            
+            if layer.name in self.BLOCKING_LAYERS:
+                self._apply_layer(layer, map_width, map_height, offset_x, offset_y, clear_flag=self.WALKABLE)
+            elif layer.name in self.GRASS_LAYERS:
+                self._apply_layer(layer, map_width, map_height, offset_x, offset_y, set_flag=self.GRASS)
+    
+    def _apply_layer(self, layer, map_width, map_height, offset_x, offset_y, set_flag=0, clear_flag=0):
+        """タイルが置かれているセルのフラグを更新"""
+        for y in range(map_height):
+            row = layer.data[y]
+            index = (y + offset_y) * self.width + offset_x
+            for x in range(map_width):
+                if row[x] > 0:
+                    self.flags[index + x] = (self.flags[index + x] | set_flag) & ~clear_flag
+    
+    def add_trigger(self, tile_x, tile_y, target):
+        """指定タイルに遷移トリガーを登録"""
+        if target not in self.trigger_targets:
+            self.trigger_targets.append(target)
+        self.triggers[tile_y * self.width + tile_x] = self.trigger_targets.index(target)
+    
+    def paste(self, other, offset_x, offset_y):
+        """別のグリッドを指定タイル位置に書き込む（マップ結合用）"""
+        copy_width = min(other.width, self.width - offset_x)
+        copy_height = min(other.height, self.height - offset_y)
+        
+        for y in range(copy_height):
+            src = y * other.width
+            dst = (y + offset_y) * self.width + offset_x
+            self.flags[dst:dst + copy_width] = other.flags[src:src + copy_width]
+            for x in range(copy_width):
+                trigger_id = other.triggers[src + x]
+                if trigger_id:
+                    self.add_trigger(offset_x + x, offset_y + y, other.trigger_targets[trigger_id])
+    
+    def serialize(self):
+        """キャッシュ保存用の辞書に変換"""
+        return {
+            'width': self.width,
+            'height': self.height,
+            'scaled_tile_size': self.scaled_tile_size,
+            'flags': bytes(self.flags),
+            'triggers': bytes(self.triggers),
+            'trigger_targets': list(self.trigger_targets)
+        }
+    
+    @classmethod
+    def deserialize(cls, data):
+        """serializeした辞書からグリッドを復元"""
+        tile_grid = cls(data['width'], data['height'], data['scaled_tile_size'])
+        tile_grid.flags[:] = data['flags']
+        tile_grid.triggers[:] = data['triggers']
+        tile_grid.trigger_targets = list(data['trigger_targets'])
+        return tile_grid
+    
+    def _get_index(self, x, y):
+        """ピクセル座標をグリッドの添字に変換（範囲外は-1）"""
+        tile_x = int(x / self.scaled_tile_size)
+        tile_y = int(y / self.scaled_tile_size)
+        
+        if tile_x < 0 or tile_x >= self.width or tile_y < 0 or tile_y >= self.height:
+            return -1
+        return tile_y * self.width + tile_x
+    
+    def get_flags(self, x, y):
+        """指定したピクセル座標のフラグを取得（範囲外は0）"""
+        index = self._get_index(x, y)
+        return self.flags[index] if index >= 0 else 0
+    
+    def get_tile_flags(self, tile_x, tile_y):
+        """指定したタイル座標のフラグを取得（範囲外は0）"""
+        if 0 <= tile_x < self.width and 0 <= tile_y < self.height:
+            return self.flags[tile_y * self.width + tile_x]
+        return 0
+    
+    def is_walkable(self, x, y):
+        """指定したピクセル座標が歩行可能かどうか"""
+        return bool(self.get_flags(x, y) & self.WALKABLE)
+    
+    def is_on_grassy(self, x, y):
+        """指定したピクセル座標が草むらかどうか"""
+        return bool(self.get_flags(x, y) & self.GRASS)
+    
+    def get_trigger(self, x, y):
+        """指定したピクセル座標のトリガー遷移先を取得"""
+        index = self._get_index(x, y)
+        if index < 0:
+            return None
+        return self.trigger_targets[self.triggers[index]]
+    
+    def get_nearby_triggers(self, x, y, radius):
+        """指定したピクセル座標から半径radiusタイル以内にあるトリガーの遷移先を取得"""
+        center_x = int(x / self.scaled_tile_size)
+        center_y = int(y / self.scaled_tile_size)
+        start_x = max(0, center_x - radius)
+        end_x = min(self.width, center_x + radius + 1)
+        
+        targets = set()
+        for tile_y in range(max(0, center_y - radius), min(self.height, center_y + radius + 1)):
+            row_start = tile_y * self.width
+            for trigger_id in self.triggers[row_start + start_x:row_start + end_x]:
+                if trigger_id:
+                    targets.add(self.trigger_targets[trigger_id])
+        return targets
+    
+    def query_points(self, xs, ys):
+        """
+        複数のピクセル座標のフラグをまとめて取得する
+        
+        Args:
+            xs: X座標のシーケンス
+            ys: Y座標のシーケンス
+        
+        Returns:
+            bytearray: 各座標のフラグ（範囲外は0）
+        """
+        flags = self.flags
+        size = self.scaled_tile_size
+        width = self.width
+        height = self.height
+        result = bytearray(len(xs))
+        
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            tile_x = int(x / size)
+            tile_y = int(y / size)
+            if 0 <= tile_x < width and 0 <= tile_y < height:
+                result[i] = flags[tile_y * width + tile_x]
+        
+        return result
@@ -0,0 +1,72 @@
+"""
+タイプライター表示モジュール
+単一責任の原則：メッセージ全文の行ごとの描画を一度だけ行い、表示する文字数に応じて切り出して描画することのみを担当
+"""
+
+from itertools import accumulate
+
+import pygame
+
+
+class TypewriterText:
+    """全文を行ごとに描画しておき、1文字ずつ表示するときは描画済みの行を文字幅で切り出して転送するクラス"""
+    
+    def __init__(self, font_manager, font_size, color, max_width=None, line_height=None):
+        """
+        Args:
+            font_manager: フォント管理
+            font_size: フォントサイズ
+            color: 文字色
+            max_width: 折り返す幅（Noneの場合は改行文字でのみ改行）
+            line_height: 行の間隔（Noneの場合はフォントの行の高さ）
+        """
+        self.font_manager = font_manager
+        self.font_size = font_size
+        self.color = color
+        self.max_width = max_width
+        self.line_height = line_height
+        
+        # 現在の全文
+        self.text = None
+        # 行ごとの (全文での開始位置, 行の文字列, 描画済みサーフェス, 先頭からi文字の幅のリスト)
+        self._lines = []
+    
+    def set_text(self, text):
+        """表示する全文を設定し、折り返しと描画を行う（同じ全文なら何もしない）"""
+        if text == self.text:
+            return
+        self.text = text
+        
+        font = self.font_manager.get_font(self.font_size)
+        self._lines = []
+        for start, line in self.font_manager.line_breaker.wrap(text, font, self.max_width):
+            # 空行は描画しない
+            surface = self.font_manager.render_text(font, line, True, self.color) if line else None
+            # 1文字表示を進めるごとの切り出し幅（送り幅の累積和。表示中に計算しない）
+            advances = list(accumulate(self.font_manager.line_breaker.get_advances(font, line), initial=0))
+            if surface is not None:
+                # 全文表示では最後の文字の送り幅からはみ出す部分まで含める
+                advances[-1] = surface.get_width()
+            self._lines.append((start, line, surface, advances))
+    
+    def draw(self, screen, x, y, visible_chars):
+        """
+        先頭からvisible_chars文字までを描画
+        
+        Args:
+            screen: 描画先
+            x, y: 1行目の左上の座標
+            visible_chars: 表示する文字数（全文での位置）
+        """
+        line_height = self.line_height
+        if line_height is None:
+            line_height = self.font_manager.get_font(self.font_size).get_linesize()
+        
+        for index, (start, line, surface, advances) in enumerate(self._lines):
+            if visible_chars <= start:
+                break
+            count = min(len(line), visible_chars - start)
+            if surface is None or count <= 0:
+                continue
+            area = pygame.Rect(0, 0, advances[count], surface.get_height())
+            screen.blit(surface, (x, y + index * line_height), area)
@@ -3,6 +3,10 @@ from src.entities.entities import GameConfig
 from src.managers.font_manager import FontManager
 from src.managers.resource_manager import ResourceManager
 from src.managers.battle_manager import GameState
+from src.managers.ui_frame_cache import UIFrameCache
+from src.systems.game_clock import GameClock
+from src.systems.typewriter_text import TypewriterText
+from src.systems.ui_widget import UIWidget
 
 class UIRenderer:
     """UI描画の基底クラス"""
@@ -11,6 +15,8 @@ class UIRenderer:
         self.screen = screen
         self.font_manager = font_manager
         self.resource_manager = resource_manager
+        # サイズごとに組み立て済みのUI枠（描画ループで拡大縮小しない）
+        self.ui_frames = UIFrameCache(resource_manager)
 
 class FieldRenderer(UIRenderer):
     """フィールド画面の描画を担当"""
@@ -20,157 +26,241 @@ class FieldRenderer(UIRenderer):
         # マップを描画し、描画時のオフセットを取得
         offset_x, offset_y = tmx_map.draw(self.screen, player.x + player.width // 2, player.y + player.height // 2)
         return offset_x, offset_y
+    
+    def draw_field_composited(self, player, tmx_map):
+        """草むら・障害物まで合成済みのフィールドを描画し、オフセットを返す"""
+        return tmx_map.draw_composited(self.screen, player.x + player.width // 2, player.y + player.height // 2)
+    
+    def get_camera_offset(self, player, tmx_map):
+        """描画せずにフィールドのオフセットを取得"""
+        return tmx_map.get_draw_offset(player.x + player.width // 2, player.y + player.height // 2)
 
 class BattleRenderer(UIRenderer):
-    """バトル画面の描画を担当"""
+    """バトル画面の描画を担当（変化しない部分はバトルごとに1枚に合成し、変化する部分はウィジェットで描き直す）"""
+    
+    def __init__(self, screen, font_manager: FontManager, resource_manager: ResourceManager):
+        super().__init__(screen, font_manager, resource_manager)
+        # バトルメッセージ（全文を一度だけ描画し、表示した文字数だけ切り出す）
+        self.message_text = TypewriterText(font_manager, 14, GameConfig.BLACK)
+        
+        # 背景・情報枠・名前・HPラベル・ポケモン画像を合成した静的レイヤーと、作ったときの (野生ポケモン, 自分のポケモン)
+        self._static_layer = None
+        self._static_key = None
+        # HPバー・HP数値・メッセージ欄（表示する値が変わったときだけ描き直す）
+        self.widgets = {
+            'message': UIWidget(self._get_message_rect(), self.draw_battle_message),
+            'enemy_hp': UIWidget(self._get_enemy_info_rect(), self.draw_wild_pokemon_hp),
+            'player_hp': UIWidget(self._get_player_info_rect(), self.draw_player_pokemon_hp)
+        }
     
     def draw_battle_screen(self, player, wild_pokemon, battle_manager):
         """バトル画面全体を描画"""
-        # バトル背景
-        self.screen.fill(GameConfig.WHITE)
-        
-        # 共通で使う値
-        info_width = 60 * GameConfig.SCALE
-        
-        # 各要素を描画する
-        self.draw_wild_pokemon_info(wild_pokemon)
-        self.draw_player_pokemon_info(player, info_width)
-        
-        # メッセージ枠は常に表示
-        self.draw_battle_message(battle_manager, player)
+        static_layer = self._get_static_layer(player, wild_pokemon)
+        self.screen.blit(static_layer, (0, 0))
+        
+        # メッセージ枠は常に表示（技選択の枠はHPの欄の矩形と重なるが、枠自体はHPの欄にかからないため先に描く）
+        self.widgets['message'].draw(self.screen, static_layer, self._get_message_state(battle_manager, player),
+                                     battle_manager, player)
+        self.widgets['enemy_hp'].draw(self.screen, static_layer, self._get_hp_bar_state(wild_pokemon.pokemon),
+                                      wild_pokemon.pokemon)
+        player_pokemon = player.pokemon[0]
+        self.widgets['player_hp'].draw(self.screen, static_layer, self._get_player_hp_state(player_pokemon),
+                                       player_pokemon)
         
         # アニメーション状態なら炎アニメーションも描画
         if battle_manager.battle_state == GameState.BATTLE_ANIMATION:
             self.draw_fire_animation(battle_manager, wild_pokemon)
     
-    def draw_wild_pokemon_info(self, wild_pokemon):
-        """野生ポケモンの情報を描画"""
+    def collect_dirty_rects(self, tracker, player, wild_pokemon, battle_manager):
+        """バトル画面で前フレームから変化した領域を記録"""
+        # 技アニメーション中は炎が動くため全画面を更新
+        if battle_manager.battle_state == GameState.BATTLE_ANIMATION:
+            tracker.mark_full()
+        
+        # HPの欄（ウィジェットを描き直すときと同じ値で判定）
+        tracker.track('battle_enemy_info', self._get_enemy_info_rect(), self._get_hp_bar_state(wild_pokemon.pokemon))
+        tracker.track('battle_player_info', self._get_player_info_rect(), self._get_player_hp_state(player.pokemon[0]))
+        
+        # メッセージ・コマンド領域
+        tracker.track('battle_message', self._get_message_rect(), self._get_message_state(battle_manager, player))
+    
+    def _get_static_layer(self, player, wild_pokemon):
+        """静的レイヤーを取得（バトルの相手が変わったときだけ合成し直し、ウィジェットも描き直させる）"""
+        key = (wild_pokemon, player.pokemon[0])
+        if self._static_layer is None or key != self._static_key:
+            if self._static_layer is None:
+                self._static_layer = ResourceManager.convert_surface(pygame.Surface(self.screen.get_size()))
+            self._static_layer.fill(GameConfig.WHITE)
+            self.draw_wild_pokemon_info(self._static_layer, wild_pokemon)
+            self.draw_player_pokemon_info(self._static_layer, player, 60 * GameConfig.SCALE)
+            self._static_key = key
+            for widget in self.widgets.values():
+                widget.invalidate()
+        return self._static_layer
+    
+    def _get_hp_bar_state(self, pokemon):
+        """HPバーの見た目を決める値（表示中のバーの幅と色）"""
+        hp_ratio = max(0, pokemon.display_hp / pokemon.max_hp)
+        if hp_ratio <= 0:
+            return 0, None
+        return int((40 - 1.5) * GameConfig.SCALE * hp_ratio), self._get_hp_bar_color(hp_ratio)
+    
+    def _get_player_hp_state(self, pokemon):
+        """自分のポケモンのHPの欄の見た目を決める値（HPバーとHP数値）"""
+        return self._get_hp_bar_state(pokemon), int(pokemon.display_hp), pokemon.max_hp
+    
+    def _get_message_state(self, battle_manager, player):
+        """メッセージ欄の見た目を決める値（状態・表示中の文字列・選択中のコマンドと技・技のPP）"""
+        player_pokemon = player.pokemon[0]
+        sel_move_idx = battle_manager.selected_move
+        return (
+            battle_manager.battle_state,
+            battle_manager.get_displayed_message(),
+            battle_manager.selected_command,
+            sel_move_idx,
+            tuple(player_pokemon.move_pp[sel_move_idx]) if player_pokemon.move_pp else None
+        )
+    
+    def _get_enemy_info_rect(self):
+        """野生ポケモンの情報フレームの矩形"""
+        return pygame.Rect(3 * GameConfig.SCALE, 5 * GameConfig.SCALE, 80 * GameConfig.SCALE, 25 * GameConfig.SCALE)
+    
+    def _get_player_info_rect(self):
+        """プレイヤーのポケモンの情報フレームの矩形"""
+        return pygame.Rect(83 * GameConfig.SCALE, 65 * GameConfig.SCALE, 77 * GameConfig.SCALE, 25 * GameConfig.SCALE)
+    
+    def _get_message_rect(self):
+        """メッセージ・コマンド領域の矩形（技選択の枠が一番高い）"""
+        message_height = 70 * GameConfig.SCALE
+        return pygame.Rect(0, GameConfig.HEIGHT - message_height, GameConfig.WIDTH, message_height)
+    
+    def _get_hp_label(self):
+        """HPラベル（太字）"""
+        font_hp_label = self.font_manager.get_font(12, font_weight='W8')
+        return self.font_manager.render_text(font_hp_label, "HP:", True, GameConfig.BLACK)
+    
+    def draw_wild_pokemon_info(self, surface, wild_pokemon):
+        """野生ポケモンの情報のうちバトル中に変わらない部分を静的レイヤーに描画"""
         # 配置座標
         info_x = 5 * GameConfig.SCALE
         info_y = 5 * GameConfig.SCALE
 
         info_width = 80 * GameConfig.SCALE
         # 情報フレーム画像を表示
-        enemy_info_frame = self.resource_manager.load_image(GameConfig.ENEMY_FRAME_IMG, (info_width, 25 * GameConfig.SCALE))
-        self.screen.blit(enemy_info_frame, (info_x - 2 * GameConfig.SCALE, info_y))
+        enemy_info_frame = self.ui_frames.get_frame(GameConfig.ENEMY_FRAME_IMG, (info_width, 25 * GameConfig.SCALE))
+        surface.blit(enemy_info_frame, (info_x - 2 * GameConfig.SCALE, info_y))
         
         # ポケモン名を表示
         font = self.font_manager.get_font(15)
         info_pokemon_name_x = 11 * GameConfig.SCALE
         info_pokemon_name_y = 9 * GameConfig.SCALE
-        text = font.render(f"{wild_pokemon.pokemon.name} Lv.5", True, GameConfig.BLACK)
-        self.screen.blit(text, (info_pokemon_name_x, info_pokemon_name_y))
-        
-        # HPラベルを表示（太字）
-        font_hp_label = self.font_manager.get_font(12, font_weight='W8')
-        hp_label_text = "HP:"
-        hp_label = font_hp_label.render(hp_label_text, True, GameConfig.BLACK)
+        text = self.font_manager.render_text(font, f"{wild_pokemon.pokemon.name} Lv.5", True, GameConfig.BLACK)
+        surface.blit(text, (info_pokemon_name_x, info_pokemon_name_y))
         
-        # HPバーを描画
+        # HPラベルを表示
         hp_back_x = 10 * GameConfig.SCALE
         hp_back_y = info_pokemon_name_y + 18
-        self.screen.blit(hp_label, (hp_back_x - 5, hp_back_y + 3))
-        self.draw_hp_bar(hp_back_x + hp_label.get_width() + 3, hp_back_y, wild_pokemon.pokemon, False)
+        surface.blit(self._get_hp_label(), (hp_back_x - 5, hp_back_y + 3))
         
-        # ポケモン画像を描画
+        # ポケモン画像を描画（拡大はバトルごとに1回だけ）
         image = pygame.transform.scale(wild_pokemon.image, (50 * GameConfig.SCALE, 50 * GameConfig.SCALE))
-        self.screen.blit(image, (90 * GameConfig.SCALE, -10))
+        surface.blit(image, (90 * GameConfig.SCALE, -10))
+    
+    def draw_wild_pokemon_hp(self, surface, origin, pokemon):
+        """野生ポケモンのHPバーを描画（originはsurfaceの左上の画面座標）"""
+        hp_back_x = 10 * GameConfig.SCALE
+        hp_back_y = 9 * GameConfig.SCALE + 18
+        self.draw_hp_bar(surface, hp_back_x + self._get_hp_label().get_width() + 3 - origin[0],
+                         hp_back_y - origin[1], pokemon, False)
     
-    def draw_player_pokemon_info(self, player, info_width):
-        """プレイヤーのポケモン情報を描画"""
+    def draw_player_pokemon_info(self, surface, player, info_width):
+        """プレイヤーのポケモン情報のうちバトル中に変わらない部分を静的レイヤーに描画"""
         # 配置座標
         player_info_x = 85 * GameConfig.SCALE
         player_info_y = 65 * GameConfig.SCALE
         
         # 情報フレーム画像を表示
-        my_info_frame = self.resource_manager.load_image(GameConfig.MY_FRAME_IMG, (info_width + 5 * GameConfig.SCALE, 25 * GameConfig.SCALE))
-        self.screen.blit(my_info_frame, (player_info_x - 2 * GameConfig.SCALE, player_info_y))
+        my_info_frame = self.ui_frames.get_frame(GameConfig.MY_FRAME_IMG, (info_width + 5 * GameConfig.SCALE, 25 * GameConfig.SCALE))
+        surface.blit(my_info_frame, (player_info_x - 2 * GameConfig.SCALE, player_info_y))
         
         # ポケモン名を表示
         font = self.font_manager.get_font(15)
         player_hp_text_x = 90 * GameConfig.SCALE
-        text = font.render(f"{player.pokemon[0].name} Lv.5", True, GameConfig.BLACK)
-        self.screen.blit(text, (player_hp_text_x + 30, player_info_y + 3 * GameConfig.SCALE))
+        text = self.font_manager.render_text(font, f"{player.pokemon[0].name} Lv.5", True, GameConfig.BLACK)
+        surface.blit(text, (player_hp_text_x + 30, player_info_y + 3 * GameConfig.SCALE))
         
-        # HPラベルを表示（太字）
-        font_hp_label = self.font_manager.get_font(12, font_weight='W8')
-        hp_label_text = "HP:"
-        hp_label = font_hp_label.render(hp_label_text, True, GameConfig.BLACK)
-        
-        # HPバーを描画
-        hp_bar_x = player_hp_text_x  # 名前と同じX座標を使用
+        # HPラベルを表示（HPバーと同じX座標）
         hp_bar_y = player_info_y + 25
-        self.screen.blit(hp_label, (hp_bar_x - 5, hp_bar_y + 2))
-        self.draw_hp_bar(hp_bar_x + hp_label.get_width() + 3, hp_bar_y, player.pokemon[0], True)
+        surface.blit(self._get_hp_label(), (player_hp_text_x - 5, hp_bar_y + 2))
+        
+        # プレイヤーのポケモン画像を描画
+        hitokage_image = self.resource_manager.load_image(GameConfig.HITOKAGE_IMG, (40 * GameConfig.SCALE, 40 * GameConfig.SCALE))
+        surface.blit(hitokage_image, (20 * GameConfig.SCALE, 56 * GameConfig.SCALE))
+    
+    def draw_player_pokemon_hp(self, surface, origin, pokemon):
+        """プレイヤーのポケモンのHPバーとHP数値を描画（originはsurfaceの左上の画面座標）"""
+        origin_x, origin_y = origin
+        hp_bar_x = 90 * GameConfig.SCALE  # 名前と同じX座標を使用
+        hp_bar_y = 65 * GameConfig.SCALE + 25
+        hp_bar_x_adjusted = hp_bar_x + self._get_hp_label().get_width() + 3
+        self.draw_hp_bar(surface, hp_bar_x_adjusted - origin_x, hp_bar_y - origin_y, pokemon, True)
         
         # HP数値表示（太字）
         font_hp = self.font_manager.get_font(15)
-        hp_text_p = f"{int(player.pokemon[0].display_hp)}/{player.pokemon[0].max_hp}"
-        text_hp_p = font_hp.render(hp_text_p, True, GameConfig.BLACK)
+        hp_text_p = f"{int(pokemon.display_hp)}/{pokemon.max_hp}"
+        text_hp_p = self.font_manager.render_text(font_hp, hp_text_p, True, GameConfig.BLACK)
         # テキストの幅を取得してHP数値を中央に配置
         text_width = text_hp_p.get_width()
         hp_bar_width = 40 * GameConfig.SCALE
-        hp_bar_x_adjusted = hp_bar_x + hp_label.get_width() + 3
         centered_x = hp_bar_x_adjusted + (hp_bar_width - text_width) // 2
-        self.screen.blit(text_hp_p, (centered_x, hp_bar_y + 21))
-        
-        # プレイヤーのポケモン画像を描画
-        hitokage_image = self.resource_manager.load_image(GameConfig.HITOKAGE_IMG, (40 * GameConfig.SCALE, 40 * GameConfig.SCALE))
-        self.screen.blit(hitokage_image, (20 * GameConfig.SCALE, 56 * GameConfig.SCALE))
+        surface.blit(text_hp_p, (centered_x - origin_x, hp_bar_y + 21 - origin_y))
+    
+    def _get_hp_bar_color(self, hp_ratio):
+        """HP残量に応じたバーの色"""
+        if hp_ratio > 0.5:
+            return GameConfig.GREEN
+        elif hp_ratio > 0.2:
+            return GameConfig.YELLOW
+        return GameConfig.RED
     
-    def draw_hp_bar(self, x, y, pokemon, is_player=False):
+    def draw_hp_bar(self, surface, x, y, pokemon, is_player=False):
         """HPバーを描画する"""
         # 共通の設定
-        hp_image = self.resource_manager.load_image(GameConfig.HP_BAR_IMG)
         hp_unit_height = 4 * GameConfig.SCALE
         hp_unit_width = 40 * GameConfig.SCALE
-        hp_image_scaled = pygame.transform.scale(hp_image, (hp_unit_width, hp_unit_height))
-        
-        # HPの計算
-        hp_inner_width = (40 - 1.5) * GameConfig.SCALE
-        hp_ratio = max(0, pokemon.display_hp / pokemon.max_hp)
+        hp_image_scaled = self.ui_frames.get_frame(GameConfig.HP_BAR_IMG, (hp_unit_width, hp_unit_height))
         
         # HPバーを描画
-        if hp_ratio > 0:
-            hp_bar_width = int(hp_inner_width * hp_ratio)
-            
-            # HP残量に応じて色を変える
-            if hp_ratio > 0.5:
-                bar_color = GameConfig.GREEN
-            elif hp_ratio > 0.2:
-                bar_color = GameConfig.YELLOW
-            else:
-                bar_color = GameConfig.RED
-
+        hp_bar_width, bar_color = self._get_hp_bar_state(pokemon)
+        if bar_color is not None:
             bar_y_offset = 2 if is_player else 3
-            pygame.draw.rect(self.screen, bar_color, (x + GameConfig.SCALE * 2, y + bar_y_offset * GameConfig.SCALE, hp_bar_width, hp_unit_height))
+            pygame.draw.rect(surface, bar_color, (x + GameConfig.SCALE * 2, y + bar_y_offset * GameConfig.SCALE, hp_bar_width, hp_unit_height))
         
-        self.screen.blit(hp_image_scaled, (x + GameConfig.SCALE, y + (2 if is_player else 3) * GameConfig.SCALE))
-        
-        return hp_ratio
+        surface.blit(hp_image_scaled, (x + GameConfig.SCALE, y + (2 if is_player else 3) * GameConfig.SCALE))
     
-    def draw_battle_message(self, battle_manager, player):
-        """バトルメッセージを描画"""
+    def draw_battle_message(self, surface, origin, battle_manager, player):
+        """バトルメッセージを描画（originはsurfaceの左上の画面座標）"""
+        origin_x, origin_y = origin
         if battle_manager.battle_state == GameState.BATTLE_MESSAGE or battle_manager.battle_state == GameState.BATTLE_ANIMATION:
-            message_image = self.resource_manager.load_image(GameConfig.MESSAGE_ALL_IMG, (GameConfig.WIDTH, 49 * GameConfig.SCALE))
-            self.screen.blit(message_image, (0, GameConfig.HEIGHT - 49 * GameConfig.SCALE))
-            font_message = self.font_manager.get_font(14)
-            
-            # 現在表示すべき文字列を取得
-            displayed_text = battle_manager.get_displayed_message()
+            message_image = self.ui_frames.get_frame(GameConfig.MESSAGE_ALL_IMG, (GameConfig.WIDTH, 49 * GameConfig.SCALE))
+            surface.blit(message_image, (-origin_x, GameConfig.HEIGHT - 49 * GameConfig.SCALE - origin_y))
             
-            text = font_message.render(displayed_text, True, GameConfig.BLACK)
-            self.screen.blit(text, (10 * GameConfig.SCALE, GameConfig.HEIGHT - 49 * GameConfig.SCALE + 10 * GameConfig.SCALE))
+            # 現在表示すべき文字数だけ描画
+            self.message_text.set_text(battle_manager.battle_message)
+            self.message_text.draw(surface, 10 * GameConfig.SCALE - origin_x,
+                                   GameConfig.HEIGHT - 49 * GameConfig.SCALE + 10 * GameConfig.SCALE - origin_y,
+                                   battle_manager.displayed_chars)
         elif battle_manager.battle_state == GameState.BATTLE_COMMAND:
-            self.draw_command_selection(battle_manager)
+            self.draw_command_selection(surface, origin, battle_manager)
         elif battle_manager.battle_state == GameState.BATTLE_SELECT:
-            self.draw_move_selection(battle_manager, player)
+            self.draw_move_selection(surface, origin, battle_manager, player)
     
-    def draw_command_selection(self, battle_manager):
+    def draw_command_selection(self, surface, origin, battle_manager):
         """コマンド選択画面を描画"""
+        origin_x, origin_y = origin
         # message_halfを使ってコマンド選択画面を表示
-        message_image = self.resource_manager.load_image(GameConfig.MESSAGE_HALF_IMG, (GameConfig.WIDTH, 49 * GameConfig.SCALE))
-        self.screen.blit(message_image, (0, GameConfig.HEIGHT - 49 * GameConfig.SCALE))
+        message_image = self.ui_frames.get_frame(GameConfig.MESSAGE_HALF_IMG, (GameConfig.WIDTH, 49 * GameConfig.SCALE))
+        surface.blit(message_image, (-origin_x, GameConfig.HEIGHT - 49 * GameConfig.SCALE - origin_y))
         
         commands = ["たたかう", "どうぐ", "ポケモン", "にげる"]
         font_commands = self.font_manager.get_font(14)
@@ -190,45 +280,48 @@ class BattleRenderer(UIRenderer):
             # 下段のコマンド（ポケモン、にげる）
             else:
                 y = GameConfig.HEIGHT - 49 * GameConfig.SCALE + 30 * GameConfig.SCALE
+            x -= origin_x
+            y -= origin_y
                 
             # 現在選択されているコマンドには▶︎を表示
             if i == battle_manager.selected_command:
-                mark = font_commands.render("▶︎", True, GameConfig.BLACK)
-                self.screen.blit(mark, (x - 7 * GameConfig.SCALE, y))
+                mark = self.font_manager.render_text(font_commands, "▶︎", True, GameConfig.BLACK)
+                surface.blit(mark, (x - 7 * GameConfig.SCALE, y))
                 
-            text = font_commands.render(command, True, GameConfig.BLACK)
-            self.screen.blit(text, (x, y))
+            text = self.font_manager.render_text(font_commands, command, True, GameConfig.BLACK)
+            surface.blit(text, (x, y))
     
-    def draw_move_selection(self, battle_manager, player):
+    def draw_move_selection(self, surface, origin, battle_manager, player):
         """技選択画面を描画"""
+        origin_x, origin_y = origin
         # 共通サイズの設定
         message_width = GameConfig.WIDTH // 2
         message_height = 70 * GameConfig.SCALE
         
         # message_half_middleを使用して左下に配置
-        left_message_image = self.resource_manager.load_image(GameConfig.MESSAGE_HALF_MIDDLE_IMG, (message_width, message_height))
-        self.screen.blit(left_message_image, (0, GameConfig.HEIGHT - message_height))
+        left_message_image = self.ui_frames.get_frame(GameConfig.MESSAGE_HALF_MIDDLE_IMG, (message_width, message_height))
+        surface.blit(left_message_image, (-origin_x, GameConfig.HEIGHT - message_height - origin_y))
         
         # message_half_separateを使用して右下に配置
-        right_message_image = self.resource_manager.load_image(GameConfig.MESSAGE_HALF_SEPARATE_IMG, (88 * GameConfig.SCALE, 48 * GameConfig.SCALE))
-        self.screen.blit(right_message_image, (72 * GameConfig.SCALE, GameConfig.HEIGHT - 48 * GameConfig.SCALE))
+        right_message_image = self.ui_frames.get_frame(GameConfig.MESSAGE_HALF_SEPARATE_IMG, (88 * GameConfig.SCALE, 48 * GameConfig.SCALE))
+        surface.blit(right_message_image, (72 * GameConfig.SCALE - origin_x, GameConfig.HEIGHT - 48 * GameConfig.SCALE - origin_y))
         
         font_moves = self.font_manager.get_font(14)
         
         for i, move in enumerate(player.pokemon[0].moves):
             # マークとテキストの位置を計算（左側に表示）
-            mark_x = 10 * GameConfig.SCALE
-            text_x = 17 * GameConfig.SCALE
-            text_y = GameConfig.HEIGHT - message_height + 10 * GameConfig.SCALE + i * 10 * GameConfig.SCALE
+            mark_x = 10 * GameConfig.SCALE - origin_x
+            text_x = 17 * GameConfig.SCALE - origin_x
+            text_y = GameConfig.HEIGHT - message_height + 10 * GameConfig.SCALE + i * 10 * GameConfig.SCALE - origin_y
             
             # 選択中の技には▶︎マークを表示
             if i == battle_manager.selected_move:
-                mark = font_moves.render("▶︎", True, GameConfig.BLACK)
-                self.screen.blit(mark, (mark_x, text_y))
+                mark = self.font_manager.render_text(font_moves, "▶︎", True, GameConfig.BLACK)
+                surface.blit(mark, (mark_x, text_y))
                 
             # 技名を表示
-            text = font_moves.render(move, True, GameConfig.BLACK)
-            self.screen.blit(text, (text_x, text_y))
+            text = self.font_manager.render_text(font_moves, move, True, GameConfig.BLACK)
+            surface.blit(text, (text_x, text_y))
         
         # 右側メッセージボックスに選択した技の詳細情報を表示
         if len(player.pokemon[0].moves) > 0:
@@ -239,23 +332,23 @@ class BattleRenderer(UIRenderer):
             max_pp = player.pokemon[0].move_pp[sel_move_idx][1]
             
             # わざタイプを表示 - 中央に配置
-            type_text = font_moves.render(f"わざタイプ / {move_type}", True, GameConfig.BLACK)
+            type_text = self.font_manager.render_text(font_moves, f"わざタイプ / {move_type}", True, GameConfig.BLACK)
             type_text_width = type_text.get_width()
             # 右側メッセージボックスの中心を計算（右側の表示エリアの中央に）
             right_box_center_x = 72 * GameConfig.SCALE + (88 * GameConfig.SCALE) // 2
             # テキストの位置を中央揃えに
             type_text_x = right_box_center_x - type_text_width // 2
-            self.screen.blit(type_text, (type_text_x, GameConfig.HEIGHT - 22 * GameConfig.SCALE))
+            surface.blit(type_text, (type_text_x - origin_x, GameConfig.HEIGHT - 22 * GameConfig.SCALE - origin_y))
             
             # PPを表示 - 中央に配置
-            pp_text = font_moves.render(f"PP {current_pp}/{max_pp}", True, GameConfig.BLACK)
+            pp_text = self.font_manager.render_text(font_moves, f"PP {current_pp}/{max_pp}", True, GameConfig.BLACK)
             pp_text_width = pp_text.get_width()
             pp_text_x = right_box_center_x - pp_text_width // 2
-            self.screen.blit(pp_text, (pp_text_x, GameConfig.HEIGHT - 32 * GameConfig.SCALE))
+            surface.blit(pp_text, (pp_text_x - origin_x, GameConfig.HEIGHT - 32 * GameConfig.SCALE - origin_y))
     
     def draw_fire_animation(self, battle_manager, wild_pokemon):
         """炎のアニメーション描画"""
-        current_time = pygame.time.get_ticks()
+        current_time = GameClock.get_ticks()
         
         # アニメーション開始からの経過時間
         elapsed_time = current_time - battle_manager.animation_start_time
@@ -314,4 +407,79 @@ class BattleRenderer(UIRenderer):
         fire_img = self.resource_manager.load_image(fire_img_path, (fire_size, fire_size))
         
         # 炎画像を描画
-        self.screen.blit(fire_img, (current_pos[0] - fire_size//2, current_pos[1] - fire_size//2))
\ No newline at end of file
+        self.screen.blit(fire_img, (current_pos[0] - fire_size//2, current_pos[1] - fire_size//2))
+
+class ProfilerRenderer(UIRenderer):
+    """フレームプロファイラのオーバーレイ（区間ごとの所要時間と積み上げグラフ）の描画を担当"""
+    
+    # 区間ごとのグラフの色（計測順に割り当て）
+    SECTION_COLORS = [
+        (0, 200, 255), (255, 160, 0), (120, 220, 80), (255, 90, 160),
+        (180, 140, 255), (255, 230, 80), (80, 200, 180), (255, 120, 80)
+    ]
+    GRAPH_HEIGHT = 60
+    PADDING = 4
+    
+    def __init__(self, screen, font_manager: FontManager, resource_manager: ResourceManager):
+        super().__init__(screen, font_manager, resource_manager)
+        # 半透明の背景（サイズが変わったときだけ作り直す）
+        self._background = None
+    
+    def draw_profiler(self, profiler):
+        """区間ごとの平均・最大の所要時間と、直近フレームの積み上げグラフを画面右上に描画"""
+        stats = profiler.get_stats()
+        if not stats:
+            return
+        
+        font = self.font_manager.get_font(10)
+        line_height = font.get_linesize()
+        sections = profiler.get_sections()
+        budget = 1000 / GameConfig.FPS
+        
+        lines = [(f"frame  avg {stats['frame']['avg']:5.2f}  max {stats['frame']['max']:5.2f} ms", GameConfig.WHITE)]
+        for index, name in enumerate(sections):
+            color = self.SECTION_COLORS[index % len(self.SECTION_COLORS)]
+            lines.append((f"{name}  {stats[name]['avg']:5.2f} / {stats[name]['max']:5.2f}", color))
+        for name, value in profiler.get_counters().items():
+            lines.append((f"{name}  {value}", GameConfig.LIGHT_GRAY))
+        
+        # 数値が毎フレーム変わるためキャッシュを使わない
+        text_surfaces = [font.render(text, True, color) for text, color in lines]
+        width = max([profiler.history] + [surface.get_width() for surface in text_surfaces]) + self.PADDING * 2
+        height = line_height * len(lines) + self.GRAPH_HEIGHT + self.PADDING * 3
+        left = GameConfig.WIDTH - width
+        
+        self._draw_background(left, 0, width, height)
+        y = self.PADDING
+        for surface in text_surfaces:
+            self.screen.blit(surface, (left + self.PADDING, y))
+            y += line_height
+        
+        self._draw_graph(profiler, sections, left + self.PADDING, y + self.PADDING + self.GRAPH_HEIGHT, budget)
+    
+    def _draw_background(self, left, top, width, height):
+        """半透明の背景を描画"""
+        if self._background is None or self._background.get_size() != (width, height):
+            self._background = pygame.Surface((width, height), pygame.SRCALPHA)
+            self._background.fill((0, 0, 0, 170))
+        self.screen.blit(self._background, (left, top))
+    
+    def _draw_graph(self, profiler, sections, left, bottom, budget):
+        """1フレーム1pxの積み上げグラフを描画（高さの半分がフレーム予算）"""
+        scale = self.GRAPH_HEIGHT / (budget * 2)
+        histories = [profiler.get_history(name) for name in sections]
+        
+        for frame_index in range(len(profiler.get_history(profiler.FRAME))):
+            x = left + frame_index
+            y = float(bottom)
+            for section_index, history in enumerate(histories):
+                # 1px未満の区間も積み上げ、整数の境界をまたいだ分だけ描画
+                top = max(bottom - self.GRAPH_HEIGHT, y - history[frame_index] * scale)
+                if int(top) < int(y):
+                    color = self.SECTION_COLORS[section_index % len(self.SECTION_COLORS)]
+                    pygame.draw.line(self.screen, color, (x, int(y) - 1), (x, int(top)))
+                y = top
+        
+        # フレーム予算（1000 / FPS ms）の線
+        budget_y = bottom - int(budget * scale)
+        pygame.draw.line(self.screen, GameConfig.RED, (left, budget_y), (left + profiler.history - 1, budget_y))
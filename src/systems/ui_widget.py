@@ -0,0 +1,57 @@
+"""
+UIウィジェットモジュール
+単一責任の原則：画面上の1つの矩形の描画結果を保持し、結び付けた値が変わったときだけ描き直すことのみを担当
+"""
+
+import pygame
+
+from src.managers.resource_manager import ResourceManager
+
+
+class UIWidget:
+    """
+    矩形ごとに描画済みのサーフェスを持つ保持型のウィジェット
+    
+    描き直すときは背景（静的レイヤー）の同じ矩形を写してから描画関数を呼ぶため、
+    描画関数は背景の上に重ねる部分だけを描けばよい
+    """
+    
+    def __init__(self, rect, draw_func):
+        """
+        Args:
+            rect: 画面上の矩形
+            draw_func: draw_func(surface, origin, *args) の形の描画関数。
+                       originはウィジェットの左上の画面座標で、画面座標からoriginを引いた位置に描く
+        """
+        self.rect = pygame.Rect(rect)
+        self.draw_func = draw_func
+        
+        self._surface = None
+        self._value = None
+        self._valid = False
+        # 描き直した回数（キャッシュの効き具合の確認用）
+        self.redraws = 0
+    
+    def invalidate(self):
+        """次の描画で必ず描き直す（背景が変わったときに呼ぶ）"""
+        self._valid = False
+    
+    def draw(self, screen, background, value, *args):
+        """
+        ウィジェットを描画（valueが前回と同じなら描画済みのサーフェスを転送するだけ）
+        
+        Args:
+            screen: 描画先
+            background: 描き直すときに下地として写す画面サイズのサーフェス
+            value: 見た目を決める値（比較できる値。タプルなど）
+            *args: 描き直すときに描画関数に渡す引数
+        """
+        if not self._valid or value != self._value:
+            if self._surface is None:
+                self._surface = ResourceManager.convert_surface(pygame.Surface(self.rect.size))
+            self._surface.blit(background, (0, 0), self.rect)
+            self.draw_func(self._surface, self.rect.topleft, *args)
+            self._value = value
+            self._valid = True
+            self.redraws += 1
+        screen.blit(self._surface, self.rect)
@@ -0,0 +1,73 @@
+"""
+ワールド定義モジュール
+単一責任の原則：マップの配置とマップ間のつながり（ポータルグラフ）の保持と検索のみを担当
+"""
+
+import pygame
+from src.entities.entities import GameConfig
+
+
+class WorldDefinition:
+    """地続きマップの配置と、隣接・遷移トリガーによるマップ間のつながりを保持するクラス"""
+    
+    def __init__(self, layout=None, map_sizes=None, triggers=None):
+        """
+        Args:
+            layout: マップ名→ワールド上の左上タイル座標の辞書
+            map_sizes: マップ名→(横タイル数, 縦タイル数)の辞書
+            triggers: マップ名→{タイル座標: 遷移先}の辞書
+        """
+        layout = GameConfig.WORLD_LAYOUT if layout is None else layout
+        map_sizes = GameConfig.MAP_SIZES if map_sizes is None else map_sizes
+        triggers = GameConfig.MAP_TRIGGERS if triggers is None else triggers
+        
+        # マップ名 → ワールド上のタイル矩形
+        self.regions = {
+            name: pygame.Rect(origin, map_sizes[name]) for name, origin in layout.items()
+        }
+        self.bounds = pygame.Rect(0, 0, 0, 0)
+        if self.regions:
+            rects = list(self.regions.values())
+            self.bounds = rects[0].unionall(rects[1:])
+        
+        # マップ名 → 遷移トリガーの遷移先（ポータル）
+        self.portals = {
+            name: {target for target in map_triggers.values() if target in GameConfig.MAP_FILES}
+            for name, map_triggers in triggers.items()
+        }
+        # マップ名 → 配置が接しているマップ
+        self.neighbors = {name: self._find_adjacent(name) for name in self.regions}
+    
+    def _find_adjacent(self, name):
+        """配置が辺で接している（または重なる）マップを探す"""
+        rect = self.regions[name]
+        # 1タイル広げて辺の接触も検出し、角だけの接触は除外する
+        horizontal = rect.inflate(2, 0)
+        vertical = rect.inflate(0, 2)
+        return {
+            other for other, other_rect in self.regions.items()
+            if other != name and (horizontal.colliderect(other_rect) or vertical.colliderect(other_rect))
+        }
+    
+    def contains(self, map_name):
+        """マップがワールドに配置されているかどうか"""
+        return map_name in self.regions
+    
+    def get_origin(self, map_name):
+        """マップのワールド上の左上タイル座標を取得"""
+        return self.regions[map_name].topleft
+    
+    def find_region(self, tile_x, tile_y):
+        """指定タイル座標を含むマップ名を取得（どのマップにも含まれなければNone）"""
+        for name, rect in self.regions.items():
+            if rect.collidepoint(tile_x, tile_y):
+                return name
+        return None
+    
+    def get_regions_in_rect(self, tile_rect):
+        """タイル矩形と重なるマップ名のリストを取得"""
+        return [name for name, rect in self.regions.items() if rect.colliderect(tile_rect)]
+    
+    def get_connected(self, map_name):
+        """隣接マップとポータルの遷移先をまとめて取得（先読み対象）"""
+        return self.neighbors.get(map_name, set()) | self.portals.get(map_name, set())
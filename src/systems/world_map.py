@@ -0,0 +1,224 @@
+"""
+ワールドマップモジュール
+単一責任の原則：ワールド定義に従い、地続きのマップをリージョン単位で読み込み・描画・検索することのみを担当
+"""
+
+import pygame
+from src.entities.entities import GameConfig
+from src.managers.map_pool import MapPool
+from src.managers.map_prefetcher import MapPrefetcher
+from src.systems.map_system import SingleMap
+from src.systems.world_definition import WorldDefinition
+
+
+class WorldRegion(SingleMap):
+    """ワールドに配置される1枚分のマップ（objectレイヤーは背景として描画）"""
+    
+    # TMXレイヤー名と描画先レイヤーの対応（未定義のレイヤーは背景に描画）
+    LAYER_TARGETS = {
+        'obstacles': 'obstacles',
+        'grassy_bottom': 'grassy_bottom',
+        'grassy_top': 'grassy_top'
+    }
+
+
+class WorldMap(SingleMap):
+    """
+    ワールド定義に配置されたマップを1枚の地続きマップとして扱うクラス
+    
+    全体を1枚のサーフェスに結合せず、プレイヤーがいるリージョンとつながったリージョンだけを保持する
+    """
+    
+    def __init__(self, world=None, start_region=GameConfig.CURRENT_MAP):
+        self.world = world or WorldDefinition()
+        
+        # ワールド全体のサイズ（タイル数）と描画用の設定
+        self._init_geometry(self.world.bounds.right, self.world.bounds.bottom)
+        
+        # リージョンは上限付きのプールで保持し、つながったリージョンはワーカースレッドで先読み
+        self.region_pool = MapPool(GameConfig.WORLD_MAX_RESIDENT_REGIONS,
+                                   GameConfig.WORLD_REGION_MEMORY_BUDGET, map_factory=WorldRegion)
+        self.region_prefetcher = MapPrefetcher(self.region_pool, map_factory=WorldRegion)
+        
+        # リージョン間で共通のタイルアニメーション時間
+        self.tile_animation_time = 0
+        # 未読み込みのリージョンをその場で読み込むか（入力の記録・再生中は結果がワーカーの読み込み時間で変わらないようTrue）
+        self.synchronous_loading = False
+        
+        # 開始リージョンだけは起動時に同期で読み込む
+        self.current_region = start_region
+        self.region_pool.get(start_region)
+        self._stream_regions()
+    
+    def get_memory_size(self):
+        """保持しているリージョンの合計メモリ使用量（バイト）"""
+        return self.region_pool.memory_usage
+    
+    def update_regions(self, x, y):
+        """プレイヤーの座標に応じて保持するリージョンを入れ替える（メインスレッドから呼ぶ）"""
+        self.region_prefetcher.collect_finished()
+        
+        region_name = self._find_region_at(x, y)
+        if region_name is None or region_name == self.current_region:
+            return
+        
+        self.current_region = region_name
+        self._stream_regions()
+    
+    def _stream_regions(self):
+        """現在のリージョンとつながったリージョンを先読みし、それ以外を破棄"""
+        connected = {name for name in self.world.get_connected(self.current_region) if self.world.contains(name)}
+        # つながったリージョンが上限より多くても、先読みした分をLRUで破棄しない
+        self.region_pool.set_pinned(connected | {self.current_region})
+        
+        for region_name in self.region_pool.get_names():
+            if region_name != self.current_region and region_name not in connected:
+                self.region_pool.remove(region_name)
+        
+        for region_name in connected:
+            self.region_prefetcher.request(region_name)
+    
+    def _get_region(self, region_name):
+        """
+        読み込み済みのリージョンを取得（フレーム中に読み込みを待たない）
+        
+        Returns:
+            WorldRegion: 読み込みが終わっていなければNone（先読みを依頼し、描画と当たり判定では無いものとして扱う）。
+                         synchronous_loadingがTrueなら読み込みを待って必ず返す
+        """
+        region = self.region_pool.peek(region_name)
+        if region is not None:
+            return region
+        
+        if self.synchronous_loading:
+            self.region_prefetcher.wait_for(region_name)
+            return self.region_pool.get(region_name)
+        self.region_prefetcher.request(region_name)
+        return None
+    
+    def _find_region_at(self, x, y):
+        """ピクセル座標を含むリージョン名を取得"""
+        return self.world.find_region(int(x / self.scaled_tile_width), int(y / self.scaled_tile_height))
+    
+    def _get_region_offset(self, region_name):
+        """リージョンの左上のワールド上のピクセル座標を取得"""
+        origin_x, origin_y = self.world.get_origin(region_name)
+        return origin_x * self.scaled_tile_width, origin_y * self.scaled_tile_height
+    
+    def _locate(self, x, y):
+        """ピクセル座標をリージョンとリージョン内の座標に変換（どのリージョンにもないか未読み込みならリージョンはNone）"""
+        region_name = self._find_region_at(x, y)
+        if region_name is None:
+            return None, x, y
+        
+        region = self._get_region(region_name)
+        if region is None:
+            return None, x, y
+        region_x, region_y = self._get_region_offset(region_name)
+        return region, x - region_x, y - region_y
+    
+    def _get_visible_regions(self, offset_x, offset_y):
+        """画面に映るリージョン名のリストを取得"""
+        return self.world.get_regions_in_rect(self._get_visible_tile_rect(offset_x, offset_y))
+    
+    def _draw_regions(self, screen, offset_x, offset_y, draw_stack):
+        """画面に映るリージョンごとに指定のスタックを描画"""
+        # リージョン間で1pxの継ぎ目が出ないよう、先に整数化してからリージョン位置を加える
+        offset_x = int(offset_x)
+        offset_y = int(offset_y)
+        
+        for region_name in self._get_visible_regions(offset_x, offset_y):
+            region = self._get_region(region_name)
+            if region is None:
+                continue
+            region_x, region_y = self._get_region_offset(region_name)
+            region.set_tile_animation_time(self.tile_animation_time)
+            draw_stack(region, screen, offset_x + region_x, offset_y + region_y)
+    
+    def get_render_state(self, offset_x, offset_y):
+        """画面に映るリージョンのうち読み込み済みのもの（先読みが終わって映るようになったら全画面を描き直す）"""
+        return tuple(name for name in self._get_visible_regions(int(offset_x), int(offset_y))
+                     if self.region_pool.contains(name))
+    
+    def draw_ground(self, screen, offset_x, offset_y):
+        self._draw_regions(screen, offset_x, offset_y, SingleMap.draw_ground)
+    
+    def draw_overlay(self, screen, offset_x, offset_y):
+        self._draw_regions(screen, offset_x, offset_y, SingleMap.draw_overlay)
+    
+    def draw_ground_and_overlay(self, screen, offset_x, offset_y):
+        self._draw_regions(screen, offset_x, offset_y, SingleMap.draw_ground_and_overlay)
+    
+    def update_tile_animations(self, dt):
+        """タイルアニメーションの時間を進める（描画時に各リージョンへ反映）"""
+        self.tile_animation_time += dt
+    
+    def get_animated_tile_rects(self, offset_x, offset_y):
+        """次の描画で描き直される画面内のアニメーションタイルの矩形を取得"""
+        offset_x = int(offset_x)
+        offset_y = int(offset_y)
+        
+        rects = []
+        for region_name in self._get_visible_regions(offset_x, offset_y):
+            region = self._get_region(region_name)
+            if region is None:
+                continue
+            region_x, region_y = self._get_region_offset(region_name)
+            region.set_tile_animation_time(self.tile_animation_time)
+            rects.extend(region.get_animated_tile_rects(offset_x + region_x, offset_y + region_y))
+        return rects
+    
+    def is_walkable(self, x, y):
+        """指定した座標が歩行可能かどうかを判定"""
+        region, region_x, region_y = self._locate(x, y)
+        return region is not None and region.is_walkable(region_x, region_y)
+    
+    def is_on_grassy(self, x, y):
+        """指定した座標が草むらの上かどうかを判定"""
+        region, region_x, region_y = self._locate(x, y)
+        return region is not None and region.is_on_grassy(region_x, region_y)
+    
+    def query_points(self, xs, ys):
+        """複数座標のタイル属性フラグをまとめて取得（リージョン外・未読み込みは0）"""
+        result = bytearray(len(xs))
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            region, region_x, region_y = self._locate(x, y)
+            if region is not None:
+                result[i] = region.tile_grid.get_flags(region_x, region_y)
+        return result
+    
+    def get_tile_flags(self, tile_x, tile_y):
+        """ワールド上のタイル座標のタイル属性フラグを取得（リージョン外・未読み込みは0）"""
+        region_name = self.world.find_region(tile_x, tile_y)
+        if region_name is None:
+            return 0
+        
+        region = self._get_region(region_name)
+        if region is None:
+            return 0
+        origin_x, origin_y = self.world.get_origin(region_name)
+        return region.tile_grid.get_tile_flags(tile_x - origin_x, tile_y - origin_y)
+    
+    def check_door_interaction(self, x, y):
+        """指定した座標で遷移トリガーとの相互作用をチェック"""
+        region, region_x, region_y = self._locate(x, y)
+        return region.check_door_interaction(region_x, region_y) if region is not None else None
+    
+    def get_nearby_triggers(self, x, y, radius):
+        """指定した座標から半径radiusタイル以内にある遷移トリガーの遷移先を取得（リージョンをまたいで検索）"""
+        tile_x = int(x / self.scaled_tile_width)
+        tile_y = int(y / self.scaled_tile_height)
+        tile_rect = pygame.Rect(tile_x - radius, tile_y - radius, radius * 2 + 1, radius * 2 + 1)
+        
+        targets = set()
+        for region_name in self.world.get_regions_in_rect(tile_rect):
+            region = self._get_region(region_name)
+            if region is None:
+                continue
+            region_x, region_y = self._get_region_offset(region_name)
+            targets |= region.get_nearby_triggers(x - region_x, y - region_y, radius)
+        return targets
+    
+    def shutdown(self):
+        """先読み用のワーカーを停止"""
+        self.region_prefetcher.shutdown()